@@ -203,9 +203,9 @@ class FactGraphIntegrator:
         import pickle
 
         with open(concept_path, 'wb') as f:
-            pickle.dump(concept_dict, f)
+            pickle.dump(concept_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"Saved concept graph to {concept_path}")
 
         with open(sub_concept_path, 'wb') as f:
-            pickle.dump(sub_concept_dict, f)
+            pickle.dump(sub_concept_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"Saved sub-concept graph to {sub_concept_path}")
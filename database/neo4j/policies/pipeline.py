@@ -801,6 +801,9 @@ class KnowledgeGraphPipeline:
             embedding_config.get('device', 'mps')
         )
         print(f"Loaded embedding model: {embedding_config['name']}")
+        embedding_cache_dir = (
+            self.base_dir / embedding_config['cache_dir'] if embedding_config.get('cache_dir') else None
+        )
 
         # ========================================================================
         # Step 3: Create concept nodes with embeddings
@@ -813,7 +816,9 @@ class KnowledgeGraphPipeline:
         concept_embeddings = generate_embeddings_batch(
             unique_concepts_list,
             embedding_model,
-            batch_size=100
+            batch_size=100,
+            cache_dir=embedding_cache_dir,
+            devices=embedding_config.get('devices')
         )
 
         concept_nodes = {}  # Map concept name -> node info
@@ -886,7 +891,9 @@ class KnowledgeGraphPipeline:
         question_embeddings = generate_embeddings_batch(
             all_questions,
             embedding_model,
-            batch_size=100
+            batch_size=100,
+            cache_dir=embedding_cache_dir,
+            devices=embedding_config.get('devices')
         )
 
         # Create QA nodes
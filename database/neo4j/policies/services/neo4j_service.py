@@ -3,17 +3,373 @@ Neo4j Service
 Handles schema creation, bulk import, indexes, and verification for knowledge graph.
 """
 
+import csv
 import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
 import ijson
+import orjson
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
-from decimal import Decimal
-from neo4j import GraphDatabase
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from neo4j import GraphDatabase, WRITE_ACCESS
+from neo4j.exceptions import ClientError
+from neo4j.vector import Vector, VectorDType
+from ijson.common import ObjectBuilder
+
+
+
+from ..utils.embedding_utils import quantize_embeddings
+from ..utils.neo4j_utils import (
+    test_connection,
+    get_database_stats,
+    print_database_stats,
+    get_node_count,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prefer the C yajl2 backend for streaming; keep ijson's default if it is not built
+try:
+    ijson = ijson.get_backend('yajl2_c')
+except ImportError:
+    pass
+
+# Graph files below this size are parsed in one orjson call instead of streamed. The
+# parsed objects take several times the file size, and the node, edge and cold-load
+# passes each parse the file again, so only small files are worth loading whole
+IN_MEMORY_PARSE_LIMIT = 32_000_000
+
+# Adaptive batch sizing: grow while batches ack quickly, shrink when they are slow
+MIN_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 20_000
+FAST_BATCH_SECONDS = 1.0
+SLOW_BATCH_SECONDS = 3.0
+
+# Items are staged up to this many batches (capped at MAX_STAGED_ITEMS) and
+# sorted before batching, so consecutive MERGEs probe adjacent index pages
+STAGING_BATCHES = 10
+MAX_STAGED_ITEMS = 20_000
+
+# Node id -> elementId entries cached for edge imports; the oldest are evicted beyond this
+ID_MAP_MAX_SIZE = 1_000_000
+
+# Minimum seconds between import progress log lines
+PROGRESS_LOG_INTERVAL = 5.0
+
+# Seconds to wait for the vector index to finish populating after import
+INDEX_POPULATION_TIMEOUT = 600
+
+# Separates array elements in neo4j-admin CSV cells (passed as U+001F)
+CSV_ARRAY_DELIMITER = '\x1f'
+
+# Metadata keys the Bolt import stores with datetime(); typed the same in the CSVs
+DATETIME_PROPERTIES = ('created_at', 'updated_at')
+
+# Indexes created by create_indexes(); dropped before bulk import and rebuilt after.
+# The Memory.id uniqueness constraint is kept because every MERGE probes it.
+SECONDARY_INDEX_NAMES = (
+    "memory_type_idx",
+    "memory_status_idx",
+    "memory_created_at_idx",
+    "memory_updated_at_idx",
+    "memory_fulltext",
+    "memory_vector_index",
+)
+
+
+_NODE_UPSERT_CYPHER = """
+UNWIND $batch AS row
+MERGE (n:Memory {id: row.id})
+SET n.key = row.id,
+    n.memory = row.memory,
+    n.sources = row.sources,
+    n.created_at = datetime(row.metadata.created_at),
+    n.updated_at = datetime(row.metadata.updated_at),
+    n += row.metadata
+RETURN count(n) AS imported
+"""
+
+# Node batches already run on max_workers client threads, so APOC commits each
+# batch's sub-batches serially rather than multiplying the concurrent writers
+_NODE_UPSERT_APOC_CYPHER = """
+CALL apoc.periodic.iterate(
+    'UNWIND $batch AS row RETURN row',
+    'MERGE (n:Memory {id: row.id})
+     SET n.key = row.id,
+         n.memory = row.memory,
+         n.sources = row.sources,
+         n.created_at = datetime(row.metadata.created_at),
+         n.updated_at = datetime(row.metadata.updated_at),
+         n += row.metadata',
+    {batchSize: 200, parallel: false, params: {batch: $batch}}
+)
+YIELD committedOperations, failedOperations, errorMessages
+RETURN committedOperations AS imported, failedOperations AS failed, errorMessages AS errors
+"""
 
+# Edges sharing an endpoint would contend for the same node locks, so APOC commits
+# them serially (parallel: false) in list batches
+_EDGE_UPSERT_APOC_CYPHER = """
+CALL apoc.periodic.iterate(
+    'UNWIND $batch AS row RETURN row',
+    'MATCH (s) WHERE elementId(s) = row.source_eid
+     MATCH (t) WHERE elementId(t) = row.target_eid
+     CALL apoc.merge.relationship(
+         s, row.type, {},
+         {created_at: datetime(row.created_at)}, t,
+         {created_at: datetime(row.created_at)}
+     ) YIELD rel
+     RETURN count(rel)',
+    {batchSize: 1000, parallel: false, iterateList: true, params: {batch: $batch}}
+)
+YIELD committedOperations, failedOperations, errorMessages
+RETURN committedOperations AS imported, failedOperations AS failed, errorMessages AS errors
+"""
+
+# Relationship types cannot be parameterized, so the fallback fills one in per type
+_EDGE_UPSERT_CYPHER_TEMPLATE = """
+UNWIND $batch AS row
+MATCH (s) WHERE elementId(s) = row.source_eid
+MATCH (t) WHERE elementId(t) = row.target_eid
+MERGE (s)-[r:`{rel_type}`]->(t)
+SET r.created_at = datetime(row.created_at)
+RETURN count(r) AS imported
+"""
 
 
-from ..utils.neo4j_utils import test_connection, get_database_stats, print_database_stats
+def _adapt_batch_size(batch_size: int, elapsed: float) -> int:
+    """Return the next batch size given how long the last batch took to commit."""
+    if elapsed < FAST_BATCH_SECONDS:
+        return min(batch_size * 2, MAX_BATCH_SIZE)
+    if elapsed > SLOW_BATCH_SECONDS:
+        return max(batch_size // 2, MIN_BATCH_SIZE)
+    return batch_size
+
+
+def _stream_items(json_file_path: Path, prefix: str) -> Iterator[Dict]:
+    """
+    Yield the items of a top-level array in the knowledge graph JSON.
+
+    Args:
+        json_file_path: Path to knowledge graph JSON file
+        prefix: ijson item prefix, e.g. 'nodes.item' or 'edges.item'
+
+    Yields:
+        Item dictionaries
+    """
+    json_file_path = Path(json_file_path)
+    with open(json_file_path, 'rb') as f:
+        if json_file_path.stat().st_size < IN_MEMORY_PARSE_LIMIT:
+            yield from orjson.loads(f.read()).get(prefix.split('.')[0], [])
+        else:
+            # Use ijson for memory-efficient streaming; use_float avoids Decimal values
+            yield from ijson.items(f, prefix, use_float=True)
+
+
+def _stream_graph(json_file_path: Path) -> Iterator[Tuple[str, Dict]]:
+    """
+    Yield node and edge items from the knowledge graph JSON in a single pass.
+
+    Args:
+        json_file_path: Path to knowledge graph JSON file
+
+    Yields:
+        ('nodes' | 'edges', item dictionary) tuples in file order
+    """
+    json_file_path = Path(json_file_path)
+    with open(json_file_path, 'rb') as f:
+        if json_file_path.stat().st_size < IN_MEMORY_PARSE_LIMIT:
+            graph = orjson.loads(f.read())
+            for key in ('nodes', 'edges'):
+                for item in graph.get(key, []):
+                    yield key, item
+            return
+
+        # Build items from one parse event stream so the file is read only once
+        builder = None
+        item_prefix = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                if event != 'start_map' or prefix not in ('nodes.item', 'edges.item'):
+                    continue
+                builder = ObjectBuilder()
+                item_prefix = prefix
+            builder.event(event, value)
+            if event == 'end_map' and prefix == item_prefix:
+                yield item_prefix.split('.')[0], builder.value
+                builder = None
+
+def _staging_size(batch_size: int) -> int:
+    """Return how many items to stage before sorting and batching them."""
+    return max(batch_size, min(batch_size * STAGING_BATCHES, MAX_STAGED_ITEMS))
+
+
+def _sorted_chunks(staging: List[Dict], batch_size: int, kind: str) -> Iterator[List[Dict]]:
+    """Sort staged items in place (nodes by id, edges by endpoints) and yield batches."""
+    if kind == 'nodes':
+        staging.sort(key=lambda row: str(row['id']))
+    else:
+        staging.sort(key=lambda row: (str(row['source']), str(row['target'])))
+    for i in range(0, len(staging), batch_size):
+        yield staging[i:i + batch_size]
+
+
+def _item_key(kind: str, item: Dict) -> Any:
+    """Identity of an item for duplicate handling: node id, or (source, target, type) for edges."""
+    if kind == 'nodes':
+        return item.get('id')
+    return (item.get('source'), item.get('target'), item.get('type', 'RELATED_TO'))
+
+
+class _StagedRows:
+    """
+    Prepared rows of one kind, staged by item key so the last duplicate wins.
+
+    A duplicate still waiting in the stage replaces the earlier row. A duplicate
+    of a row already taken for writing is kept aside in `late`; the caller writes
+    those after every earlier batch has committed, matching the result of
+    MERGE-ing each occurrence in file order.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.pending: Dict[Any, Dict] = {}
+        self.late: Dict[Any, Dict] = {}
+        self.taken = set()
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, item: Dict, row: Dict) -> None:
+        """Stage the prepared row for a raw item, replacing an earlier duplicate."""
+        key = _item_key(self.kind, item)
+        if key in self.taken:
+            self.late[key] = row
+        else:
+            self.pending[key] = row
+
+    def take(self) -> List[Dict]:
+        """Return the staged rows for writing and clear the stage."""
+        rows = list(self.pending.values())
+        self.taken.update(self.pending)
+        self.pending = {}
+        return rows
+
+    def take_late(self) -> List[Dict]:
+        """Return the duplicates of rows taken earlier, to write last."""
+        rows = list(self.late.values())
+        self.late = {}
+        return rows
+
+
+def _csv_type(value: Any) -> Optional[str]:
+    """Return the neo4j-admin CSV header type for a property value, if it has one."""
+    if isinstance(value, Vector):
+        return 'byte[]' if value.dtype is VectorDType.I8 else 'float[]'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'long'
+    if isinstance(value, float):
+        return 'double'
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, list) and value:
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+            return 'double[]'
+        element_type = _csv_type(value[0])
+        if element_type and not element_type.endswith('[]'):
+            return element_type + '[]'
+    return None
+
+
+def _csv_cell(value: Any) -> str:
+    """Format a property value as a neo4j-admin CSV cell."""
+    if isinstance(value, Vector):
+        value = value.to_native()
+    if isinstance(value, list):
+        return CSV_ARRAY_DELIMITER.join(str(v) for v in value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return '' if value is None else str(value)
+
+
+class _BatchWriterPool:
+    """
+    Executes batches on worker threads, each holding its own write session.
+
+    The calling thread keeps parsing and preparing items while batches are
+    written; submit() blocks once 2 * max_workers batches are in flight.
+    """
+
+    def __init__(self, execute, open_session, max_workers: int):
+        """
+        Args:
+            execute: Batch executor called as execute(session, batch) -> imported count
+            open_session: Factory for a new write session
+            max_workers: Number of writer threads
+        """
+        self._execute = execute
+        self._open_session = open_session
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers * 2)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = []
+        self._futures = []
+        self._last_elapsed: Optional[float] = None
+        self.imported = 0
+
+    def _session(self):
+        """Return the current worker thread's session, opening it on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._open_session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _run(self, batch: List[Dict]) -> None:
+        try:
+            batch_start = time.time()
+            imported = self._execute(self._session(), batch)
+            with self._lock:
+                self.imported += imported
+                self._last_elapsed = time.time() - batch_start
+        finally:
+            self._slots.release()
+
+    def submit(self, batch: List[Dict]) -> None:
+        """Queue a batch for writing, blocking while the pool is saturated."""
+        self._slots.acquire()
+        self._futures.append(self._executor.submit(self._run, batch))
+
+    def take_elapsed(self) -> Optional[float]:
+        """Return the latest batch latency not yet consumed, if any."""
+        with self._lock:
+            elapsed, self._last_elapsed = self._last_elapsed, None
+        return elapsed
+
+    def drain(self) -> int:
+        """Wait for every submitted batch and return the total imported so far."""
+        wait(self._futures)
+        for future in self._futures:
+            future.result()
+        self._futures = []
+        return self.imported
+
+    def close(self) -> None:
+        """Stop the workers and close their sessions."""
+        self._executor.shutdown(wait=True)
+        for session in self._sessions:
+            session.close()
 
 
 class Neo4jService:
@@ -33,7 +389,11 @@ class Neo4jService:
         uri: str,
         username: str,
         password: str,
-        database: str = "neo4j"
+        database: str = "neo4j",
+        max_workers: int = 4,
+        use_apoc: bool = True,
+        embedding_dtype: Optional[str] = None,
+        connection_acquisition_timeout: float = 60.0
     ):
         """
         Initialize Neo4j service.
@@ -43,24 +403,52 @@ class Neo4jService:
             username: Database username
             password: Database password
             database: Database name
+            max_workers: Number of concurrent batch writers the driver pool is sized for
+            use_apoc: Use apoc.periodic.iterate to commit batches in server-side sub-batches
+            embedding_dtype: None to store embeddings as LIST<FLOAT>, or 'f32' / 'i8'
+                to send them as packed Neo4j VECTOR values (requires Bolt 6.0+)
+            connection_acquisition_timeout: Seconds a writer waits for a pooled connection
         """
+        if embedding_dtype not in (None, 'f32', 'i8'):
+            raise ValueError(f"Unsupported embedding_dtype: {embedding_dtype}")
+
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
+        self.max_workers = max_workers
+        self.use_apoc = use_apoc
+        self.embedding_dtype = embedding_dtype
+        self.connection_acquisition_timeout = connection_acquisition_timeout
         self.driver: Optional[GraphDatabase.driver] = None
+        # Node id -> Neo4j elementId, filled as edge batches resolve their endpoints.
+        # Reset per import since elementIds go stale once nodes are deleted.
+        self._id_map: Dict[str, str] = {}
 
     def connect(self) -> bool:
         """
         Establish connection to Neo4j database.
 
+        The driver is created once and shared by every batch writer, with the
+        connection pool pinned to the number of concurrent writers (plus the
+        edge/lookup session) so writers neither queue for connections nor
+        leave idle ones open. Connections are recycled hourly.
+
         Returns:
             True if connection successful
         """
+        if self.driver:
+            return True
+
         try:
             self.driver = GraphDatabase.driver(
                 self.uri,
-                auth=(self.username, self.password)
+                auth=(self.username, self.password),
+                max_connection_pool_size=self.max_workers * 2,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=3600,
+                keep_alive=True,
+                fetch_size=10_000
             )
             print(f"✅ Connected to Neo4j at {self.uri}")
             return True
@@ -70,6 +458,7 @@ class Neo4jService:
 
     def close(self):
         """Close database connection."""
+        self._id_map.clear()
         if self.driver:
             self.driver.close()
             self.driver = None
@@ -129,7 +518,7 @@ class Neo4jService:
 
         Args:
             json_file_path: Path to knowledge graph JSON file
-            batch_size: Batch size for import
+            batch_size: Initial batch size; adapted to server commit latency
 
         Returns:
             Number of nodes imported
@@ -142,35 +531,48 @@ class Neo4jService:
             self.connect()
 
         start_time = time.time()
+        last_log = time.monotonic()
+        # One timestamp for every item missing created_at/updated_at in this import
+        now = datetime.now().isoformat()
+        # Nodes staged by id; the last occurrence of a duplicate id wins
+        staged = _StagedRows('nodes')
         success_count = 0
-        batch = []
 
-        try:
-            with open(json_file_path, 'rb') as f:
-                # Use ijson for memory-efficient streaming
-                nodes = ijson.items(f, 'nodes.item')
+        # Parsing stays on this thread while writer threads execute batches
+        pool = _BatchWriterPool(self._execute_node_batch, self._write_session, self.max_workers)
 
-                for node in nodes:
+        try:
+            try:
+                for node in _stream_items(json_file_path, 'nodes.item'):
                     # Clean and prepare node data
-                    node_data = self._prepare_node(node)
-                    batch.append(node_data)
+                    staged.add(node, self._prepare_node(node, now))
 
-                    # Execute batch
-                    if len(batch) >= batch_size:
-                        batch_success = self._execute_node_batch(batch)
-                        success_count += batch_success
-                        batch = []
+                    # Execute staged batches, sorted by id
+                    if len(staged) >= _staging_size(batch_size):
+                        for chunk in _sorted_chunks(staged.take(), batch_size, 'nodes'):
+                            pool.submit(chunk)
+                        batch_elapsed = pool.take_elapsed()
+                        if batch_elapsed is not None:
+                            batch_size = _adapt_batch_size(batch_size, batch_elapsed)
 
                         # Progress update
-                        elapsed = time.time() - start_time
-                        rate = success_count / elapsed if elapsed > 0 else 0
-                        print(f"  Imported: {success_count:,} nodes | "
-                              f"Rate: {rate:.1f} nodes/sec")
-
-                # Process remaining batch
-                if batch:
-                    batch_success = self._execute_node_batch(batch)
-                    success_count += batch_success
+                        if time.monotonic() - last_log >= PROGRESS_LOG_INTERVAL:
+                            last_log = time.monotonic()
+                            success_count = pool.imported
+                            elapsed = time.time() - start_time
+                            rate = success_count / elapsed if elapsed > 0 else 0
+                            logger.info(f"  Imported: {success_count:,} nodes | "
+                                        f"Rate: {rate:.1f} nodes/sec")
+
+                # Process remaining batch, then duplicates of nodes already written
+                for chunk in _sorted_chunks(staged.take(), batch_size, 'nodes'):
+                    pool.submit(chunk)
+                pool.drain()
+                for chunk in _sorted_chunks(staged.take_late(), batch_size, 'nodes'):
+                    pool.submit(chunk)
+                success_count = pool.drain()
+            finally:
+                pool.close()
 
             total_time = time.time() - start_time
             print(f"\n✅ Node import complete:")
@@ -194,7 +596,7 @@ class Neo4jService:
 
         Args:
             json_file_path: Path to knowledge graph JSON file
-            batch_size: Batch size for import
+            batch_size: Initial batch size; adapted to server commit latency
 
         Returns:
             Number of edges imported
@@ -205,42 +607,41 @@ class Neo4jService:
 
         if not self.driver:
             self.connect()
+        self._id_map.clear()
 
         start_time = time.time()
+        last_log = time.monotonic()
+        # One timestamp for every item missing created_at/updated_at in this import
+        now = datetime.now().isoformat()
+        # Edges staged by (source, target, type); the last occurrence of a duplicate wins
+        staged = _StagedRows('edges')
         success_count = 0
-        batch = []
 
         try:
-            with open(json_file_path, 'rb') as f:
-                edges = ijson.items(f, 'edges.item')
-
-                for edge in edges:
-                    # Clean edge data
-                    edge_data = self._clean_data_types(edge)
-                    batch.append({
-                        'source': edge_data.get('source'),
-                        'target': edge_data.get('target'),
-                        'type': edge_data.get('type', 'RELATED_TO'),
-                        'created_at': edge_data.get('created_at', datetime.now().isoformat())
-                    })
-
-                    # Execute batch
-                    if len(batch) >= batch_size:
-                        batch_success = self._execute_edge_batch(batch)
-                        success_count += batch_success
-                        batch = []
+            # One session for the whole import so batches reuse its connection
+            with self._write_session() as session:
+                for edge in _stream_items(json_file_path, 'edges.item'):
+                    staged.add(edge, self._prepare_edge(edge, now))
+
+                    # Execute staged batches, sorted by endpoints
+                    if len(staged) >= _staging_size(batch_size):
+                        for chunk in _sorted_chunks(staged.take(), batch_size, 'edges'):
+                            batch_start = time.time()
+                            success_count += self._execute_edge_batch(session, chunk)
+                            batch_size = _adapt_batch_size(batch_size, time.time() - batch_start)
 
                         # Progress update
-                        if success_count % (batch_size / 100) == 0:
+                        if time.monotonic() - last_log >= PROGRESS_LOG_INTERVAL:
+                            last_log = time.monotonic()
                             elapsed = time.time() - start_time
                             rate = success_count / elapsed if elapsed > 0 else 0
-                            print(f"  Imported: {success_count:,} edges | "
-                                  f"Rate: {rate:.1f} edges/sec")
+                            logger.info(f"  Imported: {success_count:,} edges | "
+                                        f"Rate: {rate:.1f} edges/sec")
 
-                # Process remaining batch
-                if batch:
-                    batch_success = self._execute_edge_batch(batch)
-                    success_count += batch_success
+                # Process remaining batch, then duplicates of edges already written
+                for rows in (staged.take(), staged.take_late()):
+                    for chunk in _sorted_chunks(rows, batch_size, 'edges'):
+                        success_count += self._execute_edge_batch(session, chunk)
 
             total_time = time.time() - start_time
             print(f"\n✅ Edge import complete:")
@@ -254,6 +655,264 @@ class Neo4jService:
             print(f"❌ Edge import failed: {e}")
             return success_count
 
+    def bulk_import_combined(
+        self,
+        json_file_path: Path,
+        node_batch_size: int = 1000,
+        edge_batch_size: int = 10000
+    ) -> Dict[str, int]:
+        """
+        Bulk import nodes and edges with a single pass over the JSON file.
+
+        Edges are written as their batches fill; an edge whose endpoint node
+        appears later in the file is held back and retried once every node
+        has been imported.
+
+        Args:
+            json_file_path: Path to knowledge graph JSON file
+            node_batch_size: Initial batch size for node import
+            edge_batch_size: Initial batch size for edge import
+
+        Returns:
+            Dictionary with 'nodes' and 'edges' import counts
+        """
+        print("\n" + "=" * 60)
+        print("BULK IMPORTING NODES AND EDGES")
+        print("=" * 60)
+
+        if not self.driver:
+            self.connect()
+        self._id_map.clear()
+
+        start_time = time.time()
+        last_log = time.monotonic()
+        # One timestamp for every item missing created_at/updated_at in this import
+        now = datetime.now().isoformat()
+        # Items staged by node id / edge key; the last occurrence of a duplicate wins
+        staged = {'nodes': _StagedRows('nodes'), 'edges': _StagedRows('edges')}
+        counts = {'nodes': 0, 'edges': 0}
+        # Edges whose endpoints were not imported yet when their batch ran
+        deferred_edges = []
+
+        # Node batches are written by a thread pool; edges share endpoint locks and
+        # stay serial on this thread's session
+        pool = _BatchWriterPool(self._execute_node_batch, self._write_session, self.max_workers)
+
+        try:
+            with self._write_session() as session:
+                for kind, item in _stream_graph(json_file_path):
+                    if kind == 'nodes':
+                        staged['nodes'].add(item, self._prepare_node(item, now))
+                        if len(staged['nodes']) >= _staging_size(node_batch_size):
+                            rows = staged['nodes'].take()
+                            for chunk in _sorted_chunks(rows, node_batch_size, 'nodes'):
+                                pool.submit(chunk)
+                            batch_elapsed = pool.take_elapsed()
+                            if batch_elapsed is not None:
+                                node_batch_size = _adapt_batch_size(node_batch_size, batch_elapsed)
+                        continue
+
+                    staged['edges'].add(item, self._prepare_edge(item, now))
+                    if len(staged['edges']) >= _staging_size(edge_batch_size):
+                        # Edges MATCH their endpoints, so pending nodes are written first
+                        for chunk in _sorted_chunks(staged['nodes'].take(), node_batch_size, 'nodes'):
+                            pool.submit(chunk)
+                        counts['nodes'] = pool.drain()
+                        for chunk in _sorted_chunks(staged['edges'].take(), edge_batch_size, 'edges'):
+                            batch_start = time.time()
+                            counts['edges'] += self._execute_edge_batch(
+                                session, chunk, deferred_edges
+                            )
+                            edge_batch_size = _adapt_batch_size(edge_batch_size, time.time() - batch_start)
+
+                        # Progress update
+                        if time.monotonic() - last_log >= PROGRESS_LOG_INTERVAL:
+                            last_log = time.monotonic()
+                            elapsed = time.time() - start_time
+                            logger.info(f"  Imported: {counts['nodes']:,} nodes, "
+                                        f"{counts['edges']:,} edges | Elapsed: {elapsed:.1f}s")
+
+                # Process remaining batches; duplicates of items already written go last
+                for chunk in _sorted_chunks(staged['nodes'].take(), node_batch_size, 'nodes'):
+                    pool.submit(chunk)
+                pool.drain()
+                for chunk in _sorted_chunks(staged['nodes'].take_late(), node_batch_size, 'nodes'):
+                    pool.submit(chunk)
+                counts['nodes'] = pool.drain()
+
+                edge_rows = staged['edges'].take()
+                if deferred_edges:
+                    print(f"  Retrying {len(deferred_edges):,} edges that preceded their nodes")
+                    edge_rows.extend(deferred_edges)
+                for rows in (edge_rows, staged['edges'].take_late()):
+                    for chunk in _sorted_chunks(rows, edge_batch_size, 'edges'):
+                        counts['edges'] += self._execute_edge_batch(session, chunk)
+
+            total_time = time.time() - start_time
+            print("\n✅ Graph import complete:")
+            print(f"  Nodes imported: {counts['nodes']:,}")
+            print(f"  Edges imported: {counts['edges']:,}")
+            print(f"  Total time: {total_time/60:.1f} minutes")
+
+            return counts
+
+        except Exception as e:
+            print(f"❌ Graph import failed: {e}")
+            return counts
+
+        finally:
+            pool.close()
+
+    def drop_secondary_indexes(self) -> bool:
+        """
+        Drop the secondary indexes before a bulk import.
+
+        Rebuilding them once over the loaded graph is cheaper than updating
+        them on every MERGE. create_indexes() recreates them afterwards.
+        """
+        print("Dropping secondary indexes before import...")
+
+        try:
+            if not self.driver:
+                self.connect()
+
+            with self.driver.session(database=self.database) as session:
+                for index_name in SECONDARY_INDEX_NAMES:
+                    session.run(f"DROP INDEX {index_name} IF EXISTS")
+            print(f"✅ Dropped {len(SECONDARY_INDEX_NAMES)} secondary indexes (if present)")
+            return True
+
+        except Exception as e:
+            print(f"⚠️  Could not drop secondary indexes: {e}")
+            return False
+
+    def cold_load(self, json_file_path: Path, import_dir: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Load an empty database offline with `neo4j-admin database import full`.
+
+        Streams the graph JSON into node/relationship CSVs and runs the admin
+        import, which writes store files directly instead of MERGE-ing over
+        Bolt. neo4j-admin must be on PATH on the database host and the target
+        database must not exist yet (or be stopped); create_schema() then
+        creates the database on top of the imported store. Of duplicate node
+        ids or edges, only the last occurrence is written, as with the Bolt import.
+
+        Args:
+            json_file_path: Path to knowledge graph JSON file
+            import_dir: Directory for the CSV files (default: a temp directory that is
+                removed afterwards)
+
+        Returns:
+            Dictionary with 'nodes' and 'edges' counts; both 0 if the import failed
+        """
+        print("\n" + "=" * 60)
+        print("COLD LOAD (neo4j-admin database import)")
+        print("=" * 60)
+
+        failed = {'nodes': 0, 'edges': 0}
+        # The store is rewritten, so cached elementIds no longer apply
+        self._id_map.clear()
+        admin = shutil.which("neo4j-admin")
+        if not admin:
+            print("⚠️  neo4j-admin not found on PATH")
+            return failed
+
+        # The CSVs can run to GBs, so a directory we create is removed when done
+        temp_dir = None
+        if import_dir is None:
+            temp_dir = tempfile.TemporaryDirectory(prefix="neo4j_import_")
+            import_dir = temp_dir.name
+        import_dir = Path(import_dir)
+        import_dir.mkdir(parents=True, exist_ok=True)
+        nodes_csv = import_dir / "nodes.csv"
+        edges_csv = import_dir / "edges.csv"
+        now = datetime.now().isoformat()
+        # Position of the last occurrence of each node id / edge key in the file
+        last_positions: Dict[str, Dict[Any, int]] = {'nodes': {}, 'edges': {}}
+        reserved = {'id', 'key', 'memory', 'sources'}
+
+        try:
+            # First pass: find the last occurrence of each item and collect
+            # metadata property types for the CSV header
+            prepared_types: Dict[str, str] = {}
+            positions = {'nodes': 0, 'edges': 0}
+            for kind, item in _stream_graph(json_file_path):
+                last_positions[kind][_item_key(kind, item)] = positions[kind]
+                positions[kind] += 1
+                if kind != 'nodes':
+                    continue
+                for key, value in self._prepare_node(item, now)['metadata'].items():
+                    if key not in prepared_types and key not in reserved:
+                        value_type = 'datetime' if key in DATETIME_PROPERTIES else _csv_type(value)
+                        if value_type:
+                            prepared_types[key] = value_type
+            metadata_keys = list(prepared_types)
+
+            # Second pass: write nodes and edges
+            counts = {'nodes': 0, 'edges': 0}
+            with open(nodes_csv, 'w', newline='', encoding='utf-8') as nf, \
+                    open(edges_csv, 'w', newline='', encoding='utf-8') as ef:
+                node_writer = csv.writer(nf)
+                edge_writer = csv.writer(ef)
+                node_writer.writerow(
+                    ['id:ID', 'key', 'memory', 'sources:string[]']
+                    + [f"{key}:{prepared_types[key]}" for key in metadata_keys]
+                )
+                edge_writer.writerow([':START_ID', ':END_ID', ':TYPE', 'created_at:datetime'])
+
+                positions = {'nodes': 0, 'edges': 0}
+                for kind, item in _stream_graph(json_file_path):
+                    # neo4j-admin would create duplicate relationships, unlike MERGE;
+                    # keep the last occurrence, whose properties MERGE would leave
+                    position = positions[kind]
+                    positions[kind] += 1
+                    if last_positions[kind][_item_key(kind, item)] != position:
+                        continue
+
+                    if kind == 'nodes':
+                        node = self._prepare_node(item, now)
+                        metadata = node['metadata']
+                        node_writer.writerow(
+                            [node['id'], node['id'], node['memory'], _csv_cell(node['sources'])]
+                            + [_csv_cell(metadata.get(key)) for key in metadata_keys]
+                        )
+                    else:
+                        edge = self._prepare_edge(item, now)
+                        edge_writer.writerow(
+                            [edge['source'], edge['target'], edge['type'], edge['created_at']]
+                        )
+                    counts[kind] += 1
+
+            print(f"  Wrote {counts['nodes']:,} nodes and {counts['edges']:,} edges to {import_dir}")
+
+            result = subprocess.run(
+                [
+                    admin, "database", "import", "full", self.database,
+                    f"--nodes=Memory={nodes_csv}",
+                    f"--relationships={edges_csv}",
+                    "--multiline-fields=true",
+                    "--array-delimiter=U+001F",
+                    "--skip-duplicate-nodes=true",
+                    "--skip-bad-relationships=true",
+                ],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                print(f"❌ neo4j-admin import failed: {result.stderr.strip() or result.stdout.strip()}")
+                return failed
+
+            print("✅ Cold load complete")
+            return counts
+
+        except Exception as e:
+            print(f"❌ Cold load failed: {e}")
+            return failed
+
+        finally:
+            if temp_dir is not None:
+                temp_dir.cleanup()
+
     def create_indexes(self) -> bool:
         """
         Create indexes for query performance (MemOS-compatible).
@@ -305,6 +964,14 @@ class Neo4jService:
                         }}
                     """)
                     print("✅ Vector index created (768 dimensions, cosine similarity)")
+
+                    # Block until the index is populated so queries right after the
+                    # import use it instead of falling back to a scan
+                    session.run(
+                        "CALL db.awaitIndex('memory_vector_index', $timeout)",
+                        timeout=INDEX_POPULATION_TIMEOUT
+                    ).consume()
+                    print("✅ Vector index populated")
                 except Exception as e:
                     print(f"⚠️  Vector index creation failed: {e}")
                     print("   Vector search functionality will be unavailable")
@@ -343,126 +1010,229 @@ class Neo4jService:
             indexes = [record.data() for record in result]
             print(f"Indexes: {len(indexes)}")
 
+            populating = [
+                index for index in indexes
+                if index.get("populationPercent") is not None and index["populationPercent"] < 100
+            ]
+            for index in populating:
+                print(f"⚠️  Index {index['name']} still populating: {index['populationPercent']:.1f}%")
+
         return {
             "stats": stats,
             "constraints": len(constraints),
-            "indexes": len(indexes)
+            "indexes": len(indexes),
+            "indexes_populating": [index["name"] for index in populating]
         }
 
-    def _clean_data_types(self, obj: Any) -> Any:
-        """Clean data types for Neo4j compatibility."""
-        if isinstance(obj, dict):
-            return {k: self._clean_data_types(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._clean_data_types(item) for item in obj]
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        elif obj is None:
-            return None
-        else:
-            return obj
+    def _prepare_node(self, node: Dict, now: str) -> Dict:
+        """
+        Prepare node data for import (MemOS-compatible structure from Stage 8).
 
-    def _prepare_node(self, node: Dict) -> Dict:
-        """Prepare node data for import (MemOS-compatible structure from Stage 8)."""
-        node = self._clean_data_types(node)
+        Args:
+            node: Raw node from the knowledge graph JSON
+            now: ISO timestamp used when created_at/updated_at are missing
+        """
         metadata = node.get('metadata', {}).copy()
         
         # MODIFIED: Ensure created_at and updated_at exist
         if 'created_at' not in metadata:
-            metadata['created_at'] = datetime.now().isoformat()
+            metadata['created_at'] = now
         if 'updated_at' not in metadata:
-            metadata['updated_at'] = datetime.now().isoformat()
+            metadata['updated_at'] = now
+
+        embedding = metadata.get('embedding')
+        if embedding:
+            metadata['embedding'] = self._encode_embedding(embedding, metadata)
+        else:
+            metadata.pop('embedding', None)
+
+        # Neo4j properties cannot hold maps, so nested values are stored as JSON strings
+        for key, value in metadata.items():
+            if isinstance(value, dict) or (isinstance(value, list) and value and isinstance(value[0], dict)):
+                metadata[key] = orjson.dumps(value).decode()
 
         return {
             'id': node.get('id'),
             'memory': node.get('memory', ''),
             'sources': node.get('sources', []),  # ADDED: Required by MemOS
-            'metadata': self._clean_data_types(metadata)
+            'metadata': metadata
+        }
+
+    def _encode_embedding(self, embedding: List[float], metadata: Dict) -> Any:
+        """
+        Encode an embedding for Bolt according to embedding_dtype.
+
+        By default embeddings go out as a native LIST<FLOAT>; whole numbers parse
+        as int, and mixed int/float lists cannot be stored, so values are coerced.
+        'f32' packs 4 bytes per dimension instead of Bolt's 8-byte floats. 'i8'
+        packs 1 byte per dimension with a per-vector scale kept in
+        metadata['embedding_scale']; cosine similarity is unaffected by the scale.
+        """
+        if self.embedding_dtype is None:
+            return [float(x) for x in embedding]
+
+        if self.embedding_dtype == 'i8':
+            quantized, scale = quantize_embeddings(embedding)
+            metadata['embedding_scale'] = float(scale)
+            return Vector.from_numpy(quantized)
+        return Vector.from_numpy(np.asarray(embedding, dtype=np.float32))
+
+    def _write_session(self):
+        """Open a long-lived write session for bulk import."""
+        return self.driver.session(database=self.database, default_access_mode=WRITE_ACCESS)
+
+    @staticmethod
+    def _write_batch(tx, cypher: str, batch: List[Dict]) -> int:
+        """Transaction function running a single UNWIND batch."""
+        return tx.run(cypher, batch=batch).single()["imported"]
+
+    def _prepare_edge(self, edge: Dict, now: str) -> Dict:
+        """Prepare edge data for import, using `now` when created_at is missing."""
+        return {
+            'source': edge.get('source'),
+            'target': edge.get('target'),
+            'type': edge.get('type', 'RELATED_TO'),
+            'created_at': edge.get('created_at') or now
         }
 
-    def _execute_node_batch(self, batch: List[Dict]) -> int:
-        """Execute node batch import (MemOS-compatible properties)."""
-        cypher = """
-        UNWIND $batch AS row
-        MERGE (n:Memory {id: row.id})
-        SET n.key = row.id,
-            n.memory = row.memory,
-            n.sources = row.sources,
-            n.created_at = datetime(row.metadata.created_at),
-            n.updated_at = datetime(row.metadata.updated_at),
-            n += row.metadata
-        RETURN count(n) AS imported
+    def _execute_node_batch(self, session, batch: List[Dict]) -> int:
+        """
+        Execute node batch import (MemOS-compatible properties).
+
+        The UNWIND is wrapped in apoc.periodic.iterate so the server commits
+        it in sub-batches; a plain UNWIND is used when APOC is missing.
         """
         try:
-            with self.driver.session(database=self.database) as session:
-                res = session.run(cypher, batch=batch)
-                return res.single()["imported"]
+            if self.use_apoc:
+                try:
+                    return self._run_apoc_batch(
+                        session, _NODE_UPSERT_APOC_CYPHER, batch, self._execute_node_batch_fallback
+                    )
+                except ClientError as e:
+                    if not self._disable_apoc(e):
+                        raise
+            return self._execute_node_batch_fallback(session, batch)
         except Exception as e:
             print(f"  Batch error: {e}")
             return 0
 
-    def _execute_edge_batch(self, batch: List[Dict]) -> int:
-        """Execute edge batch import with dynamic relationship types (RELATE_TO or PARENT)."""
-        # Use APOC for dynamic relationship type creation
-        cypher = """
-        UNWIND $batch AS row
-        MATCH (s:Memory {id: row.source})
-        MATCH (t:Memory {id: row.target})
-        MERGE (s)-[r:PARENT]->(t)
-        SET r.created_at = datetime(row.created_at)
-        RETURN count(r) AS imported
+    def _execute_node_batch_fallback(self, session, batch: List[Dict]) -> int:
+        """Node import without APOC - one plain UNWIND write transaction."""
+        return session.execute_write(self._write_batch, _NODE_UPSERT_CYPHER, batch)
+
+    def _execute_edge_batch(
+        self,
+        session,
+        batch: List[Dict],
+        deferred: Optional[List[Dict]] = None
+    ) -> int:
+        """
+        Execute edge batch import with dynamic relationship types (RELATE_TO or PARENT).
+
+        Edges whose endpoints do not exist yet are appended to `deferred` when it
+        is given, so the caller can retry them later, and dropped otherwise.
         """
         try:
-            with self.driver.session(database=self.database) as session:
-                res = session.run(cypher, batch=batch)
-                return res.single()["imported"]
+            batch, unresolved = self._resolve_element_ids(session, batch)
         except Exception as e:
-            # If APOC is not available, fall back to separate batches by type
-            print(f"  Edge batch error (possibly APOC not installed): {e}")
-            print(f"  Falling back to type-specific batches...")
-            return self._execute_edge_batch_fallback(batch)
+            print(f"  Edge endpoint lookup error: {e}")
+            return 0
+        if deferred is not None:
+            deferred.extend(unresolved)
+        if not batch:
+            return 0
+
+        if self.use_apoc:
+            try:
+                return self._run_apoc_batch(
+                    session, _EDGE_UPSERT_APOC_CYPHER, batch, self._execute_edge_batch_fallback
+                )
+            except ClientError as e:
+                if not self._disable_apoc(e):
+                    print(f"  Edge batch error: {e}")
+                    print("  Falling back to type-specific batches...")
+            except Exception as e:
+                print(f"  Edge batch error: {e}")
+                print(f"  Falling back to type-specific batches...")
+        return self._execute_edge_batch_fallback(session, batch)
+
+    def _resolve_element_ids(self, session, batch: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Attach source/target elementIds to edge rows.
+
+        Each node id is looked up once and cached (up to ID_MAP_MAX_SIZE ids), so
+        edges MATCH by elementId instead of probing the id index twice per edge.
+
+        Returns:
+            (resolved rows with elementIds, rows whose endpoints do not exist)
+        """
+        missing = {row[key] for row in batch for key in ('source', 'target')} - self._id_map.keys()
+        found: Dict[str, str] = {}
+        if missing:
+            result = session.run(
+                "MATCH (n:Memory) WHERE n.id IN $ids RETURN n.id AS id, elementId(n) AS eid",
+                ids=list(missing)
+            )
+            found = {record["id"]: record["eid"] for record in result}
+
+        resolved = []
+        unresolved = []
+        for row in batch:
+            source_eid = found.get(row['source']) or self._id_map.get(row['source'])
+            target_eid = found.get(row['target']) or self._id_map.get(row['target'])
+            if source_eid and target_eid:
+                resolved.append({**row, 'source_eid': source_eid, 'target_eid': target_eid})
+            else:
+                unresolved.append(row)
+
+        # Dicts keep insertion order, so the first keys are the oldest lookups
+        self._id_map.update(found)
+        overflow = len(self._id_map) - ID_MAP_MAX_SIZE
+        if overflow > 0:
+            for node_id in list(islice(self._id_map, overflow)):
+                del self._id_map[node_id]
+        return resolved, unresolved
+
+    def _run_apoc_batch(self, session, cypher: str, batch: List[Dict], fallback) -> int:
+        """
+        Run an apoc.periodic.iterate batch and return committed operations.
+
+        APOC reports failed sub-batches without raising, so a batch with any
+        failed operations is re-run through `fallback` (the plain UNWIND path,
+        called as fallback(session, batch)). The upserts MERGE, so rows that
+        did commit are written again unchanged, and rows that still fail raise
+        into the caller's error handling.
+        """
+        record = session.run(cypher, batch=batch).single()
+        if not record["failed"]:
+            return record["imported"]
+
+        print(f"  {record['failed']} operations failed: {record['errors']}")
+        print("  Re-running the batch without APOC...")
+        return fallback(session, batch)
 
-    def _execute_edge_batch_fallback(self, batch: List[Dict]) -> int:
+    def _disable_apoc(self, error: ClientError) -> bool:
+        """Switch to plain UNWIND batches if the error is a missing APOC procedure."""
+        if error.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+            return False
+        print("  ⚠️  APOC not available, falling back to plain UNWIND batches")
+        self.use_apoc = False
+        return True
+
+    def _execute_edge_batch_fallback(self, session, batch: List[Dict]) -> int:
         """Fallback edge import without APOC - separate batches by relationship type."""
-        # Group by relationship type
-        relate_to_batch = [e for e in batch if e.get('type') == 'RELATE_TO']
-        parent_batch = [e for e in batch if e.get('type') == 'PARENT']
+        # Group by relationship type; Cypher cannot parameterize the type
+        batches_by_type: Dict[str, List[Dict]] = {}
+        for edge in batch:
+            batches_by_type.setdefault(edge['type'], []).append(edge)
 
         total_imported = 0
-
-        # Import RELATE_TO relationships
-        if relate_to_batch:
-            cypher_relate = """
-            UNWIND $batch AS row
-            MATCH (s:Node {id: row.source})
-            MATCH (t:Node {id: row.target})
-            MERGE (s)-[r:RELATE_TO]->(t)
-            SET r.created_at = datetime(row.created_at)
-            RETURN count(r) AS imported
-            """
-            try:
-                with self.driver.session(database=self.database) as session:
-                    res = session.run(cypher_relate, batch=relate_to_batch)
-                    total_imported += res.single()["imported"]
-            except Exception as e:
-                print(f"  RELATE_TO batch error: {e}")
-
-        # Import PARENT relationships
-        if parent_batch:
-            cypher_parent = """
-            UNWIND $batch AS row
-            MATCH (s:Node {id: row.source})
-            MATCH (t:Node {id: row.target})
-            MERGE (s)-[r:PARENT]->(t)
-            SET r.created_at = datetime(row.created_at)
-            RETURN count(r) AS imported
-            """
+        for rel_type, type_batch in batches_by_type.items():
+            cypher = _EDGE_UPSERT_CYPHER_TEMPLATE.format(rel_type=rel_type.replace('`', '``'))
             try:
-                with self.driver.session(database=self.database) as session:
-                    res = session.run(cypher_parent, batch=parent_batch)
-                    total_imported += res.single()["imported"]
+                total_imported += session.execute_write(self._write_batch, cypher, type_batch)
             except Exception as e:
-                print(f"  PARENT batch error: {e}")
+                print(f"  {rel_type} batch error: {e}")
 
         return total_imported
 
@@ -470,15 +1240,20 @@ class Neo4jService:
         self,
         json_file_path: Path,
         node_batch_size: int = 1000,
-        edge_batch_size: int = 10000
+        edge_batch_size: int = 10000,
+        drop_indexes: bool = True,
+        cold_load: bool = False
     ) -> Dict[str, Any]:
         """
-        Complete import pipeline: schema → nodes → edges → indexes → verify.
+        Complete import pipeline: schema → nodes + edges → indexes → verify.
 
         Args:
             json_file_path: Path to knowledge graph JSON
             node_batch_size: Batch size for node import
             edge_batch_size: Batch size for edge import
+            drop_indexes: Drop secondary indexes before import and rebuild them after
+            cold_load: Try an offline neo4j-admin import first when the database is
+                empty (local deployments only); falls back to the Bolt import
 
         Returns:
             Dictionary with pipeline results
@@ -494,38 +1269,49 @@ class Neo4jService:
         if not self.test_connection():
             return {"success": False, "error": "Connection test failed"}
 
+        # Cold load writes the store offline, so it has to run before the
+        # database is created by create_schema()
+        counts = None
+        if cold_load:
+            self.connect()
+            try:
+                existing_nodes = get_node_count(self.driver, database=self.database)
+            except Exception:
+                existing_nodes = 0  # Database does not exist yet
+            if existing_nodes == 0:
+                counts = self.cold_load(json_file_path)
+                if not counts['nodes']:
+                    counts = None
+
         # Step 2: Create schema
         print("\n[Step 2] Creating schema...")
         if not self.create_schema():
             return {"success": False, "error": "Schema creation failed"}
-
-        # Step 3: Import nodes
-        print("\n[Step 3] Importing nodes...")
-        nodes_start = time.time()
-        nodes_imported = self.bulk_import_nodes(json_file_path, node_batch_size)
-        nodes_elapsed = time.time() - nodes_start
-        if nodes_elapsed > 0:
-            print(f"  Avg speed (nodes): {nodes_imported / nodes_elapsed:.1f} nodes/sec")
+        if drop_indexes:
+            self.drop_secondary_indexes()
+
+        # Step 3: Import nodes and edges in one pass over the file
+        print("\n[Step 3] Importing nodes and edges...")
+        import_start = time.time()
+        if counts is None:
+            counts = self.bulk_import_combined(json_file_path, node_batch_size, edge_batch_size)
         else:
-            print("  Avg speed (nodes): n/a (elapsed time ~0)")
-
-        # Step 4: Import edges
-        print("\n[Step 4] Importing edges...")
-        edges_start = time.time()
-        edges_imported = self.bulk_import_edges(json_file_path, edge_batch_size)
-        edges_elapsed = time.time() - edges_start
-        if edges_elapsed > 0:
-            print(f"  Avg speed (edges): {edges_imported / edges_elapsed:.1f} edges/sec")
+            print("  Skipped: graph already loaded by neo4j-admin")
+        import_elapsed = time.time() - import_start
+        nodes_imported = counts['nodes']
+        edges_imported = counts['edges']
+        if import_elapsed > 0:
+            print(f"  Avg speed: {(nodes_imported + edges_imported) / import_elapsed:.1f} items/sec")
         else:
-            print("  Avg speed (edges): n/a (elapsed time ~0)")
+            print("  Avg speed: n/a (elapsed time ~0)")
 
-        # Step 5: Create indexes
-        print("\n[Step 5] Creating indexes...")
+        # Step 4: Create indexes
+        print("\n[Step 4] Creating indexes...")
         if not self.create_indexes():
             print("⚠️  Index creation had errors")
 
-        # Step 6: Verify
-        print("\n[Step 6] Verifying import...")
+        # Step 5: Verify
+        print("\n[Step 5] Verifying import...")
         verification = self.verify_import()
 
         total_time = time.time() - start_time
@@ -535,11 +1321,7 @@ class Neo4jService:
         print("=" * 60)
         print(f"Total time: {total_time/60:.1f} minutes")
         print(f"Nodes imported: {nodes_imported:,}")
-        if 'nodes_elapsed' in locals() and nodes_elapsed > 0:
-            print(f"Avg speed (nodes): {nodes_imported / nodes_elapsed:.1f} nodes/sec")
         print(f"Edges imported: {edges_imported:,}")
-        if 'edges_elapsed' in locals() and edges_elapsed > 0:
-            print(f"Avg speed (edges): {edges_imported / edges_elapsed:.1f} edges/sec")
         print("=" * 60)
 
         return {
@@ -3,12 +3,26 @@ OCR Service
 Wrapper for libs/ocr/precise_ocr to convert PDFs to markdown files.
 """
 
+import os
 import sys
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import json
+from functools import lru_cache
+from tqdm import tqdm
 
-# Find repo root by searching for marker files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Find repo root by searching for marker files (memoized; the walk stats each parent)
+@lru_cache(maxsize=8)
 def find_repo_root(start_path: Path) -> Path:
     """Find repository root by searching for pyproject.toml or .git"""
     current = start_path
@@ -32,6 +46,42 @@ except ImportError as e:
     print(f"Warning: Could not import OCR module: {e}")
     print(f"Attempted path: {OCR_PATH}")
 
+# Default threads used to read page result.md files concurrently
+PAGE_READ_WORKERS = 16
+
+
+def _init_pdf_worker(ocr_path: str) -> None:
+    """Process pool initializer: make the OCR module importable without probing the filesystem"""
+    if ocr_path not in sys.path:
+        sys.path.insert(0, ocr_path)
+
+
+def _convert_pdf_task(service: "OCRService", pdf_path: Path, output_dir: Path) -> Dict[str, Any]:
+    """Module-level wrapper so PDF conversions can run in a process pool"""
+    logger.debug(f"Processing: {pdf_path.name}")
+    return service.convert_pdf_to_markdown(pdf_path, output_dir)
+
+
+def _read_page_result(page_folder: str) -> Optional[bytes]:
+    """Read a page's result.md as raw bytes, or None if it is missing"""
+    try:
+        fd = os.open(os.path.join(page_folder, "result.md"), os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+
+    # Raw fd reads skip the buffered file object; size the read from fstat
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
 
 
 class OCRService:
@@ -49,7 +99,9 @@ class OCRService:
         zoom: float = 2.0,
         max_new_tokens: int = 1024,
         temperature: float = 0.2,
-        prompt: str = "<image>\n<|grounding|>Convert the document to markdown."
+        prompt: str = "<image>\n<|grounding|>Convert the document to markdown.",
+        pdf_parallel_workers: int = 1,
+        page_read_workers: int = PAGE_READ_WORKERS
     ):
         """
         Initialize OCR service.
@@ -61,6 +113,9 @@ class OCRService:
             max_new_tokens: Max tokens for OCR generation
             temperature: Sampling temperature
             prompt: OCR prompt template
+            pdf_parallel_workers: Number of PDFs converted concurrently, each with
+                its own pool of page workers (total processes = pdf_parallel_workers * workers)
+            page_read_workers: Threads used to read page result.md files during extraction
         """
         if not HAS_OCR:
             raise ImportError(
@@ -74,6 +129,8 @@ class OCRService:
         self.temperature = temperature
         self.prompt = prompt
         self.stop_on_eos = True
+        self.pdf_parallel_workers = max(1, pdf_parallel_workers)
+        self.page_read_workers = max(1, page_read_workers)
 
     def convert_pdf_to_markdown(
         self,
@@ -107,9 +164,10 @@ class OCRService:
             pdf_stem = pdf_path.stem
             markdown_file = output_dir / f"{pdf_stem}.md"
 
-            if markdown_file.exists():
-                print(f"[INFO] Skipping {pdf_path.name} - markdown already exists")
-                combined_file = output_dir / pdf_stem / "combined.md"
+            combined_file = output_dir / pdf_stem / "combined.md"
+
+            if os.path.isfile(markdown_file):
+                logger.debug(f"Skipping {pdf_path.name} - markdown already exists")
                 return {
                     "success": True,
                     "pdf_path": str(pdf_path),
@@ -131,10 +189,9 @@ class OCRService:
                 zoom=self.zoom
             )
 
-            # Check output files
-            combined_file = output_dir / pdf_stem / "combined.md"
-
-            if not markdown_file.exists():
+            # Check output files; combined.md is written before the root copy,
+            # so the root markdown existing implies combined.md does too
+            if not os.path.isfile(markdown_file):
                 return {
                     "success": False,
                     "pdf_path": str(pdf_path),
@@ -145,7 +202,7 @@ class OCRService:
                 "success": True,
                 "pdf_path": str(pdf_path),
                 "markdown_file": str(markdown_file),
-                "combined_markdown_file": str(combined_file) if combined_file.exists() else None,
+                "combined_markdown_file": str(combined_file),
                 "skipped": False
             }
 
@@ -180,11 +237,34 @@ class OCRService:
 
         print(f"Found {len(pdfs)} PDF(s) to process")
 
-        results = []
-        for pdf_path in pdfs:
-            print(f"\nProcessing: {pdf_path.name}")
-            result = self.convert_pdf_to_markdown(pdf_path, output_dir)
-            results.append(result)
+        max_workers = min(self.pdf_parallel_workers, len(pdfs))
+        if max_workers <= 1:
+            return [
+                _convert_pdf_task(self, pdf_path, output_dir)
+                for pdf_path in tqdm(pdfs, unit="pdf", desc="Converting PDFs")
+            ]
+
+        # Render and OCR several PDFs at once; keep results in discovery order
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pdfs)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_pdf_worker,
+            initargs=(str(OCR_PATH),)
+        ) as executor:
+            futures = {
+                executor.submit(_convert_pdf_task, self, pdf_path, output_dir): index
+                for index, pdf_path in enumerate(pdfs)
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), unit="pdf", desc="Converting PDFs"):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = {
+                        "success": False,
+                        "pdf_path": str(pdfs[index]),
+                        "error": str(e)
+                    }
 
         return results
 
@@ -235,11 +315,12 @@ class OCRService:
                     "error": f"PDF output directory not found: {pdf_output_dir}"
                 }
 
-            # Find all page-XXX folders and sort them
-            page_folders = sorted([
-                p for p in pdf_output_dir.iterdir()
-                if p.is_dir() and p.name.startswith('page-')
-            ])
+            # Find all page-XXX folders and sort them (scandir's d_type avoids a stat per entry)
+            with os.scandir(pdf_output_dir) as entries:
+                page_folders = sorted(
+                    entry.path for entry in entries
+                    if entry.name.startswith('page-') and entry.is_dir(follow_symlinks=False)
+                )
 
             if not page_folders:
                 return {
@@ -248,16 +329,17 @@ class OCRService:
                     "error": f"No page folders found in {pdf_output_dir}"
                 }
 
-            # Read result.md from each page folder
+            # Read result.md from each page folder concurrently (order is preserved)
+            with ThreadPoolExecutor(max_workers=min(self.page_read_workers, len(page_folders))) as executor:
+                page_bytes = list(executor.map(_read_page_result, page_folders))
+
             page_texts = []
-            for page_folder in page_folders:
-                result_md = page_folder / "result.md"
-                if result_md.exists():
-                    page_content = result_md.read_text(encoding='utf-8')
-                    page_texts.append(page_content)
+            for page_folder, content in zip(page_folders, page_bytes):
+                if content is not None:
+                    page_texts.append(content.decode('utf-8'))
                 else:
                     # If result.md is missing, add empty string but warn
-                    print(f"[WARN] Missing result.md in {page_folder.name}")
+                    logger.warning(f"Missing result.md in {os.path.basename(page_folder)}")
                     page_texts.append("")
 
             # Determine output JSON path
@@ -268,9 +350,15 @@ class OCRService:
 
             output_json.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save as JSON array (one element per page)
-            with open(output_json, 'w', encoding='utf-8') as f:
-                json.dump(page_texts, f, indent=2, ensure_ascii=False)
+            # Save as JSON array (one element per page), atomically via a temp file
+            if HAS_ORJSON:
+                payload = orjson.dumps(page_texts, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(page_texts, indent=2, ensure_ascii=False).encode('utf-8')
+
+            tmp_json = output_json.with_name(output_json.name + '.tmp')
+            tmp_json.write_bytes(payload)
+            os.replace(tmp_json, output_json)
 
             return {
                 "success": True,
@@ -323,28 +411,38 @@ class OCRService:
         print("\n[Step 2] Extracting text to JSON...")
         extraction_results = []
 
-        # Find all PDF folders in the markdown output directory
-        markdown_output_dir = Path(markdown_output_dir)
-
-        # Look for all .md files in the output directory (these are the root markdown files)
-        markdown_files = sorted(markdown_output_dir.glob("*.md"))
+        # Resolve output directories once rather than per file
+        markdown_output_dir = Path(markdown_output_dir).resolve()
+        json_output_dir = Path(json_output_dir).resolve()
+
+        # One scandir pass finds the root markdown files and the PDF folders beside them
+        markdown_files = []
+        pdf_folders = set()
+        if markdown_output_dir.is_dir():
+            with os.scandir(markdown_output_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pdf_folders.add(entry.name)
+                    elif entry.name.endswith(".md"):
+                        markdown_files.append(entry.name)
+        markdown_files.sort()
 
         if not markdown_files:
             print("No markdown files found to process")
         else:
             print(f"Found {len(markdown_files)} markdown file(s) to process")
 
-            for markdown_file in markdown_files:
-                pdf_stem = markdown_file.stem
+            for markdown_name in tqdm(markdown_files, unit="file", desc="Extracting text"):
+                pdf_stem = markdown_name[:-len(".md")]
+                markdown_file = markdown_output_dir / markdown_name
                 json_file = json_output_dir / f"{pdf_stem}.json"
 
                 # Check if corresponding folder exists
-                pdf_folder = markdown_output_dir / pdf_stem
-                if not pdf_folder.exists() or not pdf_folder.is_dir():
-                    print(f"[SKIP] No folder found for {pdf_stem}")
+                if pdf_stem not in pdf_folders:
+                    logger.debug(f"No folder found for {pdf_stem}, skipping")
                     continue
 
-                print(f"Processing: {pdf_stem}")
+                logger.debug(f"Processing: {pdf_stem}")
                 extraction_result = self.extract_text_to_json(markdown_file, json_file)
                 extraction_results.append(extraction_result)
 
@@ -24,13 +24,18 @@ from database.neo4j.policies.utils.embedding_utils import (
     load_embedding_model,
     generate_embeddings_batch,
     compute_similarity_matrix,
+    compute_top_k_similarities,
+    quantize_embeddings,
+    dequantize_embeddings,
     deduplicate_concepts_by_similarity,
     find_most_similar,
     is_similar_to_any,
+    EmbeddingIndex,
 )
 from database.neo4j.policies.utils.neo4j_utils import (
     test_connection,
     execute_query,
+    iter_query,
     execute_write_query,
     clear_database,
     get_node_count,
@@ -38,6 +43,9 @@ from database.neo4j.policies.utils.neo4j_utils import (
     get_database_stats,
     print_database_stats,
     batch_execute,
+    aexecute_query,
+    aget_node_count,
+    abatch_execute,
 )
 
 __all__ = [
@@ -62,12 +70,17 @@ __all__ = [
     "load_embedding_model",
     "generate_embeddings_batch",
     "compute_similarity_matrix",
+    "compute_top_k_similarities",
+    "quantize_embeddings",
+    "dequantize_embeddings",
     "deduplicate_concepts_by_similarity",
     "find_most_similar",
     "is_similar_to_any",
+    "EmbeddingIndex",
     # Neo4j operations
     "test_connection",
     "execute_query",
+    "iter_query",
     "execute_write_query",
     "clear_database",
     "get_node_count",
@@ -75,4 +88,7 @@ __all__ = [
     "get_database_stats",
     "print_database_stats",
     "batch_execute",
+    "aexecute_query",
+    "aget_node_count",
+    "abatch_execute",
 ]
\ No newline at end of file
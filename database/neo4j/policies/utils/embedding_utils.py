@@ -3,24 +3,88 @@ Embedding Utilities
 Functions for loading embedding models and computing semantic similarities.
 """
 
-import random
-from typing import List, Union
+import atexit
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import diskcache
 import numpy as np
+import torch
+from scipy.sparse import csr_matrix
 from sentence_transformers import SentenceTransformer
 
+# Rows per similarity block in deduplicate_concepts_by_similarity (bounds peak memory)
+DEDUP_BLOCK_SIZE = 1024
+
+logger = logging.getLogger(__name__)
+
+# Bytes of float32 similarity scores computed per row chunk in compute_similarity_matrix
+SIMILARITY_CHUNK_BYTES = 256 * 1024 * 1024
+
+# Similar pairs logged individually (at debug level) by deduplicate_concepts_by_similarity
+MAX_REPORTED_PAIRS = 20
+
+# Below this many texts a multi-device pool costs more to feed than it saves
+MULTI_PROCESS_MIN_TEXTS = 2000
+
+# Multi-process encode pools, kept alive per (model, devices) across calls
+_MULTI_PROCESS_POOLS: Dict[Tuple[int, Tuple[str, ...]], Tuple[SentenceTransformer, Dict[str, Any]]] = {}
+
+# SimSIMD provides SIMD dot-product kernels for single-query scoring
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+# FAISS provides inverted-file indexes for sublinear search over large candidate sets
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+# EmbeddingIndex searches sets up to this size exactly with NumPy
+EXACT_SEARCH_MAX_SIZE = 1024
+
+# Inverted lists probed per query by the FAISS IVF index
+FAISS_NPROBE = 16
+
+
+def _dot_scores(query_embedding: np.ndarray, candidate_embeddings: np.ndarray) -> np.ndarray:
+    """
+    Dot product of one query embedding against each candidate row.
+
+    Uses SimSIMD when installed, otherwise a NumPy matrix-vector product.
+    Inputs that are already contiguous float32 are used without copying.
+    """
+    query = np.ascontiguousarray(query_embedding, dtype=np.float32).reshape(1, -1)
+    candidates = np.ascontiguousarray(candidate_embeddings, dtype=np.float32)
+
+    if HAS_SIMSIMD:
+        return np.asarray(simsimd.cdist(query, candidates, metric="dot")).ravel()
+    return candidates @ query.ravel()
+
 
 def load_embedding_model(
     model_name: str = "sentence-transformers/all-mpnet-base-v2",
     device: str = "cuda",
-    trust_remote_code: bool = True
+    trust_remote_code: bool = True,
+    half_precision: bool = True
 ) -> SentenceTransformer:
     """
     Load a sentence transformer embedding model.
 
+    On CUDA the weights are cast to bfloat16 (float16 on GPUs without bf16
+    support) when half_precision is set. generate_embeddings_batch still
+    returns float32 embeddings.
+
     Args:
         model_name: Hugging Face model identifier
         device: Device to load model on ("cuda", "mps", or "cpu")
         trust_remote_code: Whether to trust remote code from Hugging Face
+        half_precision: Whether to run CUDA inference in 16-bit precision
 
     Returns:
         Loaded SentenceTransformer model
@@ -34,19 +98,97 @@ def load_embedding_model(
         device=device
     )
 
+    if half_precision and device.startswith("cuda"):
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        model = model.to(dtype)
+        print(f"Precision: {dtype}")
+
     print("Model loaded successfully")
     return model
 
 
+def _model_cache_id(model: SentenceTransformer) -> Optional[str]:
+    """
+    Identify a model for embedding cache keys, or None if it has no stable identity.
+
+    The tokenizer's load path (hub id or local directory) is always part of the
+    id: a fine-tuned model's card names its parent as base_model, so the card
+    alone would share cache entries with the parent.
+    """
+    card = getattr(model, "model_card_data", None)
+    base_model = getattr(card, "base_model", None)
+    path = getattr(getattr(model, "tokenizer", None), "name_or_path", None)
+    if not path:
+        return None
+    revision = getattr(card, "base_model_revision", None) or ""
+    dimension = model.get_sentence_embedding_dimension()
+    return f"{path}|{base_model or ''}@{revision}:{dimension}:normalized"
+
+
+def _get_multi_process_pool(model: SentenceTransformer, devices: Sequence[str]) -> Dict[str, Any]:
+    """Start (once) and return a multi-process encode pool for model over devices"""
+    key = (id(model), tuple(devices))
+    if key not in _MULTI_PROCESS_POOLS:
+        print(f"  Starting embedding pool on devices: {', '.join(devices)}")
+        pool = model.start_multi_process_pool(target_devices=list(devices))
+        _MULTI_PROCESS_POOLS[key] = (model, pool)
+    return _MULTI_PROCESS_POOLS[key][1]
+
+
+@atexit.register
+def close_multi_process_pools() -> None:
+    """Stop all multi-process encode pools started by generate_embeddings_batch"""
+    while _MULTI_PROCESS_POOLS:
+        _, (model, pool) = _MULTI_PROCESS_POOLS.popitem()
+        model.stop_multi_process_pool(pool)
+
+
+def _token_lengths(model: SentenceTransformer, texts: List[str]) -> np.ndarray:
+    """
+    Token length of each text, capped at the model's max sequence length.
+
+    Fast (Rust) tokenizers measure all texts in one batched, truncating call;
+    other tokenizers fall back to tokenizing text by text, and models without
+    a tokenizer to character length.
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+
+    max_seq_length = getattr(model, "max_seq_length", None)
+    if getattr(tokenizer, "is_fast", False):
+        encoded = tokenizer(
+            texts,
+            add_special_tokens=False,
+            truncation=bool(max_seq_length),
+            max_length=max_seq_length,
+            return_attention_mask=False,
+            return_length=True
+        )
+        return np.asarray(encoded["length"], dtype=np.int64)
+
+    lengths = np.fromiter(
+        (len(tokenizer.tokenize(text)) for text in texts), dtype=np.int64, count=len(texts)
+    )
+    if max_seq_length:
+        np.minimum(lengths, max_seq_length, out=lengths)
+    return lengths
+
+
 def generate_embeddings_batch(
     texts: Union[str, List[str]],
     model: SentenceTransformer,
     batch_size: int = 50,
     show_progress: bool = True,
-    convert_to_list: bool = True
+    convert_to_list: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    devices: Optional[Sequence[str]] = None
 ) -> Union[List, np.ndarray]:
     """
-    Generate embeddings for texts in batches.
+    Generate L2-normalized embeddings for texts in batches.
+
+    Since the embeddings have unit length, cosine similarity between them is a
+    plain dot product.
 
     Args:
         texts: Single text string or list of texts
@@ -54,73 +196,317 @@ def generate_embeddings_batch(
         batch_size: Batch size for encoding
         show_progress: Whether to print progress messages
         convert_to_list: Whether to convert embeddings to Python lists
+        cache_dir: Optional on-disk embedding cache; only texts missing from it are encoded
+        devices: Optional devices (e.g. ["cuda:0", "cuda:1"]) to shard large inputs across
 
     Returns:
         List of embeddings (if convert_to_list=True) or numpy array
     """
     # Handle single text
     if isinstance(texts, str):
-        embedding = model.encode(texts, convert_to_tensor=False)
+        embedding = np.asarray(
+            model.encode(texts, convert_to_tensor=False, normalize_embeddings=True), dtype=np.float32
+        )
         return embedding.tolist() if convert_to_list else embedding
 
-    # Batch processing for multiple texts
-    all_embeddings = []
-    total = len(texts)
+    missing = list(range(len(texts)))
+    hit_indices: List[int] = []
+    hit_vectors: List[np.ndarray] = []
+
+    # Serve cached embeddings (keyed by model and text) and only encode the misses
+    model_id = _model_cache_id(model) if cache_dir else None
+    if cache_dir and model_id is None:
+        logger.warning("Embedding cache skipped: model has no stable name or load path")
+    cache = diskcache.Cache(str(cache_dir)) if model_id is not None else None
+    if cache is not None:
+        keys = [hashlib.sha256(f"{model_id}::{text}".encode("utf-8")).hexdigest() for text in texts]
+        missing = []
+        for idx, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is None:
+                missing.append(idx)
+            else:
+                hit_indices.append(idx)
+                hit_vectors.append(np.frombuffer(cached, dtype=np.float32))
+
+        if show_progress:
+            print(f"  Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+
+    # Group texts of similar token length so batches carry little padding
+    if len(missing) > batch_size:
+        lengths = _token_lengths(model, [texts[idx] for idx in missing])
+        missing = [missing[pos] for pos in np.argsort(lengths, kind="stable")]
+
+    # Batch processing for texts not served from the cache
+    total = len(missing)
+    encoded: List[Tuple[List[int], np.ndarray]] = []
+
+    # Shard large inputs across several devices with a multi-process pool
+    if devices and len(devices) > 1 and total >= MULTI_PROCESS_MIN_TEXTS:
+        if show_progress:
+            print(f"  Embedding {total} texts across {len(devices)} devices")
+        pool = _get_multi_process_pool(model, devices)
+        pool_embeddings = model.encode(
+            [texts[idx] for idx in missing],
+            pool=pool,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        encoded.append((missing, np.asarray(pool_embeddings, dtype=np.float32)))
+        total = 0
+
+    total_batches = (total - 1) // batch_size + 1 if total else 0
+    if show_progress and total_batches:
+        print(f"  Embedding {total} texts in {total_batches} batches")
 
     for i in range(0, total, batch_size):
         batch_end = min(i + batch_size, total)
-        batch_texts = texts[i:batch_end]
+        batch_indices = missing[i:batch_end]
+        batch_texts = [texts[idx] for idx in batch_indices]
 
-        if show_progress:
-            batch_num = i // batch_size + 1
-            total_batches = (total - 1) // batch_size + 1
-            print(f"  Embedding batch {batch_num}/{total_batches} ({len(batch_texts)} texts)")
+        logger.debug("Embedding batch %d/%d (%d texts)", i // batch_size + 1, total_batches, len(batch_texts))
 
         # Batch encode
-        batch_embeddings = model.encode(
-            batch_texts,
-            convert_to_tensor=False,
-            show_progress_bar=False
+        batch_embeddings = np.asarray(
+            model.encode(
+                batch_texts, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+            ),
+            dtype=np.float32
         )
+        encoded.append((batch_indices, batch_embeddings))
+
+    if cache is not None:
+        for batch_indices, batch_embeddings in encoded:
+            for idx, emb in zip(batch_indices, batch_embeddings):
+                cache.set(keys[idx], emb.tobytes())
+        cache.close()
+
+    # Scatter cached and freshly encoded rows into one contiguous array in input order
+    if hit_vectors:
+        dim = hit_vectors[0].shape[0]
+    elif encoded:
+        dim = encoded[0][1].shape[1]
+    else:
+        dim = model.get_sentence_embedding_dimension() or 0
 
-        # Convert and store
-        if convert_to_list:
-            for emb in batch_embeddings:
-                all_embeddings.append(emb.tolist())
-        else:
-            all_embeddings.append(batch_embeddings)
+    embeddings = np.empty((len(texts), dim), dtype=np.float32)
+    if hit_indices:
+        embeddings[hit_indices] = np.stack(hit_vectors)
+    for batch_indices, batch_embeddings in encoded:
+        embeddings[batch_indices] = batch_embeddings
+
+    return embeddings.tolist() if convert_to_list else embeddings
 
-    if convert_to_list:
-        return all_embeddings
-    else:
-        return np.vstack(all_embeddings)
+
+def quantize_embeddings(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize embeddings to int8 with a per-vector absmax scale.
+
+    Args:
+        embeddings: Embedding vector (D) or matrix (N x D)
+
+    Returns:
+        (int8 values with the same shape, float32 scale per vector)
+    """
+    values = np.asarray(embeddings, dtype=np.float32)
+    scales = np.abs(values).max(axis=-1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0
+    quantized = np.round(values / scales).astype(np.int8)
+    return quantized, scales.squeeze(-1)
+
+
+def dequantize_embeddings(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    Restore float32 embeddings from quantize_embeddings output.
+
+    Args:
+        quantized: int8 values (D or N x D)
+        scales: Scale per vector (scalar or N)
+
+    Returns:
+        float32 embeddings with the same shape as quantized
+    """
+    return quantized.astype(np.float32) * np.expand_dims(np.asarray(scales, dtype=np.float32), -1)
 
 
 def compute_similarity_matrix(
     embeddings1: np.ndarray,
     embeddings2: np.ndarray,
-    model: SentenceTransformer
-) -> np.ndarray:
+    model: SentenceTransformer,
+    max_memory: int = SIMILARITY_CHUNK_BYTES,
+    top_k: Optional[int] = None,
+    return_tensors: bool = False
+) -> Union[np.ndarray, torch.Tensor, Tuple[Any, Any]]:
     """
     Compute cosine similarity matrix between two sets of embeddings.
 
+    NumPy inputs are L2-normalized row by row, so the matrix is a matrix
+    product, computed in row chunks of at most max_memory bytes into one
+    preallocated result. When only the best matches per row are needed,
+    compute_top_k_similarities avoids the dense N x M result altogether.
+    int8 embeddings from quantize_embeddings are accepted as-is: cosine
+    similarity ignores the per-vector scale.
+
+    Tensor inputs are scored with model.similarity on their own device. With
+    top_k set, rows are reduced to their best k matches before anything is
+    copied to the host, and return_tensors=True skips the host copy entirely.
+
     Args:
         embeddings1: First set of embeddings (N x D)
         embeddings2: Second set of embeddings (M x D)
-        model: SentenceTransformer model (for similarity computation)
+        model: SentenceTransformer model (used for non-NumPy inputs such as tensors)
+        max_memory: Upper bound in bytes on the scores computed per chunk
+        top_k: If set, return only the k best (scores, indices) per row, best first
+        return_tensors: Whether to return torch tensors for tensor inputs
+
+    Returns:
+        Similarity matrix (N x M), or (scores, indices) each N x k when top_k is set
+    """
+    if not (isinstance(embeddings1, np.ndarray) and isinstance(embeddings2, np.ndarray)):
+        similarities = model.similarity(embeddings1, embeddings2)
+        if not isinstance(similarities, torch.Tensor):
+            similarities = torch.as_tensor(similarities)
+
+        if top_k is not None:
+            scores, indices = similarities.topk(min(top_k, similarities.shape[1]), dim=1)
+            if return_tensors:
+                return scores, indices
+            return scores.cpu().numpy(), indices.cpu().numpy()
+
+        return similarities if return_tensors else similarities.cpu().numpy()
+
+    if top_k is not None:
+        return _chunked_top_k(embeddings1, embeddings2, top_k, max_memory)
+
+    left = _as_unit_float32(embeddings1)
+    right_t = _as_unit_float32(embeddings2).T
+    similarities = np.empty((left.shape[0], right_t.shape[1]), dtype=np.float32)
+
+    chunk = _similarity_chunk_rows(right_t.shape[1], max_memory)
+    for start in range(0, left.shape[0], chunk):
+        np.matmul(left[start:start + chunk], right_t, out=similarities[start:start + chunk])
+
+    return similarities
+
+
+def compute_top_k_similarities(
+    embeddings1: np.ndarray,
+    embeddings2: np.ndarray,
+    top_k: int = 5,
+    max_memory: int = SIMILARITY_CHUNK_BYTES
+) -> csr_matrix:
+    """
+    Keep only the top-k cosine similarities per row of embeddings1.
+
+    Scores are computed in row chunks of at most max_memory bytes and reduced
+    to their top-k immediately, so the dense N x M matrix is never built.
+
+    Args:
+        embeddings1: First set of embeddings (N x D)
+        embeddings2: Second set of embeddings (M x D)
+        top_k: Number of most similar columns to keep per row
+        max_memory: Upper bound in bytes on the scores computed per chunk
+
+    Returns:
+        Sparse N x M matrix holding the top-k similarities of each row
+    """
+    scores, indices = _chunked_top_k(embeddings1, embeddings2, top_k, max_memory)
+    n_rows, k = scores.shape
+    n_cols = embeddings2.shape[0]
+
+    indptr = np.arange(0, n_rows * k + 1, k)
+    return csr_matrix((scores.ravel(), indices.ravel(), indptr), shape=(n_rows, n_cols))
+
+
+def _chunked_top_k(
+    embeddings1: np.ndarray,
+    embeddings2: np.ndarray,
+    top_k: int,
+    max_memory: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k similarities per row, computed in row chunks of at most max_memory bytes.
+
+    Returns:
+        (scores, indices), each N x k with the best match first
+    """
+    left = _as_unit_float32(embeddings1)
+    right_t = _as_unit_float32(embeddings2).T
+    n_rows, n_cols = left.shape[0], right_t.shape[1]
+    k = min(top_k, n_cols)
+
+    indices = np.empty((n_rows, k), dtype=np.int64)
+    scores = np.empty((n_rows, k), dtype=np.float32)
+
+    chunk = _similarity_chunk_rows(n_cols, max_memory)
+    for start in range(0, n_rows, chunk):
+        block = left[start:start + chunk] @ right_t
+        if k < n_cols:
+            top = np.argpartition(block, n_cols - k, axis=1)[:, n_cols - k:]
+        else:
+            top = np.broadcast_to(np.arange(n_cols), block.shape)
+        top_scores = np.take_along_axis(block, top, axis=1)
+
+        # Order each row's k matches best first
+        order = np.argsort(-top_scores, axis=1)
+        indices[start:start + chunk] = np.take_along_axis(top, order, axis=1)
+        scores[start:start + chunk] = np.take_along_axis(top_scores, order, axis=1)
+
+    return scores, indices
+
+
+def _similarity_chunk_rows(n_cols: int, max_memory: int) -> int:
+    """Rows per chunk so that a chunk of float32 scores fits in max_memory bytes"""
+    return max(1, max_memory // (4 * max(n_cols, 1)))
+
+
+def _as_unit_float32(embeddings: np.ndarray) -> np.ndarray:
+    """float32 embeddings scaled to unit L2 norm (int8 input is cast first)"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.where(norms == 0, 1.0, norms)
+
+
+def _find_similar_pairs(
+    embeddings: np.ndarray,
+    similarity_threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find all pairs (i < j) of L2-normalized embeddings whose similarity exceeds the threshold.
+
+    Similarities are computed in blocks of DEDUP_BLOCK_SIZE rows against the
+    remaining columns, so peak memory is DEDUP_BLOCK_SIZE x N rather than N x N.
 
     Returns:
-        Similarity matrix (N x M)
+        (row indices, column indices, similarity scores) in row-major order
     """
-    similarities = model.similarity(embeddings1, embeddings2)
-    return similarities.cpu().numpy() if hasattr(similarities, 'cpu') else similarities
+    n = len(embeddings)
+    found_rows, found_cols, found_scores = [], [], []
+
+    for start in range(0, n, DEDUP_BLOCK_SIZE):
+        end = min(start + DEDUP_BLOCK_SIZE, n)
+        block = embeddings[start:end] @ embeddings[start:].T
+
+        # Keep only the upper triangle (global column > global row)
+        local_rows, local_cols = np.nonzero(block > similarity_threshold)
+        upper = local_cols > local_rows
+        local_rows, local_cols = local_rows[upper], local_cols[upper]
+
+        found_rows.append(local_rows + start)
+        found_cols.append(local_cols + start)
+        found_scores.append(block[local_rows, local_cols])
+
+    return np.concatenate(found_rows), np.concatenate(found_cols), np.concatenate(found_scores)
 
 
 def deduplicate_concepts_by_similarity(
     concepts: List[str],
     model: SentenceTransformer,
     similarity_threshold: float = 0.95,
-    verbose: bool = True
+    verbose: bool = True,
+    seed: Optional[int] = None
 ) -> List[str]:
     """
     Deduplicate concepts based on embedding similarity.
@@ -131,6 +517,7 @@ def deduplicate_concepts_by_similarity(
         model: Loaded SentenceTransformer model
         similarity_threshold: Cosine similarity threshold (0-1)
         verbose: Whether to print deduplication details
+        seed: Optional random seed so the removed member of each pair is reproducible
 
     Returns:
         Filtered list of concepts
@@ -141,41 +528,56 @@ def deduplicate_concepts_by_similarity(
     if verbose:
         print(f"Deduplicating {len(concepts)} concepts with threshold {similarity_threshold}")
 
-    # Generate embeddings
-    embeddings = model.encode(concepts)
+    # Generate unit-length embeddings so cosine similarity is a dot product
+    embeddings = np.asarray(model.encode(concepts, normalize_embeddings=True), dtype=np.float32)
 
-    # Compute similarity matrix
-    similarities = model.similarity(embeddings, embeddings)
-    similarities = similarities.cpu().numpy() if hasattr(similarities, 'cpu') else similarities
+    # Find duplicates: every pair above the threshold in the upper triangle
+    pair_rows, pair_cols, pair_scores = _find_similar_pairs(embeddings, similarity_threshold)
 
-    # Find duplicates
-    to_remove = set()
-    n = len(concepts)
+    # Randomly choose one of each pair to remove
+    coin_flips = np.random.default_rng(seed).integers(0, 2, size=pair_rows.size)
+    remove_indices = np.where(coin_flips == 0, pair_rows, pair_cols)
+    removed = np.zeros(len(concepts), dtype=bool)
+    removed[remove_indices] = True
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            if similarities[i][j] > similarity_threshold:
-                # Randomly choose one to remove
-                remove_idx = random.choice([i, j])
-                to_remove.add(remove_idx)
-
-                if verbose:
-                    print(f"Similar pair: '{concepts[i]}' vs '{concepts[j]}' (similarity: {similarities[i][j]:.4f})")
-                    print(f"  -> Removing: '{concepts[remove_idx]}'")
+    if verbose:
+        print(f"Found {pair_rows.size} similar pairs")
+
+    # Individual pairs only at debug level (capped), off the default output path
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, j, remove_idx, score in zip(
+            pair_rows[:MAX_REPORTED_PAIRS].tolist(),
+            pair_cols[:MAX_REPORTED_PAIRS].tolist(),
+            remove_indices[:MAX_REPORTED_PAIRS].tolist(),
+            pair_scores[:MAX_REPORTED_PAIRS].tolist()
+        ):
+            logger.debug(
+                "Similar pair: '%s' vs '%s' (similarity: %.4f) -> removing '%s'",
+                concepts[i], concepts[j], score, concepts[remove_idx]
+            )
 
     # Filter concepts
-    filtered_concepts = [
-        concept for i, concept in enumerate(concepts)
-        if i not in to_remove
-    ]
+    filtered_concepts = [concepts[i] for i in np.flatnonzero(~removed).tolist()]
 
     if verbose:
         print(f"\nDeduplication result: {len(concepts)} -> {len(filtered_concepts)} concepts")
-        print(f"Removed {len(to_remove)} similar concepts")
+        print(f"Removed {len(concepts) - len(filtered_concepts)} similar concepts")
 
     return filtered_concepts
 
 
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k highest scores, best first, without sorting all scores"""
+    top_k = min(top_k, scores.shape[0])
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if top_k < scores.shape[0]:
+        candidates = np.argpartition(scores, scores.shape[0] - top_k)[-top_k:]
+    else:
+        candidates = np.arange(scores.shape[0])
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
 def find_most_similar(
     query_embedding: np.ndarray,
     candidate_embeddings: np.ndarray,
@@ -185,9 +587,13 @@ def find_most_similar(
     """
     Find top-k most similar candidates to a query embedding.
 
+    The query is L2-normalized before the dot product, so scores are cosine
+    similarities as long as the candidates are L2-normalized (as returned by
+    generate_embeddings_batch).
+
     Args:
         query_embedding: Query embedding vector
-        candidate_embeddings: Matrix of candidate embeddings (N x D)
+        candidate_embeddings: Matrix of L2-normalized candidate embeddings (N x D)
         candidates: List of candidate strings
         top_k: Number of top results to return
 
@@ -195,13 +601,10 @@ def find_most_similar(
         List of (candidate, similarity_score) tuples
     """
     # Compute similarities
-    similarities = np.dot(
-        query_embedding.reshape(1, -1),
-        candidate_embeddings.T
-    ).flatten()
+    similarities = _dot_scores(_as_unit_float32(query_embedding), candidate_embeddings)
 
     # Get top-k indices
-    top_indices = np.argsort(similarities)[::-1][:top_k]
+    top_indices = _top_k_indices(similarities, top_k)
 
     # Return (candidate, score) tuples
     results = [
@@ -221,9 +624,11 @@ def is_similar_to_any(
     """
     Check if a new embedding is similar to any existing embeddings.
 
+    The new embedding is L2-normalized before scoring, as in find_most_similar.
+
     Args:
         new_embedding: New embedding vector to check
-        existing_embeddings: Matrix of existing embeddings (N x D)
+        existing_embeddings: Matrix of L2-normalized existing embeddings (N x D)
         existing_concepts: List of concept strings corresponding to embeddings
         similarity_threshold: Similarity threshold for matching
 
@@ -234,10 +639,7 @@ def is_similar_to_any(
         return False, None, 0.0
 
     # Compute similarities
-    similarities = np.dot(
-        new_embedding.reshape(1, -1),
-        existing_embeddings.T
-    ).flatten()
+    similarities = _dot_scores(_as_unit_float32(new_embedding), existing_embeddings)
 
     # Find maximum similarity
     max_idx = np.argmax(similarities)
@@ -246,4 +648,108 @@ def is_similar_to_any(
     if max_similarity >= similarity_threshold:
         return True, existing_concepts[max_idx], max_similarity
     else:
-        return False, None, max_similarity
\ No newline at end of file
+        return False, None, max_similarity
+
+
+class EmbeddingIndex:
+    """
+    Reusable similarity index over a fixed set of L2-normalized embeddings.
+
+    Build it once per candidate set and query it many times. Sets larger than
+    EXACT_SEARCH_MAX_SIZE use a FAISS IVF index (inner product) when FAISS is
+    installed, which searches FAISS_NPROBE inverted lists instead of scoring
+    every candidate; smaller sets, or installs without FAISS, are searched
+    exactly with NumPy.
+    """
+
+    def __init__(self, embeddings: np.ndarray, labels: Optional[List[str]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            embeddings: Matrix of L2-normalized embeddings (N x D)
+            labels: Optional strings corresponding to the embeddings
+        """
+        self.embeddings = np.ascontiguousarray(_as_unit_float32(np.asarray(embeddings)))
+        self.labels = labels
+        self.faiss_index = None
+
+        n, dim = self.embeddings.shape
+        if HAS_FAISS and n > EXACT_SEARCH_MAX_SIZE:
+            nlist = max(1, int(np.sqrt(n)))
+            quantizer = faiss.IndexFlatIP(dim)
+            self.faiss_index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+            self.faiss_index.train(self.embeddings)
+            self.faiss_index.add(self.embeddings)
+            self.faiss_index.nprobe = min(FAISS_NPROBE, nlist)
+
+    def __len__(self) -> int:
+        return self.embeddings.shape[0]
+
+    def search(self, query_embeddings: np.ndarray, top_k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the top-k most similar embeddings for each query.
+
+        Queries are L2-normalized first, so scores are cosine similarities.
+
+        Args:
+            query_embeddings: One query vector (D) or a matrix of queries (Q x D)
+            top_k: Number of neighbours per query
+
+        Returns:
+            (similarity scores, indices), each Q x k with the best match first;
+            indices of -1 mark missing results from the approximate index
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(-1, self.embeddings.shape[1])
+        queries = np.ascontiguousarray(_as_unit_float32(queries))
+        top_k = min(top_k, len(self))
+
+        if self.faiss_index is not None:
+            return self.faiss_index.search(queries, top_k)
+
+        scores = queries @ self.embeddings.T
+        indices = np.empty((len(queries), top_k), dtype=np.intp)
+        for row, row_scores in enumerate(scores):
+            indices[row] = _top_k_indices(row_scores, top_k)
+        return np.take_along_axis(scores, indices, axis=1), indices
+
+    def find_most_similar(self, query_embedding: np.ndarray, top_k: int = 5) -> List[tuple]:
+        """
+        Find top-k most similar labels to a query embedding.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of top results to return
+
+        Returns:
+            List of (label, similarity_score) tuples; the label is the row index
+            when the index was built without labels
+        """
+        scores, indices = self.search(query_embedding, top_k)
+        return [
+            (self.labels[idx] if self.labels is not None else idx, float(score))
+            for idx, score in zip(indices[0].tolist(), scores[0].tolist())
+            if idx >= 0
+        ]
+
+    def is_similar_to_any(self, new_embedding: np.ndarray, similarity_threshold: float = 0.8) -> tuple:
+        """
+        Check if a new embedding is similar to any indexed embedding.
+
+        Args:
+            new_embedding: New embedding vector to check
+            similarity_threshold: Similarity threshold for matching
+
+        Returns:
+            (is_similar: bool, matched_label: str or None, max_similarity: float)
+        """
+        if len(self) == 0:
+            return False, None, 0.0
+
+        scores, indices = self.search(new_embedding, 1)
+        max_idx, max_similarity = int(indices[0, 0]), float(scores[0, 0])
+
+        if max_idx >= 0 and max_similarity >= similarity_threshold:
+            return True, self.labels[max_idx] if self.labels is not None else None, max_similarity
+        else:
+            return False, None, max_similarity
@@ -3,16 +3,59 @@ File Utilities
 Helper functions for file I/O operations (JSON, pickle, text).
 """
 
+import fnmatch
 import json
+import logging
+import os
 import pickle
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+import diskcache
+
+# orjson parses and serializes JSON natively; json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# ijson streams items out of large JSON arrays without loading them whole
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on threads used to read the files of a directory concurrently
+FILE_LOAD_WORKERS = 32
+
+# Threads (and so batch files held in memory) when ingesting into a results index
+INDEX_LOAD_WORKERS = 4
+
+# Subdirectory of a batch directory holding its consolidated results index
+RESULTS_INDEX_DIR = "_results_index"
+
+# Suffix of the sidecar file holding out-of-band pickle buffers (e.g. array data)
+PICKLE_BUFFER_SUFFIX = ".buf"
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Whether an encoding name refers to plain UTF-8 (what orjson reads and writes)"""
+    return encoding.lower().replace('-', '').replace('_', '') == 'utf8'
 
 
 def load_json(file_path: Union[str, Path], encoding: str = 'utf-8') -> Any:
     """
     Load JSON data from a file.
 
+    UTF-8 files are parsed with orjson when it is installed.
+
     Args:
         file_path: Path to JSON file
         encoding: File encoding (default: utf-8)
@@ -21,6 +64,9 @@ def load_json(file_path: Union[str, Path], encoding: str = 'utf-8') -> Any:
         Parsed JSON data
     """
     file_path = Path(file_path)
+    if HAS_ORJSON and _is_utf8(encoding):
+        return orjson.loads(file_path.read_bytes())
+
     with open(file_path, 'r', encoding=encoding) as f:
         return json.load(f)
 
@@ -35,6 +81,12 @@ def save_json(
     """
     Save data to a JSON file.
 
+    Uses orjson when it is installed and the options allow it (UTF-8 output,
+    no indent or an indent of 2, no ASCII escaping); otherwise falls back to json.
+    On the orjson path, NaN and Infinity floats are written as null (standard
+    JSON has no literal for them), where json writes the non-standard NaN and
+    Infinity tokens.
+
     Args:
         data: Data to save
         file_path: Output file path
@@ -45,24 +97,66 @@ def save_json(
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, 'w', encoding=encoding) as f:
-        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+    if HAS_ORJSON and _is_utf8(encoding) and not ensure_ascii and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        file_path.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(file_path, 'w', encoding=encoding) as f:
+            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
 
     print(f"Saved JSON to: {file_path}")
 
 
+def _load_files_parallel(
+    files: List[Path],
+    loader: Callable[[Path], Any],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[Path, Any, Optional[Exception]]]:
+    """
+    Load files on a thread pool, yielding (file, data, error) in input order.
+
+    Reads overlap across threads; a file that fails to load yields its
+    exception instead of data so callers can decide how to handle it.
+    At most one read per worker is in flight or waiting to be consumed, so a
+    slow consumer does not let loaded files pile up in memory.
+    """
+    def load(file_path: Path) -> Tuple[Path, Any, Optional[Exception]]:
+        try:
+            return file_path, loader(file_path), None
+        except Exception as e:
+            return file_path, None, e
+
+    workers = min(max_workers or FILE_LOAD_WORKERS, len(files)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Sliding window: submit the next read as each result is consumed
+        remaining = iter(files)
+        pending = deque(executor.submit(load, f) for f in islice(remaining, workers))
+        while pending:
+            result = pending.popleft().result()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                pending.append(executor.submit(load, next_file))
+            yield result
+
+
 def load_json_directory(
     directory: Union[str, Path],
     pattern: str = "*.json",
-    encoding: str = 'utf-8'
+    encoding: str = 'utf-8',
+    max_workers: Optional[int] = None
 ) -> List[Any]:
     """
     Load all JSON files from a directory matching a pattern.
 
+    Files are read concurrently and combined in sorted filename order.
+
     Args:
         directory: Directory path
         pattern: Glob pattern for matching files (default: *.json)
         encoding: File encoding (default: utf-8)
+        max_workers: Threads used to read files (default: FILE_LOAD_WORKERS)
 
     Returns:
         List of loaded JSON data from all files
@@ -70,14 +164,17 @@ def load_json_directory(
     directory = Path(directory)
     all_data = []
 
-    for json_file in directory.glob(pattern):
-        with open(json_file, 'r', encoding=encoding) as f:
-            data = json.load(f)
-            # Handle both single items and lists
-            if isinstance(data, list):
-                all_data.extend(data)
-            else:
-                all_data.append(data)
+    json_files = list_files(directory, pattern)
+    for json_file, data, error in _load_files_parallel(
+        json_files, lambda f: load_json(f, encoding=encoding), max_workers
+    ):
+        if error is not None:
+            raise error
+        # Handle both single items and lists
+        if isinstance(data, list):
+            all_data.extend(data)
+        else:
+            all_data.append(data)
 
     print(f"Loaded {len(all_data)} items from {directory}")
     return all_data
@@ -87,6 +184,9 @@ def load_pickle(file_path: Union[str, Path]) -> Any:
     """
     Load data from a pickle file.
 
+    If the file was saved with out_of_band=True, its buffers are read from the
+    sidecar file in one pass and handed to the unpickler without further copies.
+
     Args:
         file_path: Path to pickle file
 
@@ -94,27 +194,59 @@ def load_pickle(file_path: Union[str, Path]) -> Any:
         Unpickled data
     """
     file_path = Path(file_path)
+    buffer_path = file_path.with_name(file_path.name + PICKLE_BUFFER_SUFFIX)
+
+    buffers = _read_pickle_buffers(buffer_path) if buffer_path.is_file() else None
     with open(file_path, 'rb') as f:
-        return pickle.load(f)
+        return pickle.load(f, buffers=buffers)
+
+
+def _read_pickle_buffers(buffer_path: Path) -> List[memoryview]:
+    """Split a sidecar file written by save_pickle into its buffers"""
+    with open(buffer_path, 'rb') as f:
+        (count,) = struct.unpack('<Q', f.read(8))
+        sizes = struct.unpack(f'<{count}Q', f.read(8 * count))
+        # Read straight into one preallocated buffer; the returned views share it
+        data = memoryview(bytearray(sum(sizes)))
+        if f.readinto(data) != len(data):
+            raise EOFError(f"Truncated pickle buffer file: {buffer_path}")
+
+    buffers, offset = [], 0
+    for size in sizes:
+        buffers.append(data[offset:offset + size])
+        offset += size
+    return buffers
 
 
 def load_pickle_directory(
     directory: Union[str, Path],
-    pattern: str = "*.pkl"
-) -> Dict[str, Any]:
+    pattern: str = "*.pkl",
+    max_workers: Optional[int] = None,
+    lazy: bool = False
+) -> Mapping[str, Any]:
     """
     Load all pickle files from a directory and aggregate their results.
 
     Expects pickle files with structure: {metadata: {...}, results: {...}}
     where 'results' is a dictionary with IDs as keys.
     Merges all 'results' dicts from each batch file into a single aggregated dict.
+    Batch files are read concurrently and merged in sorted filename order.
+
+    With lazy=True the results are consolidated into an on-disk index
+    (RESULTS_INDEX_DIR inside the directory) and returned as a dict-like
+    diskcache.Index that loads values on access. Later calls only ingest
+    batch files added since the last call; the index is rebuilt if an
+    ingested file changed or disappeared.
 
     Args:
         directory: Directory path containing pickle batch files
         pattern: Glob pattern for matching files (default: *.pkl)
+        max_workers: Threads used to read batch files (default: FILE_LOAD_WORKERS,
+            or INDEX_LOAD_WORKERS with lazy=True)
+        lazy: Whether to return the on-disk index instead of a dict (default: False)
 
     Returns:
-        Aggregated dictionary of all results: {id: result_dict}
+        Aggregated dictionary (or index) of all results: {id: result_dict}
         Returns empty dict if no files found or directory doesn't exist.
 
     Example:
@@ -131,7 +263,7 @@ def load_pickle_directory(
         return aggregated_results
 
     # Find all pickle files matching pattern
-    pkl_files = sorted(directory.glob(pattern))
+    pkl_files = list_files(directory, pattern)
 
     if not pkl_files:
         print(f"Warning: No pickle files found in {directory}")
@@ -139,48 +271,127 @@ def load_pickle_directory(
 
     print(f"Loading {len(pkl_files)} pickle batch files from {directory}")
 
-    for pkl_file in pkl_files:
-        try:
-            batch_data = load_pickle(pkl_file)
-
-            # Handle both dict structure (with 'results' key) and direct results
-            if isinstance(batch_data, dict) and 'results' in batch_data:
-                batch_results = batch_data['results']
-            elif isinstance(batch_data, dict):
-                # Assume the entire dict is the results
-                batch_results = batch_data
-            else:
-                print(f"Warning: Unexpected structure in {pkl_file.name} - skipping")
-                continue
+    if lazy:
+        return _load_pickle_index(directory, pkl_files, max_workers)
 
-            # Merge into aggregated dict (keys should be unique across batches)
-            if not isinstance(batch_results, dict):
-                print(f"Warning: Results in {pkl_file.name} are not a dict - skipping")
-                continue
+    for pkl_file, batch_data, error in _load_files_parallel(pkl_files, load_pickle, max_workers):
+        if error is not None:
+            logger.error("Error loading %s: %s", pkl_file.name, error)
+            continue
 
+        batch_results = _batch_results(pkl_file, batch_data)
+        if batch_results is not None:
+            # Merge into aggregated dict (keys should be unique across batches)
             aggregated_results.update(batch_results)
 
-        except Exception as e:
-            print(f"Error loading {pkl_file.name}: {e}")
-            continue
-
     print(f"Successfully loaded {len(aggregated_results)} total results from {len(pkl_files)} batch files")
     return aggregated_results
 
 
-def save_pickle(data: Any, file_path: Union[str, Path]):
+def _batch_results(pkl_file: Path, batch_data: Any) -> Optional[Dict[str, Any]]:
+    """Extract the results dict of one batch file, or None (with a warning) if malformed"""
+    # Handle both dict structure (with 'results' key) and direct results
+    if isinstance(batch_data, dict) and 'results' in batch_data:
+        batch_results = batch_data['results']
+    elif isinstance(batch_data, dict):
+        # Assume the entire dict is the results
+        batch_results = batch_data
+    else:
+        logger.warning("Unexpected structure in %s - skipping", pkl_file.name)
+        return None
+
+    if not isinstance(batch_results, dict):
+        logger.warning("Results in %s are not a dict - skipping", pkl_file.name)
+        return None
+
+    return batch_results
+
+
+def _load_pickle_index(
+    directory: Path,
+    pkl_files: List[Path],
+    max_workers: Optional[int] = None
+) -> diskcache.Index:
     """
-    Save data to a pickle file.
+    Bring the consolidated results index of a batch directory up to date.
+
+    A manifest of ingested files (size and mtime) decides which batch files
+    still need to be read. Batch files are read INDEX_LOAD_WORKERS at a time
+    (unless max_workers is given) so only a few are held in memory while
+    earlier ones are written to the index. The manifest is replaced atomically.
+    """
+    index_dir = directory / RESULTS_INDEX_DIR
+    manifest_path = index_dir / "manifest.json"
+    index = diskcache.Index(str(index_dir))
+
+    current = {}
+    for pkl_file in pkl_files:
+        stat = pkl_file.stat()
+        current[pkl_file.name] = [stat.st_size, stat.st_mtime_ns]
+
+    ingested = json.loads(manifest_path.read_text()) if manifest_path.is_file() else {}
+    if any(current.get(name) != signature for name, signature in ingested.items()):
+        print(f"Batch files changed since last index build - rebuilding {index_dir}")
+        index.clear()
+        ingested = {}
+
+    new_files = [pkl_file for pkl_file in pkl_files if pkl_file.name not in ingested]
+    for pkl_file, batch_data, error in _load_files_parallel(
+        new_files, load_pickle, max_workers or INDEX_LOAD_WORKERS
+    ):
+        if error is not None:
+            logger.error("Error loading %s: %s", pkl_file.name, error)
+            continue
+
+        batch_results = _batch_results(pkl_file, batch_data)
+        if batch_results is not None:
+            index.update(batch_results)
+            ingested[pkl_file.name] = current[pkl_file.name]
+
+    # Write the manifest via a temp file so an interrupted run never leaves it truncated
+    tmp_manifest = manifest_path.with_name(manifest_path.name + '.tmp')
+    tmp_manifest.write_text(json.dumps(ingested))
+    os.replace(tmp_manifest, manifest_path)
+    print(f"Results index holds {len(index)} results ({len(new_files)} batch files ingested)")
+    return index
+
+
+def save_pickle(data: Any, file_path: Union[str, Path], out_of_band: bool = False):
+    """
+    Save data to a pickle file using pickle protocol 5.
+
+    With out_of_band=True, large buffers such as NumPy array data are written
+    to a sidecar file (file_path + PICKLE_BUFFER_SUFFIX) straight from memory
+    instead of being copied into the pickle stream. load_pickle picks the
+    sidecar up automatically.
 
     Args:
         data: Data to pickle
         file_path: Output file path
+        out_of_band: Whether to store buffers in a sidecar file (default: False)
     """
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    buffer_path = file_path.with_name(file_path.name + PICKLE_BUFFER_SUFFIX)
 
+    buffers: List[pickle.PickleBuffer] = []
     with open(file_path, 'wb') as f:
-        pickle.dump(data, f)
+        pickle.dump(
+            data,
+            f,
+            protocol=5,
+            buffer_callback=buffers.append if out_of_band else None
+        )
+
+    if buffers:
+        views = [buffer.raw() for buffer in buffers]
+        with open(buffer_path, 'wb') as f:
+            f.write(struct.pack(f'<Q{len(views)}Q', len(views), *(view.nbytes for view in views)))
+            for view in views:
+                f.write(view)
+    elif buffer_path.exists():
+        # Drop a stale sidecar from an earlier out-of-band save
+        buffer_path.unlink()
 
     print(f"Saved pickle to: {file_path}")
 
@@ -246,22 +457,41 @@ def list_files(
     """
     List files in a directory matching a pattern.
 
+    Filename patterns are matched during an os.scandir walk, so file/directory
+    checks come from the directory listing instead of a separate stat per
+    entry. Patterns with a path component (e.g. "sub/*.json" or "**/x") go
+    through Path.glob / Path.rglob. As with Path.rglob, symlinked directories
+    are not followed when recursing.
+
     Args:
         directory: Directory path
         pattern: Glob pattern (default: *)
         recursive: Whether to search recursively (default: False)
 
     Returns:
-        List of Path objects
+        Sorted list of Path objects
     """
-    directory = Path(directory)
+    if "/" in pattern or os.sep in pattern:
+        directory = Path(directory)
+        files = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        return sorted(f for f in files if f.is_file())
 
-    if recursive:
-        files = list(directory.rglob(pattern))
-    else:
-        files = list(directory.glob(pattern))
+    matches = []
+    pending = [os.fspath(directory)]
 
-    return sorted([f for f in files if f.is_file()])
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                        matches.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+    return sorted(Path(path) for path in matches)
 
 
 def get_file_size_mb(file_path: Union[str, Path]) -> float:
@@ -287,20 +517,51 @@ def merge_json_files(
     """
     Merge multiple JSON files into a single file.
 
+    The output array is written item by item (one item per line), and array
+    inputs are streamed with ijson when it is installed, so memory use stays
+    bounded by the largest item rather than the total input size.
+
     Args:
         input_files: List of input JSON file paths
         output_file: Output file path
         encoding: File encoding (default: utf-8)
     """
-    merged_data = []
-
-    for file_path in input_files:
-        data = load_json(file_path, encoding=encoding)
-        if isinstance(data, list):
-            merged_data.extend(data)
-        else:
-            merged_data.append(data)
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    total_items = 0
+
+    with open(output_file, 'w', encoding=encoding) as out:
+        out.write('[')
+        for file_path in input_files:
+            for item in _iter_json_items(file_path, encoding):
+                out.write(',\n  ' if total_items else '\n  ')
+                out.write(_dumps_compact(item))
+                total_items += 1
+        out.write('\n]' if total_items else ']')
 
-    save_json(merged_data, output_file, encoding=encoding)
     print(f"Merged {len(input_files)} files into {output_file}")
-    print(f"Total items: {len(merged_data)}")
+    print(f"Total items: {total_items}")
+
+
+def _iter_json_items(file_path: Union[str, Path], encoding: str = 'utf-8') -> Iterator[Any]:
+    """Yield the items of a JSON array file, or the single value of any other JSON file"""
+    if HAS_IJSON and _is_utf8(encoding):
+        with open(file_path, 'rb') as f:
+            head = f.read(64).lstrip()
+            f.seek(0)
+            if head.startswith(b'['):
+                yield from ijson.items(f, 'item', use_float=True)
+                return
+
+    data = load_json(file_path, encoding=encoding)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def _dumps_compact(item: Any) -> str:
+    """Serialize one JSON value on a single line"""
+    if HAS_ORJSON:
+        return orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(item, ensure_ascii=False)
@@ -3,8 +3,31 @@ Neo4j Utilities
 Helper functions for Neo4j database operations.
 """
 
-from typing import Dict, List, Any
-from neo4j import GraphDatabase
+import os
+from typing import Dict, Iterator, List, Any, Optional
+from neo4j import AsyncGraphDatabase, GraphDatabase
+from neo4j.exceptions import ClientError
+
+# Database used when callers don't name one and NEO4J_DATABASE is unset; naming
+# it saves the driver a round trip to resolve the server's home database on
+# every new session
+DEFAULT_DATABASE = "neo4j"
+
+# UNWIND batches committed together by batch_execute
+BATCHES_PER_TRANSACTION = 10
+
+# Nodes detach-deleted per transaction by clear_database
+CLEAR_BATCH_SIZE = 10000
+
+
+def _resolve_database(database: Optional[str]) -> str:
+    """
+    Database to open a session on.
+
+    NEO4J_DATABASE is read on every call rather than at import, so a .env
+    loaded after this module is imported still applies.
+    """
+    return database or os.environ.get("NEO4J_DATABASE") or DEFAULT_DATABASE
 
 
 def test_connection(uri: str, username: str, password: str, database: str) -> bool:
@@ -22,7 +45,7 @@ def test_connection(uri: str, username: str, password: str, database: str) -> bo
     """
     try:
         driver = GraphDatabase.driver(uri, auth=(username, password))
-        with driver.session(database=database) as session:
+        with driver.session(database=_resolve_database(database)) as session:
             result = session.run("RETURN 'Connection OK' AS message")
             message = result.single()['message']
             print(f"✅ Neo4j connection successful: {message}")
@@ -46,14 +69,39 @@ def execute_query(
         driver: Neo4j driver instance
         query: Cypher query string
         parameters: Query parameters
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         List of result dictionaries
     """
-    with driver.session(database=database) as session:
-        result = session.run(query, parameters or {})
-        return [record.data() for record in result]
+    return list(iter_query(driver, query, parameters, database))
+
+
+def iter_query(
+    driver: GraphDatabase.driver,
+    query: str,
+    parameters: Dict[str, Any] = None,
+    database: str = None
+) -> Iterator[Dict]:
+    """
+    Execute a Cypher query and yield results as the driver fetches them.
+
+    Records are pulled lazily, so the first row is available before the whole
+    result has arrived and memory stays constant for large results. The
+    session stays open until the iterator is exhausted or closed.
+
+    Args:
+        driver: Neo4j driver instance
+        query: Cypher query string
+        parameters: Query parameters
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
+
+    Yields:
+        Result dictionaries
+    """
+    with driver.session(database=_resolve_database(database)) as session:
+        for record in session.run(query, parameters or {}):
+            yield record.data()
 
 
 def execute_write_query(
@@ -69,12 +117,12 @@ def execute_write_query(
         driver: Neo4j driver instance
         query: Cypher query string
         parameters: Query parameters
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         Query statistics dictionary
     """
-    with driver.session(database=database) as session:
+    with driver.session(database=_resolve_database(database)) as session:
         result = session.run(query, parameters or {})
         summary = result.consume()
         return {
@@ -91,19 +139,46 @@ def clear_database(driver: GraphDatabase.driver, database: str = None):
     """
     Clear all nodes and relationships from the database.
 
+    Nodes are detach-deleted CLEAR_BATCH_SIZE at a time, via
+    apoc.periodic.iterate when APOC is installed and a plain LIMIT loop
+    otherwise (or when APOC reports failed batches), so memory use stays
+    bounded however large the graph is.
+
     WARNING: This operation is irreversible!
 
     Args:
         driver: Neo4j driver instance
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
     """
     print("⚠️  Clearing database...")
 
-    with driver.session(database=database) as session:
-        # Delete all relationships first
-        session.run("MATCH ()-[r]->() DELETE r")
-        # Then delete all nodes
-        session.run("MATCH (n) DELETE n")
+    with driver.session(database=_resolve_database(database)) as session:
+        try:
+            record = session.run(
+                "CALL apoc.periodic.iterate("
+                "'MATCH (n) RETURN n', 'DETACH DELETE n', "
+                "{batchSize: $batch_size, parallel: false}) "
+                "YIELD failedOperations, errorMessages "
+                "RETURN failedOperations, errorMessages",
+                {"batch_size": CLEAR_BATCH_SIZE}
+            ).single()
+            cleared = not record["failedOperations"]
+            if not cleared:
+                # Failed batches (e.g. on a memory limit) leave nodes behind
+                print(f"⚠️  {record['failedOperations']:,} deletes failed: "
+                      f"{dict(record['errorMessages'])}; retrying in batches")
+        except ClientError as e:
+            if e.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+                raise
+            cleared = False
+
+        if not cleared:
+            while session.run(
+                "MATCH (n) WITH n LIMIT $batch_size DETACH DELETE n "
+                "RETURN count(*) AS deleted",
+                {"batch_size": CLEAR_BATCH_SIZE}
+            ).single()["deleted"]:
+                pass
 
     print("✅ Database cleared")
 
@@ -119,12 +194,12 @@ def get_node_count(
     Args:
         driver: Neo4j driver instance
         label: Node label to filter by (optional)
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         Number of nodes
     """
-    with driver.session(database=database) as session:
+    with driver.session(database=_resolve_database(database)) as session:
         if label:
             query = f"MATCH (n:{label}) RETURN count(n) AS count"
         else:
@@ -145,12 +220,12 @@ def get_relationship_count(
     Args:
         driver: Neo4j driver instance
         rel_type: Relationship type to filter by (optional)
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         Number of relationships
     """
-    with driver.session(database=database) as session:
+    with driver.session(database=_resolve_database(database)) as session:
         if rel_type:
             query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) AS count"
         else:
@@ -164,39 +239,90 @@ def get_database_stats(driver: GraphDatabase.driver, database: str = None) -> Di
     """
     Get comprehensive database statistics.
 
+    Uses apoc.meta.stats() (one round trip, served from the count store) when
+    APOC is installed; otherwise one query fetches the label and relationship
+    type names and a second UNION ALL query counts all of them.
+
     Args:
         driver: Neo4j driver instance
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         Dictionary with database statistics
     """
+    try:
+        record = next(iter_query(
+            driver,
+            "CALL apoc.meta.stats() YIELD nodeCount, relCount, labels, relTypesCount "
+            "RETURN nodeCount, relCount, labels, relTypesCount",
+            database=database
+        ))
+        return {
+            "total_nodes": record["nodeCount"],
+            "total_relationships": record["relCount"],
+            "node_counts_by_label": dict(record["labels"]),
+            "relationship_counts_by_type": dict(record["relTypesCount"])
+        }
+    except ClientError as e:
+        if e.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+            raise
+
+    labels: List[str] = []
+    rel_types: List[str] = []
+    for record in iter_query(
+        driver,
+        "CALL db.labels() YIELD label RETURN 'label' AS kind, label AS name "
+        "UNION ALL "
+        "CALL db.relationshipTypes() YIELD relationshipType "
+        "RETURN 'rel_type' AS kind, relationshipType AS name",
+        database=database
+    ):
+        (labels if record["kind"] == "label" else rel_types).append(record["name"])
+
+    # Each branch is a count-store lookup; names are passed as parameters and
+    # only interpolated (escaped) where Cypher requires a literal label or type
+    branches = [
+        "MATCH (n) RETURN 'total' AS kind, 'nodes' AS name, count(n) AS count",
+        "MATCH ()-[r]->() RETURN 'total' AS kind, 'relationships' AS name, count(r) AS count",
+    ]
+    branches += [
+        f"MATCH (n:{_quote_name(label)}) "
+        f"RETURN 'label' AS kind, $labels[{i}] AS name, count(n) AS count"
+        for i, label in enumerate(labels)
+    ]
+    branches += [
+        f"MATCH ()-[r:{_quote_name(rel_type)}]->() "
+        f"RETURN 'rel_type' AS kind, $rel_types[{i}] AS name, count(r) AS count"
+        for i, rel_type in enumerate(rel_types)
+    ]
+
     stats = {
-        "total_nodes": get_node_count(driver, database=database),
-        "total_relationships": get_relationship_count(driver, database=database)
+        "total_nodes": 0,
+        "total_relationships": 0,
+        "node_counts_by_label": {},
+        "relationship_counts_by_type": {}
     }
+    by_kind = {
+        "label": stats["node_counts_by_label"],
+        "rel_type": stats["relationship_counts_by_type"]
+    }
+    for record in iter_query(
+        driver,
+        " UNION ALL ".join(branches),
+        {"labels": labels, "rel_types": rel_types},
+        database=database
+    ):
+        if record["kind"] == "total":
+            stats[f"total_{record['name']}"] = record["count"]
+        else:
+            by_kind[record["kind"]][record["name"]] = record["count"]
 
-    # Get node counts by label
-    with driver.session(database=database) as session:
-        result = session.run("CALL db.labels()")
-        labels = [record['label'] for record in result]
-
-    stats["node_counts_by_label"] = {}
-    for label in labels:
-        count = get_node_count(driver, label=label, database=database)
-        stats["node_counts_by_label"][label] = count
-
-    # Get relationship counts by type
-    with driver.session(database=database) as session:
-        result = session.run("CALL db.relationshipTypes()")
-        rel_types = [record['relationshipType'] for record in result]
+    return stats
 
-    stats["relationship_counts_by_type"] = {}
-    for rel_type in rel_types:
-        count = get_relationship_count(driver, rel_type=rel_type, database=database)
-        stats["relationship_counts_by_type"][rel_type] = count
 
-    return stats
+def _quote_name(name: str) -> str:
+    """Backtick-quote a label or relationship type for use in a Cypher pattern"""
+    return "`" + name.replace("`", "``") + "`"
 
 
 def print_database_stats(driver: GraphDatabase.driver, database: str = None):
@@ -205,7 +331,7 @@ def print_database_stats(driver: GraphDatabase.driver, database: str = None):
 
     Args:
         driver: Neo4j driver instance
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
     """
     stats = get_database_stats(driver, database=database)
 
@@ -236,26 +362,137 @@ def batch_execute(
     """
     Execute a query in batches using UNWIND.
 
+    Every BATCHES_PER_TRANSACTION batches share one managed write transaction,
+    so commits happen less often while transaction size stays bounded.
+
     Args:
         driver: Neo4j driver instance
         query: Cypher query with $batch parameter
         data: List of data dictionaries
         batch_size: Size of each batch
-        database: Database name (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
 
     Returns:
         Total number of items processed
     """
     total = len(data)
     processed = 0
+    group_size = batch_size * BATCHES_PER_TRANSACTION
+
+    def run_batches(tx, batches: List[List[Dict]]):
+        for batch in batches:
+            tx.run(query, {"batch": batch}).consume()
+
+    with driver.session(database=_resolve_database(database)) as session:
+        for i in range(0, total, group_size):
+            batches = [
+                data[j:j + batch_size]
+                for j in range(i, min(i + group_size, total), batch_size)
+            ]
+            session.execute_write(run_batches, batches)
+            processed += sum(len(batch) for batch in batches)
+
+            if processed % group_size == 0:
+                print(f"  Processed {processed:,} / {total:,} items")
+
+    return processed
 
-    with driver.session(database=database) as session:
-        for i in range(0, total, batch_size):
-            batch = data[i:i + batch_size]
-            session.run(query, {"batch": batch})
-            processed += len(batch)
 
-            if processed % (batch_size * 10) == 0:
+# Async variants for callers running on an event loop; they take a driver from
+# AsyncGraphDatabase.driver() and mirror the sync helpers above.
+
+async def aexecute_query(
+    driver: AsyncGraphDatabase.driver,
+    query: str,
+    parameters: Dict[str, Any] = None,
+    database: str = None
+) -> List[Dict]:
+    """
+    Execute a Cypher query without blocking the event loop.
+
+    Args:
+        driver: Async Neo4j driver instance
+        query: Cypher query string
+        parameters: Query parameters
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
+
+    Returns:
+        List of result dictionaries
+    """
+    async with driver.session(database=_resolve_database(database)) as session:
+        result = await session.run(query, parameters or {})
+        return [record.data() async for record in result]
+
+
+async def aget_node_count(
+    driver: AsyncGraphDatabase.driver,
+    label: str = None,
+    database: str = None
+) -> int:
+    """
+    Get count of nodes, optionally filtered by label, without blocking the event loop.
+
+    Args:
+        driver: Async Neo4j driver instance
+        label: Node label to filter by (optional)
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
+
+    Returns:
+        Number of nodes
+    """
+    if label:
+        query = f"MATCH (n:{label}) RETURN count(n) AS count"
+    else:
+        query = "MATCH (n) RETURN count(n) AS count"
+
+    async with driver.session(database=_resolve_database(database)) as session:
+        result = await session.run(query)
+        record = await result.single()
+        return record['count']
+
+
+async def abatch_execute(
+    driver: AsyncGraphDatabase.driver,
+    query: str,
+    data: List[Dict],
+    batch_size: int = 1000,
+    database: str = None
+) -> int:
+    """
+    Execute a query in batches using UNWIND without blocking the event loop.
+
+    Batches are grouped into managed write transactions the same way as
+    batch_execute.
+
+    Args:
+        driver: Async Neo4j driver instance
+        query: Cypher query with $batch parameter
+        data: List of data dictionaries
+        batch_size: Size of each batch
+        database: Database name (defaults to $NEO4J_DATABASE, else DEFAULT_DATABASE)
+
+    Returns:
+        Total number of items processed
+    """
+    total = len(data)
+    processed = 0
+    group_size = batch_size * BATCHES_PER_TRANSACTION
+
+    async def run_batches(tx, batches: List[List[Dict]]):
+        for batch in batches:
+            result = await tx.run(query, {"batch": batch})
+            await result.consume()
+
+    async with driver.session(database=_resolve_database(database)) as session:
+        for i in range(0, total, group_size):
+            batches = [
+                data[j:j + batch_size]
+                for j in range(i, min(i + group_size, total), batch_size)
+            ]
+            await session.execute_write(run_batches, batches)
+            processed += sum(len(batch) for batch in batches)
+
+            if processed % group_size == 0:
                 print(f"  Processed {processed:,} / {total:,} items")
 
-    return processed
\ No newline at end of file
+    return processed
@@ -3,7 +3,7 @@
 -- Optimized for AI Agentic Vector Search with Dual-Layer Intelligence
 -- ============================================================================
 
--- Enable required extensions
+-- Enable required extensions (pgvector 0.7+ for halfvec)
 CREATE EXTENSION IF NOT EXISTS vector;
 CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
@@ -29,9 +29,9 @@ CREATE TABLE IF NOT EXISTS general_conditions (
     condition_exist BOOLEAN NOT NULL,
     original_text TEXT,
     parameters JSONB DEFAULT '{}',
-    -- Dual embeddings for different query types
-    normalized_embedding vector(2000),  -- For structured comparison
-    original_embedding vector(2000),    -- For explanation with policy text
+    -- Dual embeddings for different query types (half precision: 4 KB per vector)
+    normalized_embedding halfvec(2000),  -- For structured comparison
+    original_embedding halfvec(2000),    -- For explanation with policy text
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(product_name, condition_name)
@@ -49,8 +49,8 @@ CREATE TABLE IF NOT EXISTS benefits (
     parameters JSONB DEFAULT '{}',
     original_text TEXT,
     -- Dual embeddings
-    normalized_embedding vector(2000),
-    original_embedding vector(2000),
+    normalized_embedding halfvec(2000),
+    original_embedding halfvec(2000),
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(product_name, benefit_name)
@@ -68,8 +68,8 @@ CREATE TABLE IF NOT EXISTS benefit_conditions (
     original_text TEXT,
     parameters JSONB DEFAULT '{}',
     -- Dual embeddings
-    normalized_embedding vector(2000),
-    original_embedding vector(2000),
+    normalized_embedding halfvec(2000),
+    original_embedding halfvec(2000),
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(product_name, benefit_name, condition_name)
@@ -82,27 +82,27 @@ CREATE TABLE IF NOT EXISTS benefit_conditions (
 -- Vector Search Indexes (IVFFlat for cosine similarity)
 -- Lists parameter: sqrt(total_rows) is a good heuristic
 CREATE INDEX IF NOT EXISTS idx_general_conditions_normalized_vec
-    ON general_conditions USING ivfflat (normalized_embedding vector_cosine_ops)
+    ON general_conditions USING ivfflat (normalized_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_general_conditions_original_vec
-    ON general_conditions USING ivfflat (original_embedding vector_cosine_ops)
+    ON general_conditions USING ivfflat (original_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_benefits_normalized_vec
-    ON benefits USING ivfflat (normalized_embedding vector_cosine_ops)
+    ON benefits USING ivfflat (normalized_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_benefits_original_vec
-    ON benefits USING ivfflat (original_embedding vector_cosine_ops)
+    ON benefits USING ivfflat (original_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_benefit_conditions_normalized_vec
-    ON benefit_conditions USING ivfflat (normalized_embedding vector_cosine_ops)
+    ON benefit_conditions USING ivfflat (normalized_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_benefit_conditions_original_vec
-    ON benefit_conditions USING ivfflat (original_embedding vector_cosine_ops)
+    ON benefit_conditions USING ivfflat (original_embedding halfvec_cosine_ops)
     WITH (lists = 100);
 
 -- JSONB Indexes (GIN for structured queries)
@@ -234,7 +234,7 @@ GROUP BY b.id, b.product_name, b.benefit_name, b.benefit_exist,
 
 -- Function: Find similar conditions using normalized embeddings
 CREATE OR REPLACE FUNCTION find_similar_conditions(
-    query_embedding vector(2000),
+    query_embedding halfvec(2000),
     match_threshold float DEFAULT 0.7,
     match_count int DEFAULT 10
 )
@@ -265,7 +265,7 @@ $$ LANGUAGE plpgsql;
 
 -- Function: Find similar benefits using normalized embeddings
 CREATE OR REPLACE FUNCTION find_similar_benefits(
-    query_embedding vector(2000),
+    query_embedding halfvec(2000),
     match_threshold float DEFAULT 0.7,
     match_count int DEFAULT 10
 )
@@ -296,7 +296,7 @@ $$ LANGUAGE plpgsql;
 
 -- Function: Explain coverage using original text embeddings
 CREATE OR REPLACE FUNCTION explain_coverage(
-    query_embedding vector(2000),
+    query_embedding halfvec(2000),
     match_count int DEFAULT 5
 )
 RETURNS TABLE (
@@ -5,7 +5,7 @@ API keys, and processing parameters.
 """
 
 import os
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
@@ -23,6 +23,11 @@ class TaxonomyLoaderConfig(BaseSettings):
         description="Supabase service role key (for write access)"
     )
 
+    supabase_pg_dsn: Optional[str] = Field(
+        default=None,
+        description="Postgres connection string for bulk COPY loads (unset to load via PostgREST)"
+    )
+
     # OpenAI Configuration (for embeddings)
     openai_api_key: str = Field(
         ...,
@@ -36,6 +41,10 @@ class TaxonomyLoaderConfig(BaseSettings):
         default=2000,
         description="Embedding vector dimensions"
     )
+    embedding_dtype: Literal["float32", "float16"] = Field(
+        default="float32",
+        description="In-memory dtype for embedding vectors (stored precision follows the column type)"
+    )
 
     # Data Loading Configuration
     json_file_path: str = Field(
@@ -48,12 +57,22 @@ class TaxonomyLoaderConfig(BaseSettings):
         le=100,
         description="Number of records to process in each batch"
     )
+    upsert_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=5000,
+        description="Number of records sent to Supabase per upsert request"
+    )
 
     # Rate Limiting
     openai_rpm_limit: int = Field(
         default=3000,
         description="OpenAI API rate limit (requests per minute)"
     )
+    openai_tpm_limit: int = Field(
+        default=1_000_000,
+        description="OpenAI API rate limit (tokens per minute)"
+    )
     openai_retry_attempts: int = Field(
         default=3,
         ge=1,
@@ -65,6 +84,13 @@ class TaxonomyLoaderConfig(BaseSettings):
         description="Initial delay (seconds) between retries with exponential backoff"
     )
 
+    # Embedding Cache
+    # Resolved against the project root so every working directory shares one cache
+    embedding_cache_dir: Optional[str] = Field(
+        default_factory=lambda: get_absolute_path("database/supabase/taxonomy/output/embedding_cache"),
+        description="Directory for the on-disk embedding cache (unset to disable)"
+    )
+
     # Processing Options
     generate_embeddings: bool = Field(
         default=True,
@@ -151,6 +177,7 @@ class TaxonomyLoaderConfig(BaseSettings):
         """Get rate limiting configuration"""
         return {
             "rpm_limit": self.openai_rpm_limit,
+            "tpm_limit": self.openai_tpm_limit,
             "retry_attempts": self.openai_retry_attempts,
             "retry_delay": self.openai_retry_delay,
         }
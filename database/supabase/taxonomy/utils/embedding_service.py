@@ -5,13 +5,172 @@ using OpenAI's text-embedding-3-large model (3072 dimensions).
 """
 
 import asyncio
+import base64
+import hashlib
+import random
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple, TypeVar
+import openai
 from openai import AsyncOpenAI
+import diskcache
+import httpx
+import numpy as np
 import json
 
 from .config import TaxonomyLoaderConfig
-from .models import format_parameters_for_embedding, format_coverage_limit
+from .models import (
+    FORMAT_CACHE_SIZE,
+    format_parameters_for_embedding,
+    format_coverage_limit,
+    freeze_value,
+    thaw_value,
+)
+
+# Maximum inputs per embeddings request (the API accepts a list of inputs)
+EMBEDDING_REQUEST_SIZE = 256
+# Rough character budget per request, kept well under the per-request token cap
+EMBEDDING_REQUEST_CHARS = 400_000
+# Maximum bulk embedding requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# Connection pool for each service's OpenAI HTTP/2 client
+HTTP_MAX_CONNECTIONS = 100
+HTTP_KEEPALIVE_EXPIRY = 300.0
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+# Approximate characters per token, used to estimate request size for the TPM limit
+CHARS_PER_TOKEN = 4
+# API errors worth retrying: rate limits, connection problems/timeouts and 5xx responses
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+# Upper bound on the exponential backoff delay (seconds, before jitter)
+MAX_RETRY_DELAY = 30.0
+
+T = TypeVar("T")
+
+
+def create_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client backed by an HTTP/2 keep-alive connection pool.
+
+    The caller owns the client and closes it when done. Its connections are
+    bound to the event loop that first uses them, so the client must not be
+    reused from another loop (e.g. a second asyncio.run()).
+
+    Args:
+        api_key: OpenAI API key
+        base_url: Optional API base URL override
+
+    Returns:
+        New AsyncOpenAI client
+    """
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=HTTP_TIMEOUT
+    )
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+def embedding_to_list(embedding: Optional[np.ndarray]) -> Optional[List[float]]:
+    """Convert an embedding array to a JSON-serializable list for persistence"""
+    if embedding is None:
+        return None
+    return embedding.astype(np.float32).tolist()
+
+
+def embedding_to_float32(embedding: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Convert an embedding array to float32 for binary pgvector transfer (no copy if already float32)"""
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=np.float32)
+
+
+async def call_with_retries(
+    request: Callable[[], Awaitable[T]],
+    max_retries: int,
+    retry_delay: float,
+    verbose: bool = False
+) -> T:
+    """
+    Await request(), retrying transient API errors with backoff and jitter.
+
+    Only RETRYABLE_ERRORS are retried; any other error (bad request,
+    authentication, ...) propagates immediately, as does the last transient
+    error once max_retries is exhausted.
+
+    Args:
+        request: Coroutine factory making one API call
+        max_retries: Retry attempts after the first call
+        retry_delay: Base delay in seconds, doubled per attempt up to MAX_RETRY_DELAY
+        verbose: Print a line before each retry
+
+    Returns:
+        The result of the first successful call
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await request()
+        except RETRYABLE_ERRORS:
+            if attempt == max_retries:
+                raise
+
+            # Jitter keeps concurrent requests from retrying in lockstep
+            delay = min(MAX_RETRY_DELAY, retry_delay * 2 ** attempt) + random.uniform(0, 1)
+            if verbose:
+                print(f"⚠️  Embedding failed, retrying in {delay:.1f}s... ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter shared by concurrent coroutines.
+
+    Tokens refill continuously at rate_per_min / 60 per second up to burst,
+    so throughput stays at the configured rate without window-boundary stalls.
+    """
+
+    def __init__(self, rate_per_min: float, burst: Optional[float] = None):
+        self.rate = rate_per_min / 60.0
+        self.burst = float(burst if burst is not None else rate_per_min)
+        self.tokens = self.burst
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        Wait until amount tokens are available, then consume them.
+
+        Args:
+            amount: Tokens to consume (clamped to burst so large requests can proceed)
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.burst)
+        waited = 0.0
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+
+                delay = (amount - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
 
 
 class EmbeddingService:
@@ -23,76 +182,233 @@ class EmbeddingService:
     2. Original: Raw policy text for legal precision
     """
 
-    def __init__(self, config: TaxonomyLoaderConfig):
+    def __init__(self, config: TaxonomyLoaderConfig, client: Optional[AsyncOpenAI] = None):
+        """
+        Args:
+            config: Loader configuration
+            client: Optional OpenAI client to share with other services; the caller
+                keeps ownership. By default the service creates (and closes) its own.
+        """
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        self.owns_client = client is None
+        self.client = client or create_openai_client(config.openai_api_key)
         self.model = config.openai_embedding_model
         self.dimensions = config.embedding_dimensions
+        self.dtype = np.dtype(config.embedding_dtype)
 
-        # Rate limiting
+        # Rate limiting (shared by all concurrent requests)
         self.rpm_limit = config.openai_rpm_limit
-        self.requests_made = 0
-        self.window_start = time.time()
-
-    async def _wait_for_rate_limit(self):
-        """Implement rate limiting to avoid exceeding OpenAI API limits"""
-        self.requests_made += 1
-
-        # Check if we're exceeding the rate limit
-        elapsed = time.time() - self.window_start
-        if elapsed < 60:  # Within the same minute
-            if self.requests_made >= self.rpm_limit:
-                sleep_time = 60 - elapsed
-                if self.config.verbose:
-                    print(f"⏳ Rate limit reached. Waiting {sleep_time:.1f}s...")
-                await asyncio.sleep(sleep_time)
-                self.requests_made = 0
-                self.window_start = time.time()
-        else:
-            # New minute window
-            self.requests_made = 1
-            self.window_start = time.time()
-
-    async def _generate_embedding(
-        self,
-        text: str,
-        retry_count: int = 0
-    ) -> Optional[List[float]]:
+        self.request_bucket = AsyncTokenBucket(config.openai_rpm_limit)
+        self.token_bucket = AsyncTokenBucket(config.openai_tpm_limit)
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Content-addressed embedding caches: in-process (shared by all layers of a run,
+        # e.g. policy text repeated between a benefit and its conditions) and on disk
+        # (survives across runs)
+        self.memory_cache: Dict[bytes, np.ndarray] = {}
+        # Requests in flight by cache key, so concurrent callers share one request per text
+        self.pending: Dict[bytes, asyncio.Future] = {}
+        self.cache = diskcache.Cache(config.embedding_cache_dir) if config.embedding_cache_dir else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _cache_key(self, text: str) -> bytes:
+        """Cache key for a text under the current model and dimensions"""
+        return hashlib.blake2b(
+            f"{self.model}:{self.dimensions}:{text}".encode("utf-8"),
+            digest_size=16
+        ).digest()
+
+    def _get_cached(self, key: bytes) -> Optional[np.ndarray]:
+        """Cached embedding for a cache key, from memory first, then from disk"""
+        embedding = self.memory_cache.get(key)
+        if embedding is None and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                embedding = self.memory_cache[key] = np.frombuffer(cached, dtype=np.float32).astype(self.dtype)
+        return embedding
+
+    def _set_cached(self, key: bytes, embedding: np.ndarray):
+        """Remember a freshly generated embedding in memory and on disk"""
+        self.memory_cache[key] = embedding
+        if self.cache is not None:
+            self.cache.set(key, embedding.astype(np.float32).tobytes())
+
+    async def _wait_for_rate_limit(self, texts: List[str]):
+        """Wait for request and token budget before calling the OpenAI API"""
+        estimated_tokens = sum(len(text) for text in texts) / CHARS_PER_TOKEN + len(texts)
+        waited = await self.request_bucket.acquire()
+        waited += await self.token_bucket.acquire(estimated_tokens)
+
+        if waited >= 1.0 and self.config.verbose:
+            print(f"⏳ Rate limit reached. Waited {waited:.1f}s...")
+
+    async def _generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Generate embedding for a single text with retry logic.
 
         Args:
             text: Text to embed
-            retry_count: Current retry attempt
 
         Returns:
-            List of floats (embedding vector) or None on failure
+            Embedding vector or None if the text is blank or the request failed
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             return None
 
-        try:
-            await self._wait_for_rate_limit()
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
 
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text,
-                dimensions=self.dimensions
-            )
+    async def _generate_embeddings_bulk(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Generate embeddings for several texts in a single API request with retry logic.
+
+        Transient errors are retried (see call_with_retries). A request rejected
+        as invalid (e.g. one over-length input) is split in half and retried,
+        so only the offending texts end up without an embedding.
 
-            embedding = response.data[0].embedding
-            return embedding
+        Args:
+            texts: Non-empty texts to embed (at most EMBEDDING_REQUEST_SIZE)
 
+        Returns:
+            List of embedding vectors aligned with texts (None where embedding failed)
+        """
+        async def request():
+            async with self.request_semaphore:
+                await self._wait_for_rate_limit(texts)
+
+                # Request base64 so vectors decode straight into arrays, not float lists
+                return await self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    dimensions=self.dimensions,
+                    encoding_format="base64"
+                )
+
+        try:
+            response = await call_with_retries(
+                request,
+                self.config.openai_retry_attempts,
+                self.config.openai_retry_delay,
+                self.config.verbose
+            )
+        except openai.BadRequestError as e:
+            if len(texts) == 1:
+                print(f"❌ Failed to generate embedding: {e}")
+                return [None]
+            middle = len(texts) // 2
+            return (
+                await self._generate_embeddings_bulk(texts[:middle])
+                + await self._generate_embeddings_bulk(texts[middle:])
+            )
         except Exception as e:
-            if retry_count < self.config.openai_retry_attempts:
-                delay = self.config.openai_retry_delay * (2 ** retry_count)
-                if self.config.verbose:
-                    print(f"⚠️  Embedding failed, retrying in {delay}s... ({retry_count + 1}/{self.config.openai_retry_attempts})")
-                await asyncio.sleep(delay)
-                return await self._generate_embedding(text, retry_count + 1)
+            print(f"❌ Failed to generate {len(texts)} embeddings: {e}")
+            return [None] * len(texts)
+
+        # Results carry their input index; don't rely on response ordering
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        for item in response.data:
+            vector = np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+            embeddings[item.index] = vector.astype(self.dtype)
+        return embeddings
+
+    async def generate_embeddings(self, texts: Iterable[Optional[str]]) -> List[Optional[np.ndarray]]:
+        """
+        Generate embeddings for many texts using bulk API requests.
+
+        Identical texts are embedded once and cached texts are not re-embedded;
+        a text another call is already requesting awaits that request instead
+        of issuing its own. Remaining texts are chunked by input count and size; each chunk is
+        requested as soon as it fills, so a lazily formatted iterable overlaps
+        formatting with network calls. Requests from all concurrent calls share
+        the service's MAX_CONCURRENT_REQUESTS slots.
+
+        Args:
+            texts: Texts to embed (blank or None entries yield None)
+
+        Returns:
+            List of embedding vectors aligned with texts
+        """
+        # Deduplicate identical strings, remembering each input's position
+        unique: Dict[str, int] = {}
+        positions: List[Optional[int]] = []
+        vectors: List[Optional[np.ndarray]] = []
+        # Positions served by another call's in-flight request, and the keys this call resolves
+        waiting: Dict[int, asyncio.Future] = {}
+        owned: Dict[str, bytes] = {}
+
+        chunks: List[List[str]] = []
+        tasks: List[asyncio.Task] = []
+        current: List[str] = []
+        current_chars = 0
+
+        for text in texts:
+            # isspace() stops at the first non-blank character; strip() would copy the string
+            if not text or text.isspace():
+                positions.append(None)
+                continue
+
+            position = unique.get(text)
+            if position is None:
+                position = unique[text] = len(vectors)
+
+                # Serve cached or already requested embeddings without a new request
+                key = self._cache_key(text)
+                cached = self._get_cached(key)
+                vectors.append(cached)
+                if cached is not None:
+                    self.cache_hits += 1
+                elif key in self.pending:
+                    waiting[position] = self.pending[key]
+                    self.cache_hits += 1
+                else:
+                    self.pending[key] = asyncio.get_running_loop().create_future()
+                    owned[text] = key
+                    self.cache_misses += 1
+
+                    # Start a request once the chunk is full (by input count or approximate size)
+                    if current and (len(current) >= EMBEDDING_REQUEST_SIZE or current_chars + len(text) > EMBEDDING_REQUEST_CHARS):
+                        chunks.append(current)
+                        tasks.append(asyncio.create_task(self._generate_embeddings_bulk(current)))
+                        current, current_chars = [], 0
+                        await asyncio.sleep(0)  # let the request start before formatting continues
+                    current.append(text)
+                    current_chars += len(text)
+
+            positions.append(position)
+
+        if current:
+            chunks.append(current)
+            if tasks:
+                tasks.append(asyncio.create_task(self._generate_embeddings_bulk(current)))
+
+        try:
+            if tasks:
+                chunk_results = await asyncio.gather(*tasks)
+            elif chunks:
+                # A single request (the common per-item case) is awaited directly, no task needed
+                chunk_results = [await self._generate_embeddings_bulk(chunks[0])]
             else:
-                print(f"❌ Failed to generate embedding after {self.config.openai_retry_attempts} attempts: {e}")
-                return None
+                chunk_results = []
+            for chunk, result in zip(chunks, chunk_results):
+                for text, embedding in zip(chunk, result):
+                    vectors[unique[text]] = embedding
+                    key = owned[text]
+                    if embedding is not None:
+                        self._set_cached(key, embedding)
+                    self.pending.pop(key).set_result(embedding)
+        finally:
+            # Release callers waiting on requests that failed or were cancelled
+            for key in owned.values():
+                future = self.pending.pop(key, None)
+                if future is not None:
+                    future.set_result(None)
+
+        for position, future in waiting.items():
+            vectors[position] = await future
+
+        # Scatter results back to the caller's positions
+        return [vectors[position] if position is not None else None for position in positions]
 
     async def generate_dual_embeddings_for_condition(
         self,
@@ -100,7 +416,7 @@ class EmbeddingService:
         condition_type: str,
         parameters: Dict[str, Any],
         original_text: Optional[str]
-    ) -> Tuple[Optional[List[float]], Optional[List[float]]]:
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
         Generate dual embeddings for a general condition.
 
@@ -118,14 +434,8 @@ class EmbeddingService:
             condition_name, condition_type, parameters
         )
 
-        # Original embedding: policy text
-        original_text_clean = original_text if original_text and original_text.strip() else None
-
-        # Generate both embeddings concurrently
-        normalized_emb, original_emb = await asyncio.gather(
-            self._generate_embedding(normalized_text),
-            self._generate_embedding(original_text_clean) if original_text_clean else asyncio.sleep(0, result=None)
-        )
+        # Original embedding: policy text (both texts go in one deduplicated request)
+        normalized_emb, original_emb = await self.generate_embeddings([normalized_text, original_text])
 
         return normalized_emb, original_emb
 
@@ -136,7 +446,7 @@ class EmbeddingService:
         sub_limits: Dict[str, Any],
         parameters: Dict[str, Any],
         original_text: Optional[str]
-    ) -> Tuple[Optional[List[float]], Optional[List[float]]]:
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
         Generate dual embeddings for a benefit.
 
@@ -155,14 +465,8 @@ class EmbeddingService:
             benefit_name, coverage_limit, sub_limits, parameters
         )
 
-        # Original embedding: policy text
-        original_text_clean = original_text if original_text and original_text.strip() else None
-
-        # Generate both embeddings concurrently
-        normalized_emb, original_emb = await asyncio.gather(
-            self._generate_embedding(normalized_text),
-            self._generate_embedding(original_text_clean) if original_text_clean else asyncio.sleep(0, result=None)
-        )
+        # Original embedding: policy text (both texts go in one deduplicated request)
+        normalized_emb, original_emb = await self.generate_embeddings([normalized_text, original_text])
 
         return normalized_emb, original_emb
 
@@ -173,7 +477,7 @@ class EmbeddingService:
         condition_type: Optional[str],
         parameters: Dict[str, Any],
         original_text: Optional[str]
-    ) -> Tuple[Optional[List[float]], Optional[List[float]]]:
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
         Generate dual embeddings for a benefit-specific condition.
 
@@ -192,14 +496,8 @@ class EmbeddingService:
             benefit_name, condition_name, condition_type, parameters
         )
 
-        # Original embedding: policy text
-        original_text_clean = original_text if original_text and original_text.strip() else None
-
-        # Generate both embeddings concurrently
-        normalized_emb, original_emb = await asyncio.gather(
-            self._generate_embedding(normalized_text),
-            self._generate_embedding(original_text_clean) if original_text_clean else asyncio.sleep(0, result=None)
-        )
+        # Original embedding: policy text (both texts go in one deduplicated request)
+        normalized_emb, original_emb = await self.generate_embeddings([normalized_text, original_text])
 
         return normalized_emb, original_emb
 
@@ -207,6 +505,47 @@ class EmbeddingService:
     # TEXT FORMATTING FOR EMBEDDINGS
     # ========================================================================
 
+    def format_item_texts(
+        self,
+        item: Dict[str, Any],
+        item_type: str
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Build the normalized and original texts to embed for a batch item.
+
+        Args:
+            item: Item dict with the fields for its item_type
+            item_type: 'condition', 'benefit', or 'benefit_condition'
+
+        Returns:
+            Tuple of (normalized_text, original_text or None if blank)
+        """
+        if item_type == "condition":
+            normalized_text = self._format_condition_for_embedding(
+                item["condition_name"], item["condition_type"], item["parameters"]
+            )
+        elif item_type == "benefit":
+            normalized_text = self._format_benefit_for_embedding(
+                item["benefit_name"],
+                item.get("coverage_limit"),
+                item.get("sub_limits", {}),
+                item.get("parameters", {})
+            )
+        elif item_type == "benefit_condition":
+            normalized_text = self._format_benefit_condition_for_embedding(
+                item["benefit_name"],
+                item["condition_name"],
+                item.get("condition_type"),
+                item["parameters"]
+            )
+        else:
+            raise ValueError(f"Unknown item_type: {item_type}")
+
+        original_text = item.get("original_text")
+        original_text_clean = original_text if original_text and not original_text.isspace() else None
+
+        return normalized_text, original_text_clean
+
     def _format_condition_for_embedding(
         self,
         condition_name: str,
@@ -278,27 +617,51 @@ class EmbeddingService:
         return "\n".join(parts)
 
     def _format_sub_limits(self, sub_limits: Dict[str, Any], depth: int = 0) -> str:
-        """Recursively format nested sub-limits"""
+        """Recursively format nested sub-limits (memoized, as sub-limits repeat across benefits)"""
         if not sub_limits:
             return ""
 
-        parts = []
-        indent = "  " * depth
+        try:
+            return _format_sub_limits_frozen(freeze_value(sub_limits), depth)
+        except TypeError:
+            # Unhashable leaf values can't be cached
+            return _format_sub_limits(sub_limits, depth)
 
-        for key, value in sub_limits.items():
-            if isinstance(value, dict):
-                nested = self._format_sub_limits(value, depth + 1)
-                parts.append(f"{indent}{key}: {{{nested}}}")
-            elif isinstance(value, (int, float)):
-                parts.append(f"{indent}{key}: ${value:,.0f}")
-            else:
-                parts.append(f"{indent}{key}: {value}")
+    async def close(self):
+        """Close the embedding cache, and the OpenAI client if this service created it"""
+        if self.cache is not None:
+            self.cache.close()
+        if self.owns_client:
+            await self.client.close()
 
-        return "; ".join(parts)
 
-    async def close(self):
-        """Close the OpenAI client"""
-        await self.client.close()
+# Bound str.format methods for sub-limit entries (indent, key, value)
+_format_amount = "{}{}: ${:,.0f}".format
+_format_nested = "{}{}: {{{}}}".format
+_format_other = "{}{}: {}".format
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_sub_limits_frozen(frozen_sub_limits: Tuple[Any, Any], depth: int) -> str:
+    return _format_sub_limits(thaw_value(frozen_sub_limits), depth)
+
+
+def _format_sub_limits(sub_limits: Dict[str, Any], depth: int) -> str:
+    if not sub_limits:
+        return ""
+
+    parts = []
+    indent = "  " * depth
+
+    for key, value in sub_limits.items():
+        if isinstance(value, dict):
+            parts.append(_format_nested(indent, key, _format_sub_limits(value, depth + 1)))
+        elif isinstance(value, (int, float)):
+            parts.append(_format_amount(indent, key, value))
+        else:
+            parts.append(_format_other(indent, key, value))
+
+    return "; ".join(parts)
 
 
 # ============================================================================
@@ -310,10 +673,14 @@ async def generate_embeddings_batch(
     items: List[Dict[str, Any]],
     item_type: str,  # 'condition', 'benefit', or 'benefit_condition'
     verbose: bool = True
-) -> List[Tuple[Optional[List[float]], Optional[List[float]]]]:
+) -> List[Tuple[Optional[np.ndarray], Optional[np.ndarray]]]:
     """
     Generate dual embeddings for a batch of items.
 
+    All normalized and original texts are embedded together through bulk
+    requests, so identical texts across items are only embedded once. Items
+    are formatted lazily, overlapping formatting with in-flight requests.
+
     Args:
         service: EmbeddingService instance
         items: List of items (dicts with relevant fields)
@@ -323,41 +690,16 @@ async def generate_embeddings_batch(
     Returns:
         List of (normalized_embedding, original_embedding) tuples
     """
-    tasks = []
-
-    for item in items:
-        if item_type == "condition":
-            task = service.generate_dual_embeddings_for_condition(
-                condition_name=item["condition_name"],
-                condition_type=item["condition_type"],
-                parameters=item["parameters"],
-                original_text=item.get("original_text")
-            )
-        elif item_type == "benefit":
-            task = service.generate_dual_embeddings_for_benefit(
-                benefit_name=item["benefit_name"],
-                coverage_limit=item.get("coverage_limit"),
-                sub_limits=item.get("sub_limits", {}),
-                parameters=item.get("parameters", {}),
-                original_text=item.get("original_text")
-            )
-        elif item_type == "benefit_condition":
-            task = service.generate_dual_embeddings_for_benefit_condition(
-                benefit_name=item["benefit_name"],
-                condition_name=item["condition_name"],
-                condition_type=item.get("condition_type"),
-                parameters=item["parameters"],
-                original_text=item.get("original_text")
-            )
-        else:
-            raise ValueError(f"Unknown item_type: {item_type}")
-
-        tasks.append(task)
-
     if verbose:
-        print(f"⚡ Generating embeddings for {len(tasks)} {item_type}s...")
+        print(f"⚡ Generating embeddings for {len(items)} {item_type}s...")
+
+    # Format lazily so requests start while later items are still being formatted
+    def formatted_texts() -> Iterator[Optional[str]]:
+        for item in items:
+            yield from service.format_item_texts(item, item_type)
 
-    results = await asyncio.gather(*tasks)
+    embeddings = await service.generate_embeddings(formatted_texts())
+    results = list(zip(embeddings[0::2], embeddings[1::2]))
 
     if verbose:
         success_count = sum(1 for norm, orig in results if norm is not None)
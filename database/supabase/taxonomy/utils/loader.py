@@ -5,20 +5,79 @@ Reads final_value.json, generates dual embeddings, and loads into PostgreSQL.
 
 import asyncio
 import json
-from typing import List, Dict, Any, Optional
+import logging
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
-from supabase import create_client, Client
+import asyncpg
+import httpx
+import numpy as np
+from supabase import create_client, Client, ClientOptions
 from datetime import datetime
 
 from .config import TaxonomyLoaderConfig, load_config
 from .models import (
-    TravelInsuranceTaxonomy,
+    LAYER_MODELS,
+    TaxonomyMetadata,
     ProductDB,
     GeneralConditionDB,
     BenefitDB,
     BenefitConditionDB,
 )
-from .embedding_service import EmbeddingService
+from .embedding_service import (
+    EmbeddingService,
+    embedding_to_float32,
+    embedding_to_list,
+    generate_embeddings_batch,
+)
+
+# ijson streams layer items out of the taxonomy JSON without loading it whole
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# orjson parses the whole taxonomy JSON faster when ijson streaming is unavailable
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pgvector's asyncpg codec sends vectors in binary (4 bytes per dimension) over COPY
+try:
+    from pgvector.asyncpg import register_vector
+    HAS_PGVECTOR = True
+except ImportError:
+    HAS_PGVECTOR = False
+
+logger = logging.getLogger(__name__)
+
+# Verbose progress is logged once per this many records rather than every few
+PROGRESS_LOG_INTERVAL = 500
+
+# Shared HTTP/2 keep-alive client for PostgREST; its connection limit bounds the
+# number of batch upserts in flight at once
+POSTGREST_MAX_CONNECTIONS = 32
+POSTGREST_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# pgvector column types whose values are sent through the binary codec
+VECTOR_COLUMN_TYPES = ("vector", "halfvec")
+
+# Connection pool bounds for the direct Postgres path; each concurrent chunk upsert
+# holds its own connection, so max size caps the per-layer parallelism
+PG_POOL_MIN_SIZE = 4
+PG_POOL_MAX_SIZE = 16
+PG_COMMAND_TIMEOUT = 60
+
+# JSONB "type" label per coverage_limit value type; exact type lookup keeps bool
+# (an int subclass) from being labelled numeric
+COVERAGE_LIMIT_TYPES = {
+    int: "numeric",
+    float: "numeric",
+    bool: "boolean",
+    dict: "plan_tiered",
+}
 
 
 class TaxonomyLoader:
@@ -26,12 +85,27 @@ class TaxonomyLoader:
 
     def __init__(self, config: TaxonomyLoaderConfig):
         self.config = config
+        self.http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=POSTGREST_MAX_CONNECTIONS,
+                max_keepalive_connections=POSTGREST_MAX_CONNECTIONS
+            ),
+            timeout=POSTGREST_TIMEOUT,
+            follow_redirects=True
+        )
         self.supabase: Client = create_client(
             config.supabase_url,
-            config.supabase_service_key
+            config.supabase_service_key,
+            options=ClientOptions(httpx_client=self.http_client)
         )
         self.embedding_service = EmbeddingService(config)
         self.product_id_map: Dict[str, int] = {}
+        self.pg_pool: Optional[asyncpg.Pool] = None
+        self.pool_lock = asyncio.Lock()
+        self.column_types: Dict[str, Dict[str, str]] = {}
+        self.document: Optional[Dict[str, Any]] = None
+        self.missing_products: set = set()
 
     async def load_taxonomy(self) -> Dict[str, int]:
         """
@@ -44,14 +118,14 @@ class TaxonomyLoader:
         print("🚀 TRAVEL INSURANCE TAXONOMY LOADER")
         print("=" * 80)
 
-        # Load and validate JSON
+        # Read the taxonomy header; layer items are streamed and validated per step
         print("\n📖 Step 1: Loading JSON data...")
-        taxonomy = self._load_json()
-        print(f"✓ Loaded taxonomy: {taxonomy.taxonomy_name}")
-        print(f"  - Products: {len(taxonomy.products)}")
-        print(f"  - Layer 1 (General Conditions): {len(taxonomy.layers['layer_1_general_conditions'])}")
-        print(f"  - Layer 2 (Benefits): {len(taxonomy.layers['layer_2_benefits'])}")
-        print(f"  - Layer 3 (Benefit Conditions): {len(taxonomy.layers['layer_3_benefit_specific_conditions'])}")
+        taxonomy_name, products, metadata = self._load_header()
+        print(f"✓ Loaded taxonomy: {taxonomy_name}")
+        print(f"  - Products: {len(products)}")
+        if metadata is not None and metadata.layers:
+            for layer_key, count in metadata.layers.items():
+                print(f"  - {layer_key}: {count}")
 
         stats = {
             "products": 0,
@@ -64,32 +138,26 @@ class TaxonomyLoader:
         try:
             # Step 2: Load products
             print("\n📦 Step 2: Loading products...")
-            await self._load_products(taxonomy.products)
+            await self._load_products(products)
             stats["products"] = len(self.product_id_map)
             print(f"✓ Loaded {stats['products']} products")
 
-            # Step 3: Load Layer 1 (General Conditions)
+            # Steps 3-5: Load the three layers concurrently; they only depend on
+            # product_id_map, and overlapping them keeps the embedding API and
+            # the connection pool busy
             print("\n🔒 Step 3: Loading Layer 1 (General Conditions)...")
-            layer1_count = await self._load_general_conditions(
-                taxonomy.layers["layer_1_general_conditions"]
+            print("💰 Step 4: Loading Layer 2 (Benefits)...")
+            print("📋 Step 5: Loading Layer 3 (Benefit Conditions)...")
+            layer1_count, layer2_count, layer3_count = await asyncio.gather(
+                self._load_general_conditions(self._iter_layer("layer_1_general_conditions")),
+                self._load_benefits(self._iter_layer("layer_2_benefits")),
+                self._load_benefit_conditions(self._iter_layer("layer_3_benefit_specific_conditions"))
             )
             stats["general_conditions"] = layer1_count
-            print(f"✓ Loaded {layer1_count} general condition records")
-
-            # Step 4: Load Layer 2 (Benefits)
-            print("\n💰 Step 4: Loading Layer 2 (Benefits)...")
-            layer2_count = await self._load_benefits(
-                taxonomy.layers["layer_2_benefits"]
-            )
             stats["benefits"] = layer2_count
-            print(f"✓ Loaded {layer2_count} benefit records")
-
-            # Step 5: Load Layer 3 (Benefit-Specific Conditions)
-            print("\n📋 Step 5: Loading Layer 3 (Benefit Conditions)...")
-            layer3_count = await self._load_benefit_conditions(
-                taxonomy.layers["layer_3_benefit_specific_conditions"]
-            )
             stats["benefit_conditions"] = layer3_count
+            print(f"✓ Loaded {layer1_count} general condition records")
+            print(f"✓ Loaded {layer2_count} benefit records")
             print(f"✓ Loaded {layer3_count} benefit condition records")
 
             # Calculate embedding stats
@@ -115,61 +183,119 @@ class TaxonomyLoader:
 
         finally:
             await self.embedding_service.close()
+            self.http_client.close()
+            if self.pg_pool is not None:
+                await self.pg_pool.close()
+                self.pg_pool = None
+
+    async def _ensure_pool(self) -> Optional[asyncpg.Pool]:
+        """
+        Lazily open the asyncpg pool used to bulk-load layer records.
 
-    def _load_json(self) -> TravelInsuranceTaxonomy:
-        """Load and validate JSON file"""
+        Returns:
+            The pool, or None when no Postgres DSN is configured
+        """
+        # Layers load concurrently; the lock keeps them from opening a pool each
+        async with self.pool_lock:
+            if self.pg_pool is None and self.config.supabase_pg_dsn:
+                self.pg_pool = await asyncpg.create_pool(
+                    dsn=self.config.supabase_pg_dsn,
+                    min_size=PG_POOL_MIN_SIZE,
+                    max_size=PG_POOL_MAX_SIZE,
+                    command_timeout=PG_COMMAND_TIMEOUT,
+                    init=register_vector if HAS_PGVECTOR else None
+                )
+                print("✓ Using direct Postgres COPY for layer records")
+        return self.pg_pool
+
+    def _binary_vectors(self) -> bool:
+        """Whether embeddings are COPY-ed as binary pgvector values (kept as float32 arrays)"""
+        return HAS_PGVECTOR and bool(self.config.supabase_pg_dsn)
+
+    def _json_path(self) -> Path:
+        """Path of the taxonomy JSON file (must exist)"""
         json_path = Path(self.config.json_file_path)
 
         if not json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Validate with Pydantic
-        taxonomy = TravelInsuranceTaxonomy(**data)
-        return taxonomy
+        return json_path
+
+    def _load_document(self) -> Dict[str, Any]:
+        """Parse the whole taxonomy JSON once (used when ijson is unavailable)"""
+        if self.document is None:
+            with open(self._json_path(), "rb") as f:
+                raw = f.read()
+            self.document = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        return self.document
+
+    def _load_header(self) -> Tuple[str, List[str], Optional[TaxonomyMetadata]]:
+        """Read taxonomy_name, products and metadata without materializing the layers"""
+        json_path = self._json_path()
+
+        if not HAS_IJSON:
+            data = self._load_document()
+            header = (data.get("taxonomy_name"), data.get("products"), data.get("metadata"))
+        else:
+            header = []
+            for prefix in ("taxonomy_name", "products", "metadata"):
+                with open(json_path, "rb") as f:
+                    header.append(next(ijson.items(f, prefix, use_float=True), None))
+
+        taxonomy_name, products, metadata = header
+        if not isinstance(taxonomy_name, str) or not isinstance(products, list):
+            raise ValueError(f"Invalid taxonomy JSON (missing taxonomy_name or products): {json_path}")
+
+        return taxonomy_name, products, TaxonomyMetadata.model_validate(metadata) if metadata else None
+
+    def _iter_layer(self, layer_key: str) -> Iterator[Any]:
+        """Stream the items of one layer, validating each with its layer model"""
+        model = LAYER_MODELS[layer_key]
+        json_path = self._json_path()
+
+        if not HAS_IJSON:
+            for item in self._load_document()["layers"][layer_key]:
+                yield model.model_validate(item)
+            return
+
+        with open(json_path, "rb") as f:
+            for item in ijson.items(f, f"layers.{layer_key}.item", use_float=True):
+                yield model.model_validate(item)
 
     async def _load_products(self, products: List[str]):
         """Load products and build ID mapping"""
-        for product_name in products:
-            # Try to insert, or get existing
-            result = self.supabase.table("products").upsert(
-                {"product_name": product_name},
-                on_conflict="product_name"
-            ).execute()
+        if not products:
+            return
 
-            if result.data:
-                product_id = result.data[0]["id"]
-                self.product_id_map[product_name] = product_id
+        # Insert new products and return existing ones in a single request
+        result = self.supabase.table("products").upsert(
+            [{"product_name": product_name} for product_name in dict.fromkeys(products)],
+            on_conflict="product_name"
+        ).execute()
+
+        for row in result.data or []:
+            self.product_id_map[row["product_name"]] = row["id"]
 
     async def _load_general_conditions(self, conditions: List[Any]) -> int:
         """Load Layer 1: General Conditions with dual embeddings"""
         total_records = 0
+        records: List[Dict[str, Any]] = []
+        embedding_jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
 
         for condition in conditions:
             condition_name = condition.condition
             condition_type = condition.condition_type
 
             # Process each product variant
-            for product_name, product_data in condition.products.items():
-                if not product_data.condition_exist:
-                    continue  # Skip non-existent conditions
-
-                product_id = self.product_id_map.get(product_name)
-                if not product_id:
-                    print(f"⚠️  Product not found: {product_name}")
-                    continue
-
-                # Generate dual embeddings
-                normalized_emb, original_emb = None, None
-                if self.config.generate_embeddings:
-                    normalized_emb, original_emb = await self.embedding_service.generate_dual_embeddings_for_condition(
-                        condition_name=condition_name,
-                        condition_type=condition_type,
-                        parameters=product_data.parameters,
-                        original_text=product_data.original_text
-                    )
+            # Existing variants of known products (non-existent conditions are skipped)
+            for product_name, product_data, product_id in self._product_variants(condition.products, "condition_exist"):
+                # Texts to embed (all items of the layer are embedded together after the loop)
+                embedding_item = {
+                    "condition_name": condition_name,
+                    "condition_type": condition_type,
+                    "parameters": product_data.parameters,
+                    "original_text": product_data.original_text
+                }
 
                 # Prepare record
                 record = {
@@ -180,40 +306,36 @@ class TaxonomyLoader:
                     "condition_exist": product_data.condition_exist,
                     "original_text": product_data.original_text,
                     "parameters": product_data.parameters,
-                    "normalized_embedding": normalized_emb,
-                    "original_embedding": original_emb,
+                    "normalized_embedding": None,
+                    "original_embedding": None,
                 }
 
-                # Insert into database
-                self.supabase.table("general_conditions").upsert(
-                    record,
-                    on_conflict="product_name,condition_name"
-                ).execute()
-
+                records.append(record)
+                embedding_jobs.append((record, embedding_item))
                 total_records += 1
 
-                if self.config.verbose and total_records % 10 == 0:
-                    print(f"  ... {total_records} records processed")
+                if self.config.verbose and total_records % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info("  ... %d records processed", total_records)
+
+        await self._attach_embeddings(embedding_jobs, "condition")
+
+        # Insert into database in batches
+        await self._upsert_records("general_conditions", records, on_conflict="product_name,condition_name")
 
         return total_records
 
     async def _load_benefits(self, benefits: List[Any]) -> int:
         """Load Layer 2: Benefits with dual embeddings"""
         total_records = 0
+        records: List[Dict[str, Any]] = []
+        embedding_jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
 
         for benefit in benefits:
             benefit_name = benefit.benefit_name
 
             # Process each product variant
-            for product_name, product_data in benefit.products.items():
-                if not product_data.benefit_exist:
-                    continue  # Skip non-existent benefits
-
-                product_id = self.product_id_map.get(product_name)
-                if not product_id:
-                    print(f"⚠️  Product not found: {product_name}")
-                    continue
-
+            # Existing variants of known products (non-existent benefits are skipped)
+            for product_name, product_data, product_id in self._product_variants(benefit.products, "benefit_exist"):
                 # FIXED: Extract coverage_limit and sub_limits from nested parameters dict
                 # In the JSON, these fields are nested inside product_data.parameters,
                 # not at the top level of product_data
@@ -224,18 +346,16 @@ class TaxonomyLoader:
                 # Use getattr with None default to handle missing field
                 original_text = getattr(product_data, "original_text", None)
 
-                # Generate dual embeddings
+                # Texts to embed (all items of the layer are embedded together after the loop)
                 # IMPORTANT: Pass RAW coverage_limit to embedding service (not normalized)
                 # The embedding service's format_coverage_limit expects raw values
-                normalized_emb, original_emb = None, None
-                if self.config.generate_embeddings:
-                    normalized_emb, original_emb = await self.embedding_service.generate_dual_embeddings_for_benefit(
-                        benefit_name=benefit_name,
-                        coverage_limit=raw_coverage_limit,  # Pass raw value, not normalized
-                        sub_limits=sub_limits,
-                        parameters=product_data.parameters,
-                        original_text=original_text
-                    )
+                embedding_item = {
+                    "benefit_name": benefit_name,
+                    "coverage_limit": raw_coverage_limit,  # Pass raw value, not normalized
+                    "sub_limits": sub_limits,
+                    "parameters": product_data.parameters,
+                    "original_text": original_text
+                }
 
                 # Convert coverage_limit to JSONB-compatible format for database storage
                 coverage_limit_normalized = self._normalize_coverage_limit(raw_coverage_limit)
@@ -250,26 +370,29 @@ class TaxonomyLoader:
                     "sub_limits": sub_limits,
                     "parameters": product_data.parameters,
                     "original_text": original_text,
-                    "normalized_embedding": normalized_emb,
-                    "original_embedding": original_emb,
+                    "normalized_embedding": None,
+                    "original_embedding": None,
                 }
 
-                # Insert into database
-                self.supabase.table("benefits").upsert(
-                    record,
-                    on_conflict="product_name,benefit_name"
-                ).execute()
-
+                records.append(record)
+                embedding_jobs.append((record, embedding_item))
                 total_records += 1
 
-                if self.config.verbose and total_records % 10 == 0:
-                    print(f"  ... {total_records} records processed")
+                if self.config.verbose and total_records % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info("  ... %d records processed", total_records)
+
+        await self._attach_embeddings(embedding_jobs, "benefit")
+
+        # Insert into database in batches
+        await self._upsert_records("benefits", records, on_conflict="product_name,benefit_name")
 
         return total_records
 
     async def _load_benefit_conditions(self, benefit_conditions: List[Any]) -> int:
         """Load Layer 3: Benefit-Specific Conditions with dual embeddings"""
         total_records = 0
+        records: List[Dict[str, Any]] = []
+        embedding_jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
 
         for benefit_condition in benefit_conditions:
             benefit_name = benefit_condition.benefit_name
@@ -277,25 +400,16 @@ class TaxonomyLoader:
             condition_type = benefit_condition.condition_type
 
             # Process each product variant
-            for product_name, product_data in benefit_condition.products.items():
-                if not product_data.condition_exist:
-                    continue  # Skip non-existent conditions
-
-                product_id = self.product_id_map.get(product_name)
-                if not product_id:
-                    print(f"⚠️  Product not found: {product_name}")
-                    continue
-
-                # Generate dual embeddings
-                normalized_emb, original_emb = None, None
-                if self.config.generate_embeddings:
-                    normalized_emb, original_emb = await self.embedding_service.generate_dual_embeddings_for_benefit_condition(
-                        benefit_name=benefit_name,
-                        condition_name=condition_name,
-                        condition_type=condition_type,
-                        parameters=product_data.parameters,
-                        original_text=product_data.original_text
-                    )
+            # Existing variants of known products (non-existent conditions are skipped)
+            for product_name, product_data, product_id in self._product_variants(benefit_condition.products, "condition_exist"):
+                # Texts to embed (all items of the layer are embedded together after the loop)
+                embedding_item = {
+                    "benefit_name": benefit_name,
+                    "condition_name": condition_name,
+                    "condition_type": condition_type,
+                    "parameters": product_data.parameters,
+                    "original_text": product_data.original_text
+                }
 
                 # Prepare record
                 record = {
@@ -307,38 +421,197 @@ class TaxonomyLoader:
                     "condition_exist": product_data.condition_exist,
                     "original_text": product_data.original_text,
                     "parameters": product_data.parameters,
-                    "normalized_embedding": normalized_emb,
-                    "original_embedding": original_emb,
+                    "normalized_embedding": None,
+                    "original_embedding": None,
                 }
 
-                # Insert into database
-                self.supabase.table("benefit_conditions").upsert(
-                    record,
-                    on_conflict="product_name,benefit_name,condition_name"
-                ).execute()
-
+                records.append(record)
+                embedding_jobs.append((record, embedding_item))
                 total_records += 1
 
-                if self.config.verbose and total_records % 10 == 0:
-                    print(f"  ... {total_records} records processed")
+                if self.config.verbose and total_records % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info("  ... %d records processed", total_records)
+
+        await self._attach_embeddings(embedding_jobs, "benefit_condition")
+
+        # Insert into database in batches
+        await self._upsert_records("benefit_conditions", records, on_conflict="product_name,benefit_name,condition_name")
 
         return total_records
 
+    def _product_variants(self, products: Dict[str, Any], exist_attr: str) -> List[Tuple[str, Any, int]]:
+        """
+        Resolve an item's product variants to (product_name, product_data, product_id),
+        keeping only variants that exist for known products. Unknown products are
+        reported once per load.
+        """
+        product_id_map = self.product_id_map
+        variants = []
+
+        for product_name, product_data in products.items():
+            if not getattr(product_data, exist_attr):
+                continue
+
+            product_id = product_id_map.get(product_name)
+            if not product_id:
+                if product_name not in self.missing_products:
+                    self.missing_products.add(product_name)
+                    print(f"⚠️  Product not found: {product_name}")
+                continue
+
+            variants.append((product_name, product_data, product_id))
+
+        return variants
+
+    async def _attach_embeddings(
+        self,
+        embedding_jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        item_type: str
+    ):
+        """Embed a layer's queued items through bulk requests and store the vectors on their records"""
+        if not self.config.generate_embeddings or not embedding_jobs:
+            return
+
+        results = await generate_embeddings_batch(
+            self.embedding_service,
+            [item for _, item in embedding_jobs],
+            item_type,
+            verbose=self.config.verbose
+        )
+
+        # PostgREST needs JSON lists; the binary COPY path takes the arrays as they are
+        convert = embedding_to_float32 if self._binary_vectors() else embedding_to_list
+        for (record, _), (normalized_emb, original_emb) in zip(embedding_jobs, results):
+            record["normalized_embedding"] = convert(normalized_emb)
+            record["original_embedding"] = convert(original_emb)
+
+    async def _upsert_records(self, table: str, records: List[Dict[str, Any]], on_conflict: str):
+        """
+        Upsert records in batches of config.upsert_batch_size rows, run concurrently:
+        through COPY when a Postgres DSN is configured (each batch on its own pooled
+        connection), otherwise through one PostgREST request per batch.
+        """
+        # A single upsert cannot touch the same row twice; keep the last record per key
+        key_columns = on_conflict.split(",")
+        unique_records = list({
+            tuple(record[column] for column in key_columns): record
+            for record in records
+        }.values())
+
+        batch_size = self.config.upsert_batch_size
+        batches = [
+            unique_records[start:start + batch_size]
+            for start in range(0, len(unique_records), batch_size)
+        ]
+
+        pool = await self._ensure_pool()
+        if pool is not None:
+            await asyncio.gather(*(
+                self._copy_upsert_records(pool, table, batch, key_columns)
+                for batch in batches
+            ))
+            if self.config.verbose:
+                logger.info("  ... copied %d %s records", len(unique_records), table)
+            return
+
+        # One request builder serves every batch (each upsert builds its own request);
+        # the blocking requests run in worker threads so batches share the HTTP/2
+        # connection concurrently instead of stalling the event loop one by one
+        table_builder = self.supabase.table(table)
+        await asyncio.gather(*(
+            asyncio.to_thread(table_builder.upsert(batch, on_conflict=on_conflict).execute)
+            for batch in batches
+        ))
+        if self.config.verbose:
+            logger.info("  ... upserted %d %s records", len(unique_records), table)
+
+    async def _copy_upsert_records(
+        self,
+        pool: asyncpg.Pool,
+        table: str,
+        records: List[Dict[str, Any]],
+        key_columns: List[str]
+    ):
+        """
+        Upsert records in one transaction: COPY them into a staging table, then
+        INSERT ... ON CONFLICT DO UPDATE into the target with casts to the target
+        column types (jsonb, vector, ...). Staging columns are text, except vector
+        columns when the pgvector codec is registered, which are COPY-ed in binary.
+        """
+        if not records:
+            return
+
+        columns = list(records[0].keys())
+        staging = f"_staging_{table}"
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # Target column types are looked up once per table, not per batch
+                column_types = self.column_types.get(table)
+                if column_types is None:
+                    column_types = self.column_types[table] = dict(await conn.fetch(
+                        """
+                        SELECT attname, format_type(atttypid, atttypmod)
+                        FROM pg_attribute
+                        WHERE attrelid = $1::text::regclass AND attnum > 0 AND NOT attisdropped
+                        """,
+                        table
+                    ))
+
+                binary_vectors = self._binary_vectors()
+                staging_types = {
+                    column: column_types[column]
+                    if binary_vectors and column_types[column].startswith(VECTOR_COLUMN_TYPES)
+                    else "text"
+                    for column in columns
+                }
+                await conn.execute(
+                    f'CREATE TEMP TABLE "{staging}" ('
+                    + ", ".join(f'"{column}" {staging_types[column]}' for column in columns)
+                    + ") ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(
+                    staging,
+                    records=[
+                        tuple(self._to_copy_text(record[column]) for column in columns)
+                        for record in records
+                    ],
+                    columns=columns
+                )
+
+                column_list = ", ".join(f'"{column}"' for column in columns)
+                select_list = ", ".join(f'"{column}"::{column_types[column]}' for column in columns)
+                conflict_list = ", ".join(f'"{column}"' for column in key_columns)
+                update_list = ", ".join(
+                    f'"{column}" = EXCLUDED."{column}"'
+                    for column in columns if column not in key_columns
+                )
+                await conn.execute(
+                    f'INSERT INTO "{table}" ({column_list}) '
+                    f'SELECT {select_list} FROM "{staging}" '
+                    f"ON CONFLICT ({conflict_list}) DO UPDATE SET {update_list}"
+                )
+
+    @staticmethod
+    def _to_copy_text(value: Any) -> Any:
+        """Staging form of a record value: text (dicts and lists as JSON), or a binary vector array"""
+        if value is None or isinstance(value, np.ndarray):
+            return value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
+
     def _normalize_coverage_limit(self, coverage_limit: Any) -> Optional[Dict[str, Any]]:
         """Normalize coverage_limit to JSONB-compatible format"""
         if coverage_limit is None:
             return None
 
-        if isinstance(coverage_limit, (int, float)):
-            return {"value": coverage_limit, "type": "numeric"}
-
-        if isinstance(coverage_limit, dict):
-            return {"value": coverage_limit, "type": "plan_tiered"}
-
-        if isinstance(coverage_limit, bool):
-            return {"value": coverage_limit, "type": "boolean"}
-
-        return {"value": str(coverage_limit), "type": "other"}
+        limit_type = COVERAGE_LIMIT_TYPES.get(type(coverage_limit))
+        if limit_type is None:
+            return {"value": str(coverage_limit), "type": "other"}
+        return {"value": coverage_limit, "type": limit_type}
 
 
 # ============================================================================
@@ -347,6 +620,10 @@ class TaxonomyLoader:
 
 async def main():
     """Main entry point for CLI execution"""
+    # Show this module's verbose progress without INFO noise from HTTP client libraries
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+
     try:
         # Load configuration
         config = load_config()
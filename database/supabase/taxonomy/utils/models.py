@@ -3,8 +3,10 @@ Pydantic models for Travel Insurance Taxonomy data validation.
 Ensures type safety during JSON parsing and database loading.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
+from pydantic.dataclasses import dataclass
 from datetime import datetime
 
 
@@ -12,16 +14,18 @@ from datetime import datetime
 # PRODUCT-LEVEL MODELS
 # ============================================================================
 
-class ProductConditionData(BaseModel):
+# Leaf models are slotted pydantic dataclasses: one instance is built per
+# (item x product), so they skip the per-instance __dict__ of a BaseModel
+@dataclass(slots=True, config=ConfigDict(extra="ignore"))
+class ProductConditionData:
     """Represents product-specific condition data (Layer 1 & 3)"""
     condition_exist: bool
     original_text: Optional[str] = None
     parameters: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(extra="allow")
-
 
-class ProductBenefitData(BaseModel):
+@dataclass(slots=True, config=ConfigDict(extra="ignore"))
+class ProductBenefitData:
     """Represents product-specific benefit data (Layer 2)"""
     benefit_exist: Optional[bool] = None
     condition_exist: Optional[bool] = None  # Some data uses this instead of benefit_exist
@@ -41,8 +45,6 @@ class ProductBenefitData(BaseModel):
             self.benefit_exist = False
         return self
 
-    model_config = ConfigDict(extra="allow")
-
 
 # ============================================================================
 # LAYER 1: GENERAL CONDITIONS
@@ -105,6 +107,14 @@ class BenefitCondition(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+# Model for the items of each layer in the taxonomy JSON
+LAYER_MODELS: Dict[str, type] = {
+    "layer_1_general_conditions": GeneralCondition,
+    "layer_2_benefits": Benefit,
+    "layer_3_benefit_specific_conditions": BenefitCondition,
+}
+
+
 # ============================================================================
 # ROOT TAXONOMY MODEL
 # ============================================================================
@@ -119,21 +129,28 @@ class TaxonomyMetadata(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class TaxonomyLayers(BaseModel):
+    """The three taxonomy layers, each typed so items validate against a single model"""
+    layer_1_general_conditions: List[GeneralCondition] = Field(default_factory=list)
+    layer_2_benefits: List[Benefit] = Field(default_factory=list)
+    layer_3_benefit_specific_conditions: List[BenefitCondition] = Field(default_factory=list)
+
+    def __getitem__(self, layer_key: str) -> List[BaseModel]:
+        """Dict-style access by layer key (e.g. layers["layer_2_benefits"])"""
+        if layer_key not in LAYER_MODELS:
+            raise KeyError(layer_key)
+        return getattr(self, layer_key)
+
+    model_config = ConfigDict(extra="ignore")
+
+
 class TravelInsuranceTaxonomy(BaseModel):
-    """Root model for the entire taxonomy JSON"""
+    """Root model for the entire taxonomy JSON (build with model_validate)"""
     taxonomy_name: str
     products: List[str]
-    layers: Dict[str, List[Union[GeneralCondition, Benefit, BenefitCondition]]]
+    layers: TaxonomyLayers
     metadata: Optional[TaxonomyMetadata] = None
 
-    @field_validator("layers", mode="before")
-    @classmethod
-    def validate_layers(cls, v: Dict) -> Dict:
-        """Validate and parse nested layer data (runs before Pydantic parsing)"""
-        # In Pydantic v2 with mode="before", v is the raw dict data
-        # We just return it as-is and let Pydantic's type system handle the parsing
-        return v
-
     model_config = ConfigDict(extra="forbid")
 
 
@@ -203,10 +220,40 @@ class BenefitConditionDB(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Maximum distinct inputs remembered by each memoized formatter
+FORMAT_CACHE_SIZE = 4096
+
+
+def freeze_value(value: Any) -> Tuple[Any, Any]:
+    """
+    Convert a JSON-like value into a hashable, order-preserving key.
+
+    Each level is tagged with its type so that 1, 1.0 and True (equal as
+    dict keys) produce different keys and can be restored with thaw_value.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, freeze_value(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(freeze_value(item) for item in value))
+    return (type(value), value)
+
+
+def thaw_value(frozen: Tuple[Any, Any]) -> Any:
+    """Restore a value produced by freeze_value"""
+    kind, value = frozen
+    if kind is dict:
+        return {key: thaw_value(item) for key, item in value}
+    if kind is list:
+        return [thaw_value(item) for item in value]
+    return value
+
+
 def format_parameters_for_embedding(params: Dict[str, Any]) -> str:
     """
     Convert structured parameters to human-readable text for embedding.
 
+    Results are memoized, since identical parameter dicts recur across products.
+
     Example:
         {"exclude_hiv": true, "age_min": 18} ->
         "exclude_hiv: true; age_min: 18"
@@ -214,19 +261,27 @@ def format_parameters_for_embedding(params: Dict[str, Any]) -> str:
     if not params:
         return ""
 
-    formatted_parts = []
-    for key, value in params.items():
-        if isinstance(value, dict):
-            # Nested dict - format recursively
-            nested = format_parameters_for_embedding(value)
-            formatted_parts.append(f"{key}: {{{nested}}}")
-        elif isinstance(value, list):
-            # List - join with commas
-            formatted_parts.append(f"{key}: [{', '.join(map(str, value))}]")
-        elif value is not None:
-            formatted_parts.append(f"{key}: {value}")
-
-    return "; ".join(formatted_parts)
+    try:
+        return _format_parameters_frozen(freeze_value(params))
+    except TypeError:
+        # Unhashable leaf values can't be cached
+        return _format_parameters(params)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_parameters_frozen(frozen_params: Tuple[Any, Any]) -> str:
+    return _format_parameters(thaw_value(frozen_params))
+
+
+def _format_parameters(params: Dict[str, Any]) -> str:
+    # Nested dicts are formatted recursively in braces, lists joined with commas
+    return "; ".join([
+        f"{key}: {{{_format_parameters(value)}}}" if isinstance(value, dict)
+        else f"{key}: [{', '.join(map(str, value))}]" if isinstance(value, list)
+        else f"{key}: {value}"
+        for key, value in params.items()
+        if value is not None
+    ])
 
 
 def format_coverage_limit(coverage: Optional[Union[int, float, Dict[str, Any]]]) -> str:
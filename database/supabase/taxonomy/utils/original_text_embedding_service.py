@@ -4,11 +4,20 @@ Uses 2000 dimensions to match taxonomy embedding configuration.
 """
 
 import asyncio
-import time
 from typing import List, Optional
+import openai
 from openai import AsyncOpenAI
 
 from .config import TaxonomyLoaderConfig
+from .embedding_service import (
+    CHARS_PER_TOKEN,
+    EMBEDDING_REQUEST_CHARS,
+    EMBEDDING_REQUEST_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    AsyncTokenBucket,
+    call_with_retries,
+    create_openai_client,
+)
 
 
 class OriginalTextEmbeddingService:
@@ -17,25 +26,30 @@ class OriginalTextEmbeddingService:
     Uses text-embedding-3-large (2000 dimensions) to match taxonomy configuration.
     """
 
-    def __init__(self, config: TaxonomyLoaderConfig):
+    def __init__(self, config: TaxonomyLoaderConfig, client: Optional[AsyncOpenAI] = None):
         """
         Initialize embedding service.
 
         Args:
             config: TaxonomyLoaderConfig with OpenAI API key
+            client: Optional OpenAI client to share with other services; the caller
+                keeps ownership. By default the service creates (and closes) its own.
         """
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        self.owns_client = client is None
+        self.client = client or create_openai_client(config.openai_api_key)
 
         # Use model and dimensions from config (matching taxonomy)
         self.model = config.openai_embedding_model  # text-embedding-3-large
         self.dimensions = config.embedding_dimensions  # 2000
         self.max_tokens = 8191  # Maximum context length for text-embedding-3-* models
 
-        # Rate limiting
+        # Rate limiting (token buckets shared by all concurrent requests) and a cap
+        # on requests in flight
         self.rpm_limit = config.openai_rpm_limit
-        self.requests_made = 0
-        self.window_start = time.time()
+        self.request_bucket = AsyncTokenBucket(config.openai_rpm_limit)
+        self.token_bucket = AsyncTokenBucket(config.openai_tpm_limit)
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def generate_embedding(self, text: str) -> Optional[List[float]]:
         """
@@ -50,33 +64,82 @@ class OriginalTextEmbeddingService:
         if not text or not text.strip():
             return None
 
-        try:
-            await self._wait_for_rate_limit()
+        embeddings = await self._embed_many([text.strip()])
+        return embeddings[0]
 
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text.strip(),
-                dimensions=self.dimensions
-            )
+    async def _embed_many(
+        self,
+        texts: List[str],
+        max_retries: Optional[int] = None
+    ) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for several texts in a single API request.
+
+        Transient errors (rate limits, connection problems, timeouts, 5xx) are
+        retried in place with exponential backoff and jitter (see call_with_retries).
+        A request rejected as invalid (e.g. one chunk over the token limit) is
+        split in half and retried, so only the offending chunks end up without
+        an embedding.
+
+        Args:
+            texts: Non-empty texts to embed
+            max_retries: Retry attempts (defaults to config.openai_retry_attempts)
+
+        Returns:
+            Embedding vectors aligned with texts (None where embedding failed)
+        """
+        if max_retries is None:
+            max_retries = self.config.openai_retry_attempts
 
-            embedding = response.data[0].embedding
-            return embedding
+        async def request():
+            async with self.request_semaphore:
+                await self._wait_for_rate_limit(texts)
 
+                return await self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    dimensions=self.dimensions
+                )
+
+        try:
+            response = await call_with_retries(
+                request, max_retries, self.config.openai_retry_delay, self.config.verbose
+            )
+        except openai.BadRequestError as e:
+            if len(texts) == 1:
+                print(f"❌ Failed to generate embedding: {e}")
+                return [None]
+            middle = len(texts) // 2
+            return (
+                await self._embed_many(texts[:middle], max_retries)
+                + await self._embed_many(texts[middle:], max_retries)
+            )
         except Exception as e:
-            print(f"❌ Failed to generate embedding: {e}")
-            return None
+            print(f"❌ Failed to generate {len(texts)} embeddings: {e}")
+            return [None] * len(texts)
+
+        # Results carry their input index; don't rely on response ordering
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for item in response.data:
+            embeddings[item.index] = item.embedding
+        return embeddings
 
     async def generate_embeddings_batch(
         self,
         texts: List[str],
-        verbose: bool = True
+        verbose: bool = True,
+        max_retries: Optional[int] = None
     ) -> List[Optional[List[float]]]:
         """
-        Generate embeddings for multiple texts concurrently.
+        Generate embeddings for multiple texts through concurrent multi-input requests.
+
+        Texts are grouped into requests of at most EMBEDDING_REQUEST_SIZE inputs
+        and EMBEDDING_REQUEST_CHARS characters.
 
         Args:
             texts: List of texts to embed
             verbose: Enable progress logging
+            max_retries: Retry attempts per request (defaults to config.openai_retry_attempts)
 
         Returns:
             List of embedding vectors (same length as input)
@@ -84,8 +147,30 @@ class OriginalTextEmbeddingService:
         if verbose:
             print(f"⚡ Generating {len(texts)} embeddings with {self.model} ({self.dimensions}D)...")
 
-        tasks = [self.generate_embedding(text) for text in texts]
-        embeddings = await asyncio.gather(*tasks)
+        # Group non-blank texts into requests, remembering each one's position
+        requests: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if current and (len(current) >= EMBEDDING_REQUEST_SIZE or current_chars + len(text) > EMBEDDING_REQUEST_CHARS):
+                requests.append(current)
+                current, current_chars = [], 0
+            current.append(index)
+            current_chars += len(text)
+        if current:
+            requests.append(current)
+
+        results = await asyncio.gather(*(
+            self._embed_many([texts[index].strip() for index in indices], max_retries)
+            for indices in requests
+        ))
+
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for indices, batch_embeddings in zip(requests, results):
+            for index, embedding in zip(indices, batch_embeddings):
+                embeddings[index] = embedding
 
         if verbose:
             success_count = sum(1 for emb in embeddings if emb is not None)
@@ -93,30 +178,19 @@ class OriginalTextEmbeddingService:
 
         return embeddings
 
-    async def _wait_for_rate_limit(self):
-        """
-        Implement rate limiting to avoid exceeding OpenAI API limits.
-        Simple token bucket algorithm.
-        """
-        self.requests_made += 1
-
-        elapsed = time.time() - self.window_start
-        if elapsed < 60:  # Within the same minute
-            if self.requests_made >= self.rpm_limit:
-                sleep_time = 60 - elapsed
-                if self.config.verbose:
-                    print(f"⏳ Rate limit reached. Waiting {sleep_time:.1f}s...")
-                await asyncio.sleep(sleep_time)
-                self.requests_made = 0
-                self.window_start = time.time()
-        else:
-            # New minute window
-            self.requests_made = 1
-            self.window_start = time.time()
+    async def _wait_for_rate_limit(self, texts: List[str]):
+        """Wait for request and token budget before calling the OpenAI API"""
+        estimated_tokens = sum(len(text) for text in texts) / CHARS_PER_TOKEN + len(texts)
+        waited = await self.request_bucket.acquire()
+        waited += await self.token_bucket.acquire(estimated_tokens)
+
+        if waited >= 1.0 and self.config.verbose:
+            print(f"⏳ Rate limit reached. Waited {waited:.1f}s...")
 
     async def close(self):
-        """Close the OpenAI client"""
-        await self.client.close()
+        """Close the OpenAI client if this service created it"""
+        if self.owns_client:
+            await self.client.close()
 
 
 async def batch_generate_with_retry(
@@ -128,37 +202,16 @@ async def batch_generate_with_retry(
     """
     Generate embeddings with automatic retry logic.
 
+    Failed requests are retried inside the service with backoff, so the batch
+    completes in a single pass.
+
     Args:
         service: OriginalTextEmbeddingService instance
         texts: List of texts to embed
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of retry attempts per request
         verbose: Enable progress logging
 
     Returns:
         List of embeddings (None for failed items)
     """
-    embeddings = await service.generate_embeddings_batch(texts, verbose)
-
-    # Retry failed embeddings
-    for attempt in range(max_retries):
-        failed_indices = [i for i, emb in enumerate(embeddings) if emb is None]
-
-        if not failed_indices:
-            break  # All succeeded
-
-        if verbose and failed_indices:
-            print(f"⚠️  Retrying {len(failed_indices)} failed embeddings (attempt {attempt + 1}/{max_retries})...")
-
-        # Retry only failed items
-        failed_texts = [texts[i] for i in failed_indices]
-        retry_embeddings = await service.generate_embeddings_batch(failed_texts, verbose=False)
-
-        # Update results
-        for idx, emb in zip(failed_indices, retry_embeddings):
-            embeddings[idx] = emb
-
-        # Wait before next retry
-        if failed_indices and attempt < max_retries - 1:
-            await asyncio.sleep(2 ** attempt)  # Exponential backoff
-
-    return embeddings
+    return await service.generate_embeddings_batch(texts, verbose, max_retries=max_retries)
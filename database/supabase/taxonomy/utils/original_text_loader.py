@@ -6,7 +6,7 @@ Processes product_dict.pkl, chunks text, generates embeddings, and stores in ori
 import asyncio
 import pickle
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from supabase import create_client, Client
 
 from dotenv import load_dotenv
@@ -18,10 +18,20 @@ from .original_text_models import (
 )
 
 from .text_chunker import TextChunker
+from .embedding_service import MAX_CONCURRENT_REQUESTS
 from .original_text_embedding_service import OriginalTextEmbeddingService
 
 # Load environment variables from .env
 load_dotenv()
+
+# Chunks per pipeline batch (embedded in one request, inserted in one request)
+PIPELINE_BATCH_SIZE = 64
+# Batches buffered between pipeline stages; bounds memory for large documents
+PIPELINE_QUEUE_SIZE = 4
+# Embedding workers per document, each with one batch request in flight
+PIPELINE_EMBED_WORKERS = MAX_CONCURRENT_REQUESTS
+
+
 class OriginalTextLoader:
     """
     ETL pipeline for loading raw policy text with embeddings.
@@ -154,40 +164,90 @@ class OriginalTextLoader:
         """
         Process a single document: chunk, embed, and store.
 
+        The three stages run as a pipeline over batches of PIPELINE_BATCH_SIZE
+        chunks, connected by bounded queues: embedding starts while the document
+        is still being chunked and inserts start while later batches are being
+        embedded, so memory stays bounded by the queue sizes. PIPELINE_EMBED_WORKERS
+        batches are embedded concurrently.
+
         Args:
             document: ProductDocument to process
         """
         print(f"  📏 Document length: {document.total_length:,} characters")
 
-        # Step 1: Chunk the document
-        chunks = self.chunker.chunk_text(
-            document.full_text,
-            metadata={
-                "product_name": document.product_name,
-                "source": "product_dict.pkl"
-            }
-        )
-        print(f"  ✂️  Generated {len(chunks)} chunks")
-        self.stats.total_chunks += len(chunks)
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        counts = {"chunks": 0, "embeddings": 0}
+
+        async def chunk_stage():
+            batch = []
+            for chunk in self.chunker.iter_chunks(
+                document.full_text,
+                metadata={
+                    "product_name": document.product_name,
+                    "source": "product_dict.pkl"
+                }
+            ):
+                batch.append(chunk)
+                if len(batch) == PIPELINE_BATCH_SIZE:
+                    await chunk_queue.put(batch)
+                    await asyncio.sleep(0)  # let the batch be embedded before chunking continues
+                    batch = []
+            if batch:
+                await chunk_queue.put(batch)
+
+            # One sentinel per embed worker
+            for _ in range(PIPELINE_EMBED_WORKERS):
+                await chunk_queue.put(None)
+
+        async def embed_stage():
+            while (batch := await chunk_queue.get()) is not None:
+                counts["chunks"] += len(batch)
+                embeddings = await self.embedding_service.generate_embeddings_batch(
+                    [chunk["text"] for chunk in batch],
+                    verbose=self.config.verbose
+                )
+                counts["embeddings"] += sum(1 for emb in embeddings if emb is not None)
+                await embed_queue.put((batch, embeddings))
+            await embed_queue.put(None)
+
+        async def insert_stage() -> int:
+            inserted = 0
+            finished_workers = 0
+            # Batches arrive in completion order; rows carry their own chunk_index
+            while finished_workers < PIPELINE_EMBED_WORKERS:
+                item = await embed_queue.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+                batch, embeddings = item
+                inserted += await self._insert_chunks(document.product_name, batch, embeddings)
+            return inserted
+
+        stages = [
+            asyncio.create_task(chunk_stage()),
+            *(asyncio.create_task(embed_stage()) for _ in range(PIPELINE_EMBED_WORKERS)),
+            asyncio.create_task(insert_stage()),
+        ]
+        try:
+            *_, inserted_count = await asyncio.gather(*stages)
+        except BaseException:
+            # A failed stage would leave the others blocked on their queues
+            for stage in stages:
+                stage.cancel()
+            raise
+
+        self.stats.total_chunks += counts["chunks"]
         self.stats.total_characters += document.total_length
+        self.stats.embeddings_generated += counts["embeddings"]
+        self.stats.chunks_inserted += inserted_count
 
-        if not chunks:
+        if not counts["chunks"]:
             print(f"  ⚠️  No chunks generated for {document.product_name}")
             return
 
-        # Step 2: Generate embeddings
-        texts = [chunk["text"] for chunk in chunks]
-        embeddings = await self.embedding_service.generate_embeddings_batch(
-            texts,
-            verbose=self.config.verbose
-        )
-        successful_embeddings = sum(1 for emb in embeddings if emb is not None)
-        self.stats.embeddings_generated += successful_embeddings
-
-        # Step 3: Insert into database
-        print(f"  💾 Inserting into Supabase...")
-        inserted_count = await self._insert_chunks(document.product_name, chunks, embeddings)
-        self.stats.chunks_inserted += inserted_count
+        print(f"  ✂️  Generated {counts['chunks']} chunks")
+        print(f"  ⚡ Generated {counts['embeddings']}/{counts['chunks']} embeddings")
         print(f"  ✓ Inserted {inserted_count} chunks")
 
     async def _insert_chunks(
@@ -199,6 +259,11 @@ class OriginalTextLoader:
         """
         Insert chunks with embeddings into Supabase.
 
+        Rows are sent in batches of config.upsert_batch_size per request; a batch
+        that fails is retried row by row so each failing chunk is reported.
+        The blocking PostgREST calls run in a worker thread so embedding requests
+        keep progressing on the event loop meanwhile.
+
         Args:
             product_name: Product name
             chunks: List of chunk dictionaries
@@ -207,7 +272,7 @@ class OriginalTextLoader:
         Returns:
             Number of successfully inserted chunks
         """
-        inserted_count = 0
+        rows: List[Tuple[int, Dict[str, Any]]] = []
 
         for chunk, embedding in zip(chunks, embeddings):
             try:
@@ -219,50 +284,68 @@ class OriginalTextLoader:
                     original_embedding=embedding,
                     metadata=chunk.get("metadata", {})
                 )
+            except Exception as e:
+                self._report_insert_error(chunk["chunk_index"], e)
+                continue
+
+            # Convert to dict for Supabase
+            # Note: text_id and created_at are auto-generated by Postgres DEFAULT
+            rows.append((record.chunk_index, {
+                "product_name": record.product_name,
+                "text": record.text,
+                "chunk_index": record.chunk_index,
+                "char_count": record.char_count,
+                "original_embedding": record.original_embedding,
+                "metadata": record.metadata
+            }))
+
+        table = self.supabase.table("original_text")
+        batch_size = self.config.upsert_batch_size
+        inserted_count = 0
 
-                # Convert to dict for Supabase
-                # Note: text_id and created_at are auto-generated by Postgres DEFAULT
-                data = {
-                    "product_name": record.product_name,
-                    "text": record.text,
-                    "chunk_index": record.chunk_index,
-                    "char_count": record.char_count,
-                    "original_embedding": record.original_embedding,
-                    "metadata": record.metadata
-                }
-
-                # Insert into Supabase
-                result = self.supabase.table("original_text").insert(data).execute()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            try:
+                result = await asyncio.to_thread(table.insert([data for _, data in batch]).execute)
+            except Exception:
+                # Bulk insert failed; fall back to single rows for per-chunk diagnostics
+                for chunk_index, data in batch:
+                    try:
+                        result = await asyncio.to_thread(table.insert(data).execute)
+                        if result.data:
+                            inserted_count += 1
+                    except Exception as e:
+                        self._report_insert_error(chunk_index, e)
+            else:
+                inserted_count += len(result.data or [])
 
-                if result.data:
-                    inserted_count += 1
+        return inserted_count
 
-            except Exception as e:
-                error_msg = str(e)
-                print(f"  ❌ Failed to insert chunk {chunk['chunk_index']}: {error_msg}")
-
-                # Provide specific guidance for RLS errors (only show once)
-                if not self._rls_error_shown and ("row-level security policy" in error_msg.lower() or "42501" in error_msg):
-                    self._rls_error_shown = True
-                    print("\n" + "=" * 80)
-                    print("🔒 ROW-LEVEL SECURITY (RLS) ERROR DETECTED")
-                    print("=" * 80)
-                    print("This error means you don't have permission to INSERT into the table.")
-                    print("\nPossible causes:")
-                    print("  1. Wrong API key - Check your .env file:")
-                    print("     • SUPABASE_SERVICE_KEY should be the SERVICE ROLE key (not anon key)")
-                    print("     • Service keys start with 'eyJ' and are 200+ characters long")
-                    print("     • Find it in: Supabase Dashboard → Settings → API → service_role key")
-                    print("\n  2. RLS policies not created - Run this SQL in Supabase SQL Editor:")
-                    print("     • File: database/supabase/taxonomy/schema_original_text.sql")
-                    print("     • Especially lines 175-197 (RLS policies section)")
-                    print("\n  3. Table doesn't exist - Create it first:")
-                    print("     • Run the full schema_original_text.sql file")
-                    print("=" * 80 + "\n")
-
-                self.stats.errors += 1
+    def _report_insert_error(self, chunk_index: int, error: Exception):
+        """Print a failed chunk insert, with RLS guidance the first time it applies"""
+        error_msg = str(error)
+        print(f"  ❌ Failed to insert chunk {chunk_index}: {error_msg}")
 
-        return inserted_count
+        # Provide specific guidance for RLS errors (only show once)
+        if not self._rls_error_shown and ("row-level security policy" in error_msg.lower() or "42501" in error_msg):
+            self._rls_error_shown = True
+            print("\n" + "=" * 80)
+            print("🔒 ROW-LEVEL SECURITY (RLS) ERROR DETECTED")
+            print("=" * 80)
+            print("This error means you don't have permission to INSERT into the table.")
+            print("\nPossible causes:")
+            print("  1. Wrong API key - Check your .env file:")
+            print("     • SUPABASE_SERVICE_KEY should be the SERVICE ROLE key (not anon key)")
+            print("     • Service keys start with 'eyJ' and are 200+ characters long")
+            print("     • Find it in: Supabase Dashboard → Settings → API → service_role key")
+            print("\n  2. RLS policies not created - Run this SQL in Supabase SQL Editor:")
+            print("     • File: database/supabase/taxonomy/schema_original_text.sql")
+            print("     • Especially lines 175-197 (RLS policies section)")
+            print("\n  3. Table doesn't exist - Create it first:")
+            print("     • Run the full schema_original_text.sql file")
+            print("=" * 80 + "\n")
+
+        self.stats.errors += 1
 
 
 # ============================================================================
@@ -3,6 +3,7 @@ Pydantic models for original policy text storage.
 Defines schema for text chunks and embeddings in Supabase.
 """
 
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
@@ -90,12 +91,12 @@ class ProductDocument(BaseModel):
     product_name: str = Field(..., description="Product name (from dict key)")
     raw_content: List[str] = Field(..., description="List of text sections from dict value")
 
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Concatenate all sections into full text"""
+        """Concatenate all sections into full text (joined once, then cached)"""
         return "\n\n".join(self.raw_content)
 
-    @property
+    @cached_property
     def total_length(self) -> int:
         """Total character count"""
         return len(self.full_text)
@@ -3,7 +3,7 @@ Text chunking utilities for splitting policy documents into semantic chunks.
 Uses sentence-boundary aware chunking with configurable overlap.
 """
 
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any
 import re
 
 
@@ -42,13 +42,27 @@ class TextChunker:
         Returns:
             List of chunk dictionaries with text and metadata
         """
+        return list(self.iter_chunks(text, metadata))
+
+    def iter_chunks(self, text: str, metadata: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield semantic chunks one at a time, so callers can process early chunks
+        while later ones are still being split.
+
+        Args:
+            text: Text to chunk
+            metadata: Optional metadata to attach to each chunk
+
+        Yields:
+            Chunk dictionaries with text and metadata
+        """
         if not text or not text.strip():
-            return []
+            return
 
         # Split into sentences first
         sentences = self._split_into_sentences(text)
 
-        chunks = []
+        chunk_count = 0
         current_chunk = []
         current_length = 0
 
@@ -59,7 +73,8 @@ class TextChunker:
             if current_length + sentence_length > self.chunk_size and current_chunk:
                 chunk_text = " ".join(current_chunk)
                 if len(chunk_text) >= self.min_chunk_size:
-                    chunks.append(self._create_chunk(chunk_text, len(chunks), metadata))
+                    yield self._create_chunk(chunk_text, chunk_count, metadata)
+                    chunk_count += 1
 
                 # Start new chunk with overlap
                 overlap_text = self._get_overlap_text(current_chunk)
@@ -73,9 +88,7 @@ class TextChunker:
         if current_chunk:
             chunk_text = " ".join(current_chunk)
             if len(chunk_text) >= self.min_chunk_size:
-                chunks.append(self._create_chunk(chunk_text, len(chunks), metadata))
-
-        return chunks
+                yield self._create_chunk(chunk_text, chunk_count, metadata)
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """